@@ -5,11 +5,30 @@ It includes methods for validating input names, parsing network files,
 checking consistency, and parsing ASP models to extract inconsistencies.
 """
 
-from typing import List, Tuple
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 import clingo
+import clingo.ast
 from network.network import Network
+from network.network_cache import Network_Cache
 from network.inconsistency_solution import Inconsistency_Solution
 from updaters.updater import Updater
+from configuration import configuration
+
+# Matches a single predicate "name(arguments)" and its terminating dot
+PREDICATE_PATTERN = re.compile(r'([^()]*)\(([^()]*)\)\.?')
+
+# In-memory facts: ASP program text, or an iterable of clingo symbols,
+# (name, argument, ...) tuples and program text strings
+Facts = Union[str, Iterable[Union[str, tuple, clingo.Symbol]]]
+
+# Model predicates, read in the order of the statements they come from
+MODEL_SIGNATURES = (('vertex', 1), ('edge', 3), ('fixed', 2),
+                    ('functionOr', 2), ('functionAnd', 3))
+
+# Predicate holding the position of the statement of each model atom
+SOURCE_ORDER = '__source_order'
 
 
 class ASPHelper:
@@ -28,164 +47,478 @@ class ASPHelper:
             return False
         return True
 
+    @staticmethod
+    def tokenize_predicates(line: str) -> List[Tuple[str, str]]:
+        """
+        Splits a whitespace-free line into its predicates in a single pass,
+        returning the name and the raw argument string of each predicate.
+        """
+        return PREDICATE_PATTERN.findall(line)
+
     @staticmethod
     def parse_network(network: Network) -> int:
         """
         Parses a network file and populates the provided Network object with
         nodes, edges, and other properties.
         """
-        result = 1
+        if configuration['clingo_parse']:
+            return ASPHelper.parse_network_clingo(network)
+        cache_dir = configuration['network_cache_dir']
         try:
-            with open(network.get_input_file_network(), 'r', encoding="utf-8")\
-                 as file:
-                count_line = 0
-                for line in file:
-                    count_line += 1
-                    line = ''.join(line.split())  # Remove all whitespace
-                    if ').' in line:
-                        predicates = line.split(')')
-                        for i in range(len(predicates) - 1):
-                            predicates[i] += ').'
-                            if i > 0:
-                                predicates[i] = predicates[i][1:]
-                            split = predicates[i].split('(')
-
-                            if split[0] == 'vertex':
-                                node = split[1].split(')')[0]
-                                network.add_node(node)
-                                continue
-
-                            elif split[0] == 'edge':
-                                split = split[1].split(')')
-                                split = split[0].split(',')
-
-                                if len(split) != 3:
-                                    print(f'WARN!\tEdge not recognized in line {str(count_line)}: {predicates[i]}')
-                                    result = -1
-                                    continue
-
-                                if not ASPHelper.validate_input_name(split[0]) or not ASPHelper.validate_input_name(split[1]):
-                                    print(f'WARN!\tInvalid node argument in line {str(count_line)}: {predicates[i]}')
-                                    print('\t\tNodes names must start with a lower case letter, a digit, or be surrounded by quotation marks.')
-                                    return -2
-
-                                start_id, end_id = split[0], split[1]
-                                try:
-                                    sign = int(split[2])
-                                except ValueError:
-                                    print(f'WARN!\tInvalid edge sign: {split[2]} on line {str(count_line)} in edge {predicates[i]}')
-                                    return -2
-
-                                if sign not in [0, 1]:
-                                    print(f'WARN!\tInvalid edge sign on line {str(count_line)} in edge {predicates[i]}')
-                                    return -2
-
-                                start_node = network.add_node(start_id)
-                                end_node = network.add_node(end_id)
-                                network.add_edge(start_node, end_node, sign)
-                                continue
-
-                            elif split[0] == 'fixed':
-
-                                split = split[1].split(')')
-                                split = split[0].split(',')
-
-                                if len(split) != 2:
-                                    continue
-
-                                if not ASPHelper.validate_input_name(split[0]) or not ASPHelper.validate_input_name(split[1]):
-                                    print(f'WARN!\tInvalid node argument in line {count_line}: {predicates[i]}')
-                                    print('\t\tNodes names must start with a lower case letter, a digit, or be surrounded by quotation marks.')
-                                    return -2
-
-                                start_id, end_id = split[0], split[1]
-                                edge = network.get_edge(start_id, end_id)
-
-                                if edge is not None:
-                                    edge.set_fixed()
-                                else:
-                                    print(f'WARN!\tUnrecognized edge on line {count_line}: {predicates[i]} Ignoring...')
-                                continue
-
-                            elif split[0] == 'functionOr':
-                                split = split[1].split(')')
-                                split = split[0].split(',')
-
-                                if len(split) != 2:
-                                    print(f'WARN!\tfunctionOr not recognized on line {str(count_line)}: {predicates[i]}')
-                                    result = -1
-                                    continue
-
-                                if not ASPHelper.validate_input_name(split[0]):
-                                    print(f'WARN!\tInvalid node argument in line {str(count_line)}: {predicates[i]}')
-                                    print('\t\tNodes names must start with a lower case letter, a digit, or be surrounded by quotation marks.')
-                                    return -2
-
-                                network.add_node(split[0])
-
-                                if '..' in split[1]:
-                                    split = split[1].split('.')
-                                    try:
-                                        range_limit = int(split[-1])
-                                    except ValueError:
-                                        print(f'WARN!\tInvalid range limit: {split[-1]} on line {count_line} in {predicates[i]}. It must be an integer greater than 0.')
-                                        return -2
-                                    if range_limit < 1:
-                                        print(f'WARN!\tInvalid range limit: {range_limit} on line {count_line} in {predicates[i]}. It must be an integer greater than 0.')
-                                        return -2
-
-                                else:
-                                    try:
-                                        range_limit = int(split[1])
-                                        if range_limit < 1:
-                                            print(f'WARN!\tInvalid range limit: {range_limit} on line {count_line} in {predicates[i]}. It must be an integer greater than 0.')
-                                            return -2
-                                    except ValueError:
-                                        print(f'WARN!\tInvalid functionOr range definition on line {count_line}: {predicates[i]}')
-                                        return -2
-                                continue
-
-                            elif split[0] == 'functionAnd':
-                                split = split[1].split(')')
-                                split = split[0].split(',')
-
-                                if len(split) != 3:
-                                    print(f'WARN!\tfunctionAnd not recognized on line {count_line}: {predicates[i]}')
-                                    result = -1
-                                    continue
-
-                                if not ASPHelper.validate_input_name(split[0]) or not ASPHelper.validate_input_name(split[2]):
-                                    print(f'WARN!\tInvalid node argument on line {count_line}: {predicates[i]}')
-                                    print('\t\tNodes names must start with a lower case letter, a digit, or be surrounded by quotation marks.')
-                                    return -2
-
-                                node = network.get_node(split[0])
-                                if node is None:
-                                    print(f'WARN!\tNode not recognized or not yet defined: {split[0]} on line {count_line} in {predicates[i]}')
-                                    result = -1
-                                    continue
-
-                                node2 = network.get_node(split[2])
-                                if node2 is None:
-                                    print(f'WARN!\tNode not recognized or not yet defined: {split[2]} on line {count_line} in {predicates[i]}')
-                                    result = -1
-                                    continue
-
-                                try:
-                                    clause_id = int(split[1])
-                                    if clause_id < 1:
-                                        print(f'WARN!\tInvalid clause Id: {split[1]} on line {count_line} in {predicates[i]}')
-                                        result = -1
-                                        continue
-                                except ValueError:
-                                    print(f'WARN!\tInvalid clause Id: {split[1]} on line {count_line} in {predicates[i]}')
-                                    result = -1
-                                    continue
-                                node.get_function().add_regulator_to_term(clause_id, split[2])
-                                continue
+            if not cache_dir:
+                with open(network.get_input_file_network(), 'r',
+                          encoding="utf-8") as file:
+                    return ASPHelper.parse_network_lines(network, file)
+            with open(network.get_input_file_network(), 'rb') as file:
+                content = file.read()
         except IOError as exc:
             raise ValueError('ERROR!\tCannot open file ' +
                              network.get_input_file_network()) from exc
+
+        # Only models parsed without warnings are cached, so a cache hit
+        # never hides a diagnostic
+        key = Network_Cache.get_key(content)
+        if Network_Cache.load(network, cache_dir, key):
+            return 1
+        warnings = []
+        result = ASPHelper.parse_network_lines(
+            network, content.decode('utf-8').splitlines(), warnings)
+        if result == 1 and not warnings:
+            Network_Cache.save(network, cache_dir, key)
+        return result
+
+    @staticmethod
+    def parse_network_clingo(network: Network) -> int:
+        """
+        Parses a network file through clingo and populates the provided
+        Network object from the resulting facts. The facts are also stored in
+        the network so that the consistency check reuses them instead of
+        loading the model file again.
+        Returns 1 on success, -1 if some facts were ignored and -2 on invalid
+        input.
+        """
+        file_name = network.get_input_file_network()
+        if not os.path.isfile(file_name):
+            raise ValueError('ERROR!\tCannot open file ' + file_name)
+        ctl = clingo.Control(['--warn=none'], Updater.log_clingo_message, 20)
+        try:
+            positions = ASPHelper.add_program_in_order(ctl, [file_name], [])
+            ctl.ground([('base', [])])
+        except RuntimeError:
+            print(f'WARN!\tInvalid model definition in {file_name}')
+            return -2
+
+        order = ASPHelper.get_source_order(ctl.symbolic_atoms, positions)
+        facts = []
+        for atom in ctl.symbolic_atoms:
+            if atom.symbol.name == SOURCE_ORDER:
+                continue
+            if not atom.is_fact:
+                print(f'WARN!\tModel {file_name} is not a set of facts. Loading it from file for the consistency check.')
+                facts = []
+                break
+            facts.append(atom.symbol)
+        network.set_model_facts(ASPHelper.sort_symbols(facts, order))
+        return ASPHelper.parse_network_symbols(network, ctl.symbolic_atoms,
+                                               order)
+
+    @staticmethod
+    def parse_network_facts(network: Network, facts: Facts) -> int:
+        """
+        Populates the provided Network object from in-memory model facts,
+        given as ASP program text, clingo symbols or (name, argument, ...)
+        tuples. The facts are stored in the network so that the consistency
+        check adds them to clingo directly, without any model file.
+        Returns 1 on success, -1 if some facts were ignored and -2 on invalid
+        input.
+        """
+        facts = ASPHelper.normalize_facts(facts)
+        ctl = clingo.Control(['--warn=none'], Updater.log_clingo_message, 20)
+        try:
+            positions = ASPHelper.add_program_in_order(ctl, [], facts)
+            ctl.ground([('base', [])])
+        except RuntimeError:
+            print('WARN!\tInvalid model definition in the given facts')
+            return -2
+
+        # Programs with rules are kept as given, plain facts as symbols
+        order = ASPHelper.get_source_order(ctl.symbolic_atoms, positions)
+        atoms = [atom for atom in ctl.symbolic_atoms
+                 if atom.symbol.name != SOURCE_ORDER]
+        if all(atom.is_fact for atom in atoms):
+            facts = ASPHelper.sort_symbols([atom.symbol for atom in atoms],
+                                           order)
+        network.set_model_facts(facts)
+        return ASPHelper.parse_network_symbols(network, ctl.symbolic_atoms,
+                                               order)
+
+    @staticmethod
+    def add_observation_facts(network: Network, facts: Facts) -> None:
+        """
+        Adds in-memory observation facts, given as ASP program text, clingo
+        symbols or (name, argument, ...) tuples, to the provided Network
+        object. They are checked together with the observation files.
+        """
+        network.add_observation_facts(ASPHelper.normalize_facts(facts))
+
+    @staticmethod
+    def to_symbol(fact: tuple) -> clingo.Symbol:
+        """
+        Converts a (name, argument, ...) tuple into a clingo symbol. Integer
+        arguments become numbers and string arguments are parsed as terms, so
+        ('obs_vlabel', 'p1', 0, 'a', 1) stands for obs_vlabel(p1,0,a,1).
+        """
+        name, *arguments = fact
+        symbols = []
+        for argument in arguments:
+            if isinstance(argument, clingo.Symbol):
+                symbols.append(argument)
+            elif isinstance(argument, int):
+                symbols.append(clingo.Number(argument))
+            else:
+                symbols.append(clingo.parse_term(str(argument)))
+        return clingo.Function(name, symbols)
+
+    @staticmethod
+    def normalize_facts(facts: Facts) -> List[Union[str, clingo.Symbol]]:
+        """
+        Converts in-memory facts into a list of program text strings and
+        clingo symbols.
+        """
+        if isinstance(facts, str):
+            return [facts]
+        return [ASPHelper.to_symbol(fact) if isinstance(fact, tuple)
+                else fact for fact in facts]
+
+    @staticmethod
+    def add_facts(ctl: clingo.Control, facts: Facts) -> None:
+        """
+        Adds in-memory facts to the base program of a clingo control before
+        grounding. Program text is added with ctl.add and symbols are added
+        as facts through the backend, so nothing is written to disk.
+        """
+        symbols = []
+        for fact in ASPHelper.normalize_facts(facts):
+            if isinstance(fact, str):
+                ctl.add('base', [], fact)
+            else:
+                symbols.append(fact)
+        if symbols:
+            with ctl.backend() as backend:
+                for symbol in symbols:
+                    backend.add_rule([backend.add_atom(symbol)])
+
+    @staticmethod
+    def add_program_in_order(ctl: clingo.Control, files: Iterable[str],
+                             facts: List[Union[str, clingo.Symbol]]) \
+            -> Dict[clingo.Symbol, int]:
+        """
+        Adds model files and in-memory facts to the base program of a clingo
+        control. Every rule with a plain atom as head is also added with the
+        head SOURCE_ORDER(position, atom), the position being the one of the
+        statement in the files and facts, so the model can be read in source
+        order as the line parser does (see get_source_order). Returns the
+        positions of the facts given as symbols, which are added through the
+        backend.
+        """
+        positions = {}
+        position = 0
+        symbols = []
+        with clingo.ast.ProgramBuilder(ctl) as builder:
+            def add(statement: clingo.ast.AST) -> None:
+                nonlocal position
+                builder.add(statement)
+                if statement.ast_type == clingo.ast.ASTType.Rule and \
+                        statement.head.ast_type == \
+                        clingo.ast.ASTType.Literal and \
+                        statement.head.sign == clingo.ast.Sign.NoSign and \
+                        statement.head.atom.ast_type == \
+                        clingo.ast.ASTType.SymbolicAtom:
+                    location = statement.location
+                    term = clingo.ast.Function(
+                        location, SOURCE_ORDER,
+                        [clingo.ast.SymbolicTerm(location,
+                                                 clingo.Number(position)),
+                         statement.head.atom.symbol], 0)
+                    builder.add(clingo.ast.Rule(
+                        location,
+                        clingo.ast.Literal(location, clingo.ast.Sign.NoSign,
+                                           clingo.ast.SymbolicAtom(term)),
+                        statement.body))
+                position += 1
+
+            if files:
+                clingo.ast.parse_files(list(files), add)
+            for fact in facts:
+                if isinstance(fact, str):
+                    clingo.ast.parse_string(fact, add)
+                else:
+                    positions.setdefault(fact, position)
+                    position += 1
+                    symbols.append(fact)
+        if symbols:
+            with ctl.backend() as backend:
+                for symbol in symbols:
+                    backend.add_rule([backend.add_atom(symbol)])
+        return positions
+
+    @staticmethod
+    def get_source_order(atoms: clingo.SymbolicAtoms,
+                         positions: Dict[clingo.Symbol, int]) \
+            -> Dict[clingo.Symbol, int]:
+        """
+        Returns the position of the first statement of each atom of a model
+        grounded after add_program_in_order.
+        """
+        order = dict(positions)
+        for atom in atoms.by_signature(SOURCE_ORDER, 2):
+            position, symbol = atom.symbol.arguments
+            order[symbol] = min(order.get(symbol, position.number),
+                                position.number)
+        return order
+
+    @staticmethod
+    def sort_symbols(symbols: List[clingo.Symbol],
+                     order: Dict[clingo.Symbol, int]) -> List[clingo.Symbol]:
+        """
+        Returns the symbols sorted by their source order, keeping the
+        grounding order of the symbols with no position.
+        """
+        return sorted(symbols, key=lambda symbol: order.get(symbol, len(order)))
+
+    @staticmethod
+    def parse_network_symbols(network: Network,
+                              atoms: clingo.SymbolicAtoms,
+                              order: Optional[Dict[clingo.Symbol, int]]
+                              = None) -> int:
+        """
+        Populates the provided Network object from the vertex, edge, fixed,
+        functionOr and functionAnd atoms of a grounded model. The atoms are
+        read in the given source order (see get_source_order), so nodes,
+        edges and regulators are added in the same order as with
+        parse_network_lines, and by predicate otherwise.
+        Returns 1 on success, -1 if some atoms were ignored and -2 on invalid
+        input.
+        """
+        result = 1
+        nodes = network.get_nodes()
+
+        symbols = [atom.symbol for name, arity in MODEL_SIGNATURES
+                   for atom in atoms.by_signature(name, arity)]
+        for symbol in ASPHelper.sort_symbols(symbols, order or {}):
+            name = symbol.name
+
+            if name == 'vertex':
+                network.add_node(str(symbol.arguments[0]))
+
+            elif name == 'edge':
+                start, end, sign = symbol.arguments
+                if sign.type != clingo.SymbolType.Number or \
+                        sign.number not in [0, 1]:
+                    print(f'WARN!\tInvalid edge sign in edge {symbol}.')
+                    return -2
+                start_node = network.add_node(str(start))
+                end_node = network.add_node(str(end))
+                network.add_edge(start_node, end_node, sign.number)
+
+            elif name == 'fixed':
+                start_id, end_id = (str(arg) for arg in symbol.arguments)
+                edge = network.find_edge(start_id, end_id)
+                if edge is not None:
+                    edge.set_fixed()
+                else:
+                    print(f'WARN!\tUnrecognized edge: {symbol}. Ignoring...')
+
+            elif name == 'functionOr':
+                node, limit = symbol.arguments
+                if limit.type != clingo.SymbolType.Number or limit.number < 1:
+                    print(f'WARN!\tInvalid range limit: {limit} in {symbol}. It must be an integer greater than 0.')
+                    return -2
+                network.add_node(str(node))
+
+            else:
+                node_id, clause, regulator = (str(arg) for arg in symbol.arguments)
+                node = nodes.get(node_id)
+                if node is None:
+                    print(f'WARN!\tNode not recognized or not yet defined: {node_id} in {symbol}')
+                    result = -1
+                    continue
+                if regulator not in nodes:
+                    print(f'WARN!\tNode not recognized or not yet defined: {regulator} in {symbol}')
+                    result = -1
+                    continue
+                clause_id = symbol.arguments[1]
+                if clause_id.type != clingo.SymbolType.Number or \
+                        clause_id.number < 1:
+                    print(f'WARN!\tInvalid clause Id: {clause} in {symbol}')
+                    result = -1
+                    continue
+                node.get_function().add_regulator_to_term(clause_id.number,
+                                                          regulator)
+        return result
+
+    @staticmethod
+    def parse_network_lines(network: Network, lines: Iterable[str],
+                            warnings: Optional[List[str]] = None) -> int:
+        """
+        Populates the provided Network object from the lines of a model
+        definition. Each line is tokenized once and every predicate is
+        dispatched on its name. Returns 1 on success, -1 if some predicates
+        were ignored and -2 on invalid input. The printed warnings are also
+        appended to warnings, if given, as some of them (e.g. an unknown
+        fixed edge) do not change the result.
+        """
+        result = 1
+
+        def warn(message: str) -> None:
+            print(message)
+            if warnings is not None:
+                warnings.append(message)
+        nodes = network.get_nodes()
+        valid_names = set()
+
+        def is_valid(name: str) -> bool:
+            if name in valid_names:
+                return True
+            if name and ASPHelper.validate_input_name(name):
+                valid_names.add(name)
+                return True
+            return False
+
+        count_line = 0
+        for line in lines:
+            count_line += 1
+            line = ''.join(line.split())  # Remove all whitespace
+            if ').' not in line:
+                continue
+            for name, args in ASPHelper.tokenize_predicates(line):
+
+                if name == 'vertex':
+                    network.add_node(args)
+
+                elif name == 'edge':
+                    split = args.split(',')
+
+                    if len(split) != 3:
+                        warn(f'WARN!\tEdge not recognized in line {str(count_line)}: {name}({args}).')
+                        result = -1
+                        continue
+
+                    start_id, end_id, sign = split
+                    if not is_valid(start_id) or not is_valid(end_id):
+                        warn(f'WARN!\tInvalid node argument in line {str(count_line)}: {name}({args}).')
+                        print('\t\tNodes names must start with a lower case letter, a digit, or be surrounded by quotation marks.')
+                        return -2
+
+                    try:
+                        sign = int(sign)
+                    except ValueError:
+                        warn(f'WARN!\tInvalid edge sign: {sign} on line {str(count_line)} in edge {name}({args}).')
+                        return -2
+
+                    if sign not in [0, 1]:
+                        warn(f'WARN!\tInvalid edge sign on line {str(count_line)} in edge {name}({args}).')
+                        return -2
+
+                    start_node = nodes.get(start_id)
+                    if start_node is None:
+                        start_node = network.add_node(start_id)
+                    end_node = nodes.get(end_id)
+                    if end_node is None:
+                        end_node = network.add_node(end_id)
+                    network.add_edge(start_node, end_node, sign)
+
+                elif name == 'fixed':
+                    split = args.split(',')
+
+                    if len(split) != 2:
+                        continue
+
+                    start_id, end_id = split
+                    if not is_valid(start_id) or not is_valid(end_id):
+                        warn(f'WARN!\tInvalid node argument in line {count_line}: {name}({args}).')
+                        print('\t\tNodes names must start with a lower case letter, a digit, or be surrounded by quotation marks.')
+                        return -2
+
+                    edge = network.find_edge(start_id, end_id)
+                    if edge is not None:
+                        edge.set_fixed()
+                    else:
+                        warn(f'WARN!\tUnrecognized edge on line {count_line}: {name}({args}). Ignoring...')
+
+                elif name == 'functionOr':
+                    split = args.split(',')
+
+                    if len(split) != 2:
+                        warn(f'WARN!\tfunctionOr not recognized on line {str(count_line)}: {name}({args}).')
+                        result = -1
+                        continue
+
+                    node_id, limit = split
+                    if not is_valid(node_id):
+                        warn(f'WARN!\tInvalid node argument in line {str(count_line)}: {name}({args}).')
+                        print('\t\tNodes names must start with a lower case letter, a digit, or be surrounded by quotation marks.')
+                        return -2
+
+                    if node_id not in nodes:
+                        network.add_node(node_id)
+
+                    if '..' in limit:
+                        limit = limit.split('.')[-1]
+                        try:
+                            range_limit = int(limit)
+                        except ValueError:
+                            warn(f'WARN!\tInvalid range limit: {limit} on line {count_line} in {name}({args}).. It must be an integer greater than 0.')
+                            return -2
+                        if range_limit < 1:
+                            warn(f'WARN!\tInvalid range limit: {range_limit} on line {count_line} in {name}({args}).. It must be an integer greater than 0.')
+                            return -2
+                    else:
+                        try:
+                            range_limit = int(limit)
+                            if range_limit < 1:
+                                warn(f'WARN!\tInvalid range limit: {range_limit} on line {count_line} in {name}({args}).. It must be an integer greater than 0.')
+                                return -2
+                        except ValueError:
+                            warn(f'WARN!\tInvalid functionOr range definition on line {count_line}: {name}({args}).')
+                            return -2
+
+                elif name == 'functionAnd':
+                    split = args.split(',')
+
+                    if len(split) != 3:
+                        warn(f'WARN!\tfunctionAnd not recognized on line {count_line}: {name}({args}).')
+                        result = -1
+                        continue
+
+                    node_id, clause, regulator = split
+                    if not is_valid(node_id) or not is_valid(regulator):
+                        warn(f'WARN!\tInvalid node argument on line {count_line}: {name}({args}).')
+                        print('\t\tNodes names must start with a lower case letter, a digit, or be surrounded by quotation marks.')
+                        return -2
+
+                    node = nodes.get(node_id)
+                    if node is None:
+                        warn(f'WARN!\tNode not recognized or not yet defined: {node_id} on line {count_line} in {name}({args}).')
+                        result = -1
+                        continue
+
+                    if regulator not in nodes:
+                        warn(f'WARN!\tNode not recognized or not yet defined: {regulator} on line {count_line} in {name}({args}).')
+                        result = -1
+                        continue
+
+                    try:
+                        clause_id = int(clause)
+                        if clause_id < 1:
+                            warn(f'WARN!\tInvalid clause Id: {clause} on line {count_line} in {name}({args}).')
+                            result = -1
+                            continue
+                    except ValueError:
+                        warn(f'WARN!\tInvalid clause Id: {clause} on line {count_line} in {name}({args}).')
+                        result = -1
+                        continue
+                    node.get_function().add_regulator_to_term(clause_id, regulator)
         return result
 
     # @staticmethod
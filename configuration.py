@@ -52,5 +52,23 @@ configuration = {
     'force_optimum': False,
     'show_solution_for_each_inconsistency': False,  # Show best solution for each consistency check even if it is not globally optimum
     'show_all_functions': False,
-    'check_consistency': False  # Just check the consistency of the model and return
+    'check_consistency': False,  # Just check the consistency of the model and return
+    'clingo_parse': False,  # Parse the model once through clingo and reuse its facts in the consistency check
+    'network_cache_dir': '',  # Directory of the parsed network cache (disabled if empty)
+    'solver_parallel_mode': '',  # clingo --parallel-mode, number of solving threads and mode (e.g. 4 or 4,split; single-threaded if empty)
+    'solver_configuration': '',  # clingo --configuration preset (clingo default if empty)
+    'solver_opt_strategy': '',  # clingo --opt-strategy (e.g. bb or usc; clingo default if empty)
+    'solver_time_limit': 0,  # Wall-clock seconds for each consistency check solve, keeping the best labelings found when reached (no limit if 0)
+    'stream_repairs': False,  # Repair each optimal labeling as soon as it is proven, while clingo keeps enumerating
+    'stream_queue_size': 16,  # Maximum number of proven labelings waiting to be repaired when streaming
+    'dedupe_labelings': False,  # Skip labelings whose repair signature matches an earlier labeling repaired without adding or removing edges
+    'max_labelings': 0,  # Maximum number of optimal labelings repaired (no limit if 0)
+    'solver_statistics': False,  # Print grounder and solver statistics of every consistency check as JSON on stderr
+    'decompose_components': False,  # Check and combine the weakly connected components of the model separately
+    'component_jobs': 1,  # Number of processes checking components in parallel
+    'cone_of_influence': False,  # Ground only the observed nodes and their direct and indirect regulators
+    'direct_check': False,  # Decide fully observed steady-state and sync observations by evaluating the functions, without clingo
+    'consistency_memo_size': 4096,  # Maximum number of consistency checks of candidate functions remembered during repair (0 disables the memo)
+    'evaluation_backend': 'table',  # Consistency checks of candidate functions during repair: python (one profile and time step at a time), table (distinct regulator states of the node), numpy (all profiles and time steps at once, requires NumPy) or bitset (profiles packed into the bits of Python ints)
+    'topological_encoding': 'pairwise'  # Topological error rules of sync/async time series: pairwise (compares every pair of time points) or grouped (groups time points by regulator labels)
 }
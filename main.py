@@ -16,10 +16,18 @@ from network.network import Network
 from network.edge import Edge
 from network.function import Function
 from network.inconsistency_solution import Inconsistency_Solution
+from network.vectorized_labeling import Vectorized_Labeling
+from network.bit_parallel_labeling import Bit_Parallel_Labeling
+from network.transition_table import Transition_Table
+from network.consistency_memo import Consistency_Memo
 from network.inconsistent_node import Inconsistent_Node
 from network.repair_set import Repair_Set
 from asp_helper import ASPHelper
 from configuration import configuration, UpdateType, Inconsistencies
+from updaters.updater import Updater
+from updaters.component_decomposition import ComponentDecomposition
+from updaters.cone_of_influence import ConeOfInfluence
+from updaters.direct_check import DirectCheck
 from updaters.async_updater import AsyncUpdater
 from updaters.sync_updater import SyncUpdater
 from updaters.steady_state_updater import SteadyStateUpdater
@@ -46,6 +54,23 @@ def print_help() -> None:
       options:
         --check-consistency,-cc             Check the consistency of the model and return without repairing. DEFAULT: false.
         --exhaustive-search                 Force exhaustive search of function repair operations. DEFAULT: false.
+        --clingo-parse                      Parse the model once through clingo and reuse it in the consistency check. DEFAULT: false.
+        --cache-dir <dir>                   Cache parsed models in <dir>, keyed by the content of the model file. DEFAULT: disabled.
+        --parallel-mode <n[,compete|split]> Number of clingo solving threads and their mode in the consistency check. DEFAULT: 1.
+        --solver-configuration <preset>     clingo configuration preset {{auto,frumpy,jumpy,tweety,handy,crafty,trendy,many}}. DEFAULT: clingo default.
+        --opt-strategy <strategy>           clingo optimization strategy, e.g. bb or usc (core-guided). DEFAULT: clingo default.
+        --time-limit <seconds>              Stop the consistency check after <seconds> and repair the best labelings found so far. DEFAULT: no limit.
+        --stream                            Repair each optimal labeling as soon as it is proven, while the solver keeps enumerating (not with --time-limit). DEFAULT: false.
+        --dedupe-labelings                  Skip optimal labelings that would repeat the repairs of an earlier one. DEFAULT: false.
+        --max-labelings <n>                 Repair at most <n> optimal labelings. DEFAULT: no limit.
+        --stats                             Print grounder and solver statistics of each consistency check, and the hits and misses of the consistency memo, as JSON on stderr. DEFAULT: false.
+        --evaluation-backend <backend>      Consistency checks of candidate functions during repair {{python,table,numpy,bitset}}; python checks one profile and time step at a time, table checks the distinct regulator states of the node, numpy checks every profile and time step at once and requires NumPy, bitset packs the profiles into the bits of Python ints. DEFAULT: table.
+        --memo-size <n>                     Number of consistency checks of candidate functions remembered during repair; with every evaluation backend, except for functions without clauses and time series whose updater has no transition table; 0 disables the memo. DEFAULT: 4096.
+        --topological-encoding <encoding>   Topological error rules of sync/async time series {{pairwise,grouped}}; grouped grows linearly with the number of time points. DEFAULT: pairwise.
+        --decompose                         Check the weakly connected components of the model separately (steady-state and sync updaters, not with --stream). DEFAULT: false.
+        --component-jobs <n>                Number of processes checking components in parallel with --decompose. DEFAULT: 1.
+        --cone-of-influence                 Ground only the observed nodes and their regulators, filling in the labels of the others (steady-state and sync updaters, only with --check-consistency). DEFAULT: false.
+        --direct-check                      Decide observations of every node at every time point without clingo (steady-state and sync updaters, not with --stream). DEFAULT: false.
         --support,-su                       Support values for each variable.
         --sub-opt                           Show sub-optimal solutions found. DEFAULT: false.
         --verbose,-v <value>                Verbose level {{0,1,2,3}} of output. DEFAULT: 2.
@@ -74,7 +99,14 @@ def process_arguments(
         '--sub-opt': 'show_solution_for_each_inconsistency',
         '--exhaustive-search': 'force_optimum',
         '--check-consistency': 'check_consistency',
-        '-cc': 'check_consistency'
+        '-cc': 'check_consistency',
+        '--clingo-parse': 'clingo_parse',
+        '--stream': 'stream_repairs',
+        '--dedupe-labelings': 'dedupe_labelings',
+        '--stats': 'solver_statistics',
+        '--decompose': 'decompose_components',
+        '--cone-of-influence': 'cone_of_influence',
+        '--direct-check': 'direct_check'
     }
     # retro_options = {'--steady-state', '--ss'}  # TODO delete
     help_options = {'--help', '-h'}
@@ -85,6 +117,18 @@ def process_arguments(
     # update_options = {'--update', '-up'}  # TODO delete
     # update_values = {'a': UpdateType.ASYNC, 's': UpdateType.SYNC, 'ma': UpdateType.MASYNC}  # TODO delete
     verbose_options = {'--verbose', '-v'}
+    cache_options = {'--cache-dir'}
+    solver_options = {'--parallel-mode': 'solver_parallel_mode',
+                      '--solver-configuration': 'solver_configuration',
+                      '--opt-strategy': 'solver_opt_strategy'}
+    time_limit_options = {'--time-limit'}
+    max_labelings_options = {'--max-labelings'}
+    topological_encoding_options = {'--topological-encoding'}
+    topological_encodings = {'pairwise', 'grouped'}
+    evaluation_backend_options = {'--evaluation-backend'}
+    evaluation_backends = {'python', 'table', 'numpy', 'bitset'}
+    component_jobs_options = {'--component-jobs'}
+    memo_size_options = {'--memo-size'}
     debug_options = {'--debug', '-d'}
 
     i = 0
@@ -98,7 +142,15 @@ def process_arguments(
                 configuration[option_mapping[arg]] = True
             elif arg in model_options | \
                     observation_options | \
-                    verbose_options:
+                    verbose_options | \
+                    cache_options | \
+                    solver_options.keys() | \
+                    time_limit_options | \
+                    max_labelings_options | \
+                    topological_encoding_options | \
+                    evaluation_backend_options | \
+                    component_jobs_options | \
+                    memo_size_options:
                     # observation_type_options | \
                     # update_options | \
                 last_opt = arg
@@ -178,6 +230,74 @@ def process_arguments(
                     raise ValueError(f'Invalid value for --verbose: {arg}') \
                         from exc
                 i += 1
+            elif last_opt in cache_options:
+                configuration['network_cache_dir'] = arg
+                i += 1
+            elif last_opt in solver_options:
+                if not Updater.is_valid_solver_argument(
+                        Updater.get_solver_argument(solver_options[last_opt], arg)):
+                    print_help()
+                    raise ValueError(f'Invalid value for {last_opt}: {arg}')
+                configuration[solver_options[last_opt]] = arg
+                i += 1
+            elif last_opt in time_limit_options:
+                try:
+                    time_limit = float(arg)
+                    if time_limit <= 0:
+                        raise ValueError
+                    configuration['solver_time_limit'] = time_limit
+                except ValueError as exc:
+                    print_help()
+                    raise ValueError(f'Invalid value for --time-limit: {arg}') \
+                        from exc
+                i += 1
+            elif last_opt in max_labelings_options:
+                try:
+                    max_labelings = int(arg)
+                    if max_labelings <= 0:
+                        raise ValueError
+                    configuration['max_labelings'] = max_labelings
+                except ValueError as exc:
+                    print_help()
+                    raise ValueError(f'Invalid value for --max-labelings: {arg}') \
+                        from exc
+                i += 1
+            elif last_opt in topological_encoding_options:
+                if arg not in topological_encodings:
+                    print_help()
+                    raise ValueError(f'Invalid value for --topological-encoding: {arg}')
+                configuration['topological_encoding'] = arg
+                i += 1
+            elif last_opt in evaluation_backend_options:
+                if arg not in evaluation_backends:
+                    print_help()
+                    raise ValueError(f'Invalid value for --evaluation-backend: {arg}')
+                if arg == 'numpy' and not Vectorized_Labeling.is_available():
+                    raise ValueError('--evaluation-backend numpy requires NumPy')
+                configuration['evaluation_backend'] = arg
+                i += 1
+            elif last_opt in component_jobs_options:
+                try:
+                    component_jobs = int(arg)
+                    if component_jobs <= 0:
+                        raise ValueError
+                    configuration['component_jobs'] = component_jobs
+                except ValueError as exc:
+                    print_help()
+                    raise ValueError(f'Invalid value for --component-jobs: {arg}') \
+                        from exc
+                i += 1
+            elif last_opt in memo_size_options:
+                try:
+                    memo_size = int(arg)
+                    if memo_size < 0:
+                        raise ValueError
+                    configuration['consistency_memo_size'] = memo_size
+                except ValueError as exc:
+                    print_help()
+                    raise ValueError(f'Invalid value for --memo-size: {arg}') \
+                        from exc
+                i += 1
             else:
                 i += 1
 
@@ -199,9 +319,18 @@ def check_consistency(network: Network) -> Tuple[List[Inconsistency_Solution], i
     """
     result = []
     optimization = -2
+    if configuration['direct_check']:
+        direct = DirectCheck.check_consistency(network)
+        if direct is not None:
+            return direct
     if configuration['check_asp']:
         # result, optimization = ASPHelper.check_consistency(network, configuration['update'].value)
-        result, optimization = ASPHelper.check_consistency(network)
+        if configuration['decompose_components']:
+            result, optimization = ComponentDecomposition.check_consistency(network)
+        elif configuration['cone_of_influence']:
+            result, optimization = ConeOfInfluence.check_consistency(network)
+        else:
+            result, optimization = ASPHelper.check_consistency(network)
     else:
         pass
     return result, optimization
@@ -215,6 +344,9 @@ def print_consistency(
     format.
     """
     print("{")
+    if not all(inconsistency.get_optimality_proven()
+               for inconsistency in inconsistencies):
+        print('\t"optimality_proven": false,')
     print(f'\t"consistent": {"true" if optimization == 0 else "false,"}')
     if optimization != 0:
         print('\t"inconsistencies": [', end="")
@@ -264,7 +396,7 @@ def repair_node_consistency(
     list_edges_add = []
 
     for regulator in original_regulators:
-        edge = network.get_edge(regulator, original_function.get_node_id())
+        edge = network.find_edge(regulator, original_function.get_node_id())
         if edge is not None and not edge.get_fixed():
             list_edges_remove.append(edge)
 
@@ -300,6 +432,7 @@ def repair_node_consistency(
             for add_combination in list_add_combination:
                 for remove_combination in list_remove_combination:
                     is_sol = False
+                    network.begin_transaction()
 
                     # Remove and add edges
                     for edge in remove_combination:
@@ -338,24 +471,15 @@ def repair_node_consistency(
                         # TODO does this makes sense? only creating the PFH function if the new function has regulators?
                         if new_function.get_regulators():
                             new_function.create_pfh_function()
-                        original_node.add_function(new_function)
+                        network.set_function(original_node, new_function)
 
                     # Test with edge flips starting with 0 edge flips
                     is_sol = repair_node_consistency_flipping_edges(
                         network, inconsistency, inconsistent_node,
                         add_combination, remove_combination)
 
-                    # Add and remove edges for the original network
-                    for edge in remove_combination:
-                        network.add_edge(edge.get_start_node(),
-                                         edge.get_end_node(), edge.get_sign())
-
-                    for edge in add_combination:
-                        network.remove_edge(edge.get_start_node(),
-                                            edge.get_end_node())
-
-                    # Restore the original function
-                    original_node.add_function(original_function)
+                    # Restore the original edges and function
+                    network.rollback_transaction()
 
                     if is_sol:
                         sol_found = True
@@ -387,7 +511,7 @@ def repair_node_consistency_flipping_edges(
     list_edges = []
 
     for regulator in regulators:
-        edge = network.get_edge(regulator, function.get_node_id())
+        edge = network.find_edge(regulator, function.get_node_id())
         if edge is not None and not edge.get_fixed():
             list_edges.append(edge)
     if configuration["debug"]:
@@ -407,9 +531,10 @@ def repair_node_consistency_flipping_edges(
 
         # For each set of flipping edges
         for edge_set in edges_candidates:
+            network.begin_transaction()
             # Flip all edges
             for edge in edge_set:
-                edge.flip_sign()
+                network.flip_edge(edge)
                 if configuration["debug"]:
                     print(f"DEBUG: Flip edge from {edge.get_start_node().get_id()}")
             is_sol = repair_node_consistency_functions(network, inconsistency,
@@ -417,9 +542,9 @@ def repair_node_consistency_flipping_edges(
                                                        edge_set, added_edges,
                                                        removed_edges)
             # Put network back to normal by flipping edges back
-            for edge in edge_set:
-                edge.flip_sign()
-                if configuration["debug"]:
+            network.rollback_transaction()
+            if configuration["debug"]:
+                for edge in edge_set:
                     print(f"DEBUG: Return flip edge from {edge.get_start_node().get_id()}")
             if is_sol:
                 if configuration["debug"]:
@@ -537,6 +662,42 @@ def repair_node_consistency_functions(
     return sol_found
 
 
+def get_consistency_memo(network: Network) -> Consistency_Memo:
+    """
+    Returns the memo of the consistency checks of candidate functions of the
+    network, created on the first call with the configured size, or None if
+    the memo is disabled.
+    """
+    memo = network.get_consistency_memo()
+    if memo is None and configuration['consistency_memo_size'] > 0:
+        memo = Consistency_Memo(configuration['consistency_memo_size'])
+        network.set_consistency_memo(memo)
+    return memo
+
+
+def get_consistency_key(
+        network: Network,
+        labeling: Inconsistency_Solution,
+        function: Function):
+    """
+    Returns the key of the check of a function against a labeling in the
+    consistency memo, the same for every evaluation backend: the node, the
+    compiled clauses of the function, which do not depend on the order of the
+    clauses and hold the signs of the edges of the regulators they use, and
+    the signature of the transition table of the node, shared by labelings
+    that agree on its regulator states. Returns None, leaving the check out
+    of the memo, if the memo is disabled, the function has no clauses (its
+    check evaluates nothing) or the labeling has no transition table.
+    """
+    if get_consistency_memo(network) is None or not function.get_n_clauses():
+        return None
+    table = Transition_Table.get(network, labeling, function)
+    if table is None:
+        return None
+    _, masks = function.get_compiled(network)
+    return function.get_node_id(), frozenset(masks), table.get_signature()
+
+
 def n_func_inconsistent_with_label(
         network: Network,
         labeling: Inconsistency_Solution,
@@ -544,8 +705,43 @@ def n_func_inconsistent_with_label(
     """
     Checks the consistency of a function against a labeling. It verifies each
     profile and returns the consistency status (consistent, inconsistent, or
-    double inconsistency).
+    double inconsistency), reusing the result of an earlier check of the
+    same clauses under the same edge signs against the same regulator states.
     """
+    key = get_consistency_key(network, labeling, function)
+    if key is None:
+        return n_func_inconsistent_with_backend(network, labeling, function)
+    memo = network.get_consistency_memo()
+    result = memo.get(key)
+    if result is None:
+        result = n_func_inconsistent_with_backend(network, labeling, function)
+        memo.put(key, result)
+    return result
+
+
+def n_func_inconsistent_with_backend(
+        network: Network,
+        labeling: Inconsistency_Solution,
+        function: Function) -> int:
+    """
+    Checks the consistency of a function against a labeling with the
+    configured evaluation backend, falling back to the checks of the
+    updaters one profile at a time.
+    """
+    if configuration['evaluation_backend'] == 'numpy':
+        vectorized = Vectorized_Labeling.get(network, labeling)
+        if vectorized is not None:
+            return vectorized.n_func_inconsistent(network, function)
+    elif configuration['evaluation_backend'] == 'bitset':
+        bit_parallel = Bit_Parallel_Labeling.get(network, labeling)
+        if bit_parallel is not None:
+            return bit_parallel.n_func_inconsistent(network, function)
+    elif configuration['evaluation_backend'] == 'table' \
+            and function.get_n_clauses():
+        # Check the distinct regulator states of the node only
+        table = Transition_Table.get(network, labeling, function)
+        if table is not None:
+            return table.n_func_inconsistent(network, function)
     result = Inconsistencies.CONSISTENT.value
     for key in labeling.get_v_label():
         ret = n_func_inconsistent_with_label_with_profile(network, labeling, function, key)
@@ -1023,6 +1219,23 @@ def is_func_consistent_with_label(
     """
     Checks if a function is consistent with a labeling across all profiles.
     """
+    if get_consistency_key(network, labeling, function) is not None:
+        # The memo keeps the inconsistency of the function
+        return n_func_inconsistent_with_label(network, labeling, function) \
+            == Inconsistencies.CONSISTENT.value
+    if configuration['evaluation_backend'] == 'numpy':
+        vectorized = Vectorized_Labeling.get(network, labeling)
+        if vectorized is not None:
+            return vectorized.is_func_consistent(network, function)
+    elif configuration['evaluation_backend'] == 'bitset':
+        bit_parallel = Bit_Parallel_Labeling.get(network, labeling)
+        if bit_parallel is not None:
+            return bit_parallel.is_func_consistent(network, function)
+    elif configuration['evaluation_backend'] == 'table' \
+            and function.get_n_clauses():
+        table = Transition_Table.get(network, labeling, function)
+        if table is not None:
+            return table.is_func_consistent(network, function)
     return all(
         is_func_consistent_with_label_with_profile(network, labeling, function, profile)
         for profile in labeling.get_v_label()
@@ -1134,26 +1347,8 @@ def get_function_value(
     Evaluates the value of a function based on the given input map. It checks
     the satisfaction of the function's clauses.
     """
-    n_clauses = function.get_n_clauses()
-    if n_clauses:
-        clauses = function.get_clauses()
-        for clause in clauses:
-            is_clause_satisfiable = True
-            _vars = function.bitarray_to_regulators(clause)
-            for var in _vars:
-                edge = network.get_edge(var, function.get_node_id())
-                if edge is not None:
-                    # Determine if clause is satisfiable based on edge sign
-                    if (edge.get_sign() > 0) == (input_map[var] == 0):
-                        is_clause_satisfiable = False
-                        # Stop checking if clause is already unsatisfiable
-                        break
-                else:
-                    print(f"WARN: Missing edge from {var} to {function.get_node_id()}")
-                    return False
-            if is_clause_satisfiable:
-                return True
-    return False
+    return bool(function.get_n_clauses()) and \
+        function.evaluate(network, input_map)
 
 
 def get_edges_combinations(
@@ -1185,6 +1380,12 @@ def model_revision(network: Network) -> None:
         2nd - tries to flip the sign of the edges
         3rd - tries to add or remove edges
     """
+    if configuration["stream_repairs"] and \
+            not configuration["check_consistency"] and \
+            not configuration["solver_time_limit"]:
+        model_revision_stream(network)
+        return
+
     optimization = -2
     f_inconsistencies, optimization = check_consistency(network)
     if configuration["check_consistency"]:
@@ -1192,8 +1393,7 @@ def model_revision(network: Network) -> None:
         return
 
     if optimization < 0:
-        print("ERROR: It is not possible to repair this network for now.")
-        print("This may occur if there is at least one node for which from the same input two different outputs are expected (non-deterministic function).")
+        print_unrepairable()
         return
 
     if optimization == 0:
@@ -1209,23 +1409,156 @@ def model_revision(network: Network) -> None:
     # At this point we have an inconsistent network with node candidates
     # to be repaired
     best_solution = None
+    repaired = []  # Labelings repaired, leaving out repeated ones
+    signatures = set()
     for inconsistency in f_inconsistencies:
-        repair_inconsistencies(network, inconsistency)
+        if is_labeling_cap_reached(len(repaired)):
+            break
+        signature = get_labeling_signature(network, inconsistency)
+        if signature in signatures:
+            continue
+        best_solution = repair_labeling(network, inconsistency, best_solution)
+        repaired.append(inconsistency)
+        if is_signature_reusable(inconsistency):
+            signatures.add(signature)
+        if is_final_solution(best_solution):
+            break
+
+    print_revision(repaired, best_solution)
+
+
+def model_revision_stream(network: Network) -> None:
+    """
+    Revises the model while the consistency check is still enumerating
+    optimal labelings: each labeling is repaired as soon as it is proven
+    optimal, and only the solutions that can still be printed are kept.
+    The output is the same as the one of model_revision.
+    """
+    best_solution = None
+    f_inconsistencies = []  # Solutions that may still be printed
+    n_repaired = 0
+    signatures = set()
+    show_sub_opt = configuration["show_solution_for_each_inconsistency"]
 
-        # Check for valid solution
+    def consume(inconsistency: Inconsistency_Solution,
+                optimization: int) -> bool:
+        nonlocal best_solution, f_inconsistencies, n_repaired
+        if optimization == 0:
+            f_inconsistencies.append(inconsistency)
+            return False
+        signature = get_labeling_signature(network, inconsistency)
+        if signature in signatures:
+            return True
+        previous_best = best_solution
+        best_solution = repair_labeling(network, inconsistency, best_solution)
+        n_repaired += 1
+        if is_signature_reusable(inconsistency):
+            signatures.add(signature)
         if not inconsistency.get_has_impossibility():
-            if best_solution is None \
-                    or inconsistency.compare_repairs(best_solution) > 0:
-                best_solution = inconsistency
-                if configuration["debug"]:
-                    print(f"DEBUG: Found a solution with {best_solution.get_n_topology_changes()} topology changes")
-                if best_solution.get_n_topology_changes() == 0 and not \
-                        configuration["all_opt"]:
-                    break
-        else:
+            f_inconsistencies.append(inconsistency)
+        if best_solution is not previous_best and not show_sub_opt:
+            f_inconsistencies = [
+                solution for solution in f_inconsistencies
+                if solution.compare_repairs(best_solution) >= 0]
+        return not is_final_solution(best_solution) \
+            and not is_labeling_cap_reached(n_repaired)
+
+    optimization = Updater.stream_consistency(
+        network, consume, configuration["stream_queue_size"])
+
+    if optimization < 0:
+        print_unrepairable()
+        return
+
+    if optimization == 0:
+        if configuration["verbose"] == 3:
+            print_consistency(f_inconsistencies, optimization)
+            return
+        print("This network is consistent!")
+        return
+
+    print_revision(f_inconsistencies, best_solution)
+
+
+def repair_labeling(
+        network: Network,
+        inconsistency: Inconsistency_Solution,
+        best_solution: Inconsistency_Solution) -> Inconsistency_Solution:
+    """
+    Repairs the inconsistent nodes of a labeling and returns the best
+    solution found so far.
+    """
+    repair_inconsistencies(network, inconsistency)
+
+    # Check for valid solution
+    if not inconsistency.get_has_impossibility():
+        if best_solution is None \
+                or inconsistency.compare_repairs(best_solution) > 0:
+            best_solution = inconsistency
             if configuration["debug"]:
-                print("DEBUG: Reached an impossibility")
+                print(f"DEBUG: Found a solution with {best_solution.get_n_topology_changes()} topology changes")
+    else:
+        if configuration["debug"]:
+            print("DEBUG: Reached an impossibility")
+    return best_solution
+
+
+def get_labeling_signature(
+        network: Network,
+        inconsistency: Inconsistency_Solution):
+    """
+    Returns the repair signature of a labeling when repeated labelings are
+    skipped, or None otherwise.
+    """
+    if not configuration["dedupe_labelings"]:
+        return None
+    return inconsistency.get_repair_signature(network.get_regulators())
+
+
+def is_signature_reusable(inconsistency: Inconsistency_Solution) -> bool:
+    """
+    Returns whether later labelings with the same signature as a repaired
+    labeling can be skipped. This holds when every node was repaired without
+    adding or removing edges, since only then the repair search never reads
+    the labels of nodes outside the signature.
+    """
+    return configuration["dedupe_labelings"] \
+        and not inconsistency.get_has_impossibility() \
+        and inconsistency.get_n_ar_operations() == 0
 
+
+def is_labeling_cap_reached(n_repaired: int) -> bool:
+    """
+    Returns whether as many labelings as allowed were already repaired.
+    """
+    return 0 < configuration["max_labelings"] <= n_repaired
+
+
+def is_final_solution(best_solution: Inconsistency_Solution) -> bool:
+    """
+    Returns whether no other labeling needs to be repaired after the given
+    best solution.
+    """
+    return best_solution is not None \
+        and best_solution.get_n_topology_changes() == 0 \
+        and not configuration["all_opt"]
+
+
+def print_unrepairable() -> None:
+    """
+    Prints the message of a consistency check without labelings.
+    """
+    print("ERROR: It is not possible to repair this network for now.")
+    print("This may occur if there is at least one node for which from the same input two different outputs are expected (non-deterministic function).")
+
+
+def print_revision(
+        f_inconsistencies: List[Inconsistency_Solution],
+        best_solution: Inconsistency_Solution) -> None:
+    """
+    Prints the best solution, or every solution as good as the best one
+    when all optimal solutions are requested.
+    """
     if best_solution is None:
         print("### It was not possible to repair the model.")
         return
@@ -1267,3 +1600,7 @@ if __name__ == '__main__':
         print('#ABORT:\tModel definition with errors.\n\tCheck documentation for input definition details.')
         sys.exit(-1)
     model_revision(network)
+    if configuration['solver_statistics'] and \
+            network.get_consistency_memo() is not None:
+        Updater.print_statistics(
+            {'consistency_memo': network.get_consistency_memo().get_statistics()})
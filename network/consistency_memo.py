@@ -0,0 +1,79 @@
+"""
+This module defines the Consistency_Memo class, a bounded least recently used
+memo of the consistency checks of candidate functions.
+The repair checks the same function under the same edge signs many times:
+across the flip combinations of a node, across revisits of the Hasse diagram
+and across labelings that agree on the labels of the node and its regulators.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+
+class Consistency_Memo:
+    """
+    Results of consistency checks by key, keeping at most max_size of them
+    and dropping the least recently used one when full, with counters of the
+    lookups that found (hits) or missed (misses) a result.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Initializes an empty memo of at most max_size results.
+        """
+        self.max_size = max_size
+        self.results = OrderedDict()  # {key: result}, least recently used first
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[int]:
+        """
+        Returns the result stored for a key, marking it as the most recently
+        used, or None if there is none.
+        """
+        result = self.results.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.results.move_to_end(key)
+        return result
+
+    def put(self, key: Hashable, result: int) -> None:
+        """
+        Stores the result of a key, dropping the least recently used result
+        if the memo is full.
+        """
+        if self.max_size <= 0:
+            return
+        self.results[key] = result
+        self.results.move_to_end(key)
+        if len(self.results) > self.max_size:
+            self.results.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes every result and resets the counters.
+        """
+        self.results.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_max_size(self) -> int:
+        return self.max_size
+
+    def get_size(self) -> int:
+        return len(self.results)
+
+    def get_hits(self) -> int:
+        return self.hits
+
+    def get_misses(self) -> int:
+        return self.misses
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Returns the counters and sizes of the memo.
+        """
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self.results), 'max_size': self.max_size}
@@ -14,6 +14,8 @@ class Edge:
     Provides methods to manage and query the edge's properties.
     """
 
+    __slots__ = ('start_node', 'end_node', 'sign', 'fixed')
+
     def __init__(self, start_node: Node, end_node: Node, sign: int) -> None:
         """
         Initializes an edge with a start node, end node, and sign.
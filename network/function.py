@@ -6,7 +6,7 @@ including clause management, Hasse diagram navigation, and consistency
 analysis.
 """
 
-from typing import Set, Dict, List
+from typing import Set, Dict, List, Mapping, Tuple
 from bitarray import bitarray
 from pyfunctionhood.function import Function as PFHFunction
 from pyfunctionhood.clause import Clause
@@ -20,6 +20,10 @@ class Function:
     managing the function's structure and interfacing with the PyFunctionhood
     library.
     """
+    __slots__ = ('node_id', 'distance_from_original', 'son_consistent',
+                 'regulators', 'regulators_by_term', 'pfh_function',
+                 'clause_regulators', 'compiled')
+
     def __init__(self, node_id: str) -> None:
         """
         Initializes a Function object with a given node ID.
@@ -35,6 +39,13 @@ class Function:
         # {1: ['node_1', 'node_2'], 2: ['node_1', 'node_3'], 3: ['node_3']}
         self.regulators_by_term = {}
         self.pfh_function = None
+        # Regulator tuple of each clause signature, shared by the functions
+        # derived from this one in the Hasse diagram
+        # {b'\x80': ('node_1',), b'\xc0': ('node_1', 'node_2'), ...}
+        self.clause_regulators = {}
+        # (network, network version, regulators, clause masks) of the last
+        # compilation, see compile
+        self.compiled = None
 
     def get_node_id(self) -> str:
         """
@@ -102,14 +113,17 @@ class Function:
 
     def add_regulator_to_term(self, term_id: int, regulator: str) -> None:
         """
-        Adds a regulator to a specific term in the function.
+        Adds a regulator to a specific term in the function. The regulators
+        and the terms are replaced rather than extended, as functions derived
+        in the Hasse diagram share them (see create_function_from_element).
         """
         if regulator not in self.regulators:
-            self.regulators.append(regulator)
-        if term_id not in self.regulators_by_term.keys():
-            self.regulators_by_term[term_id] = [regulator]
-        elif regulator not in self.regulators_by_term[term_id]:
-            self.regulators_by_term[term_id].append(regulator)
+            self.regulators = self.regulators + [regulator]
+            self.clause_regulators = {}
+        self.compiled = None
+        term = self.regulators_by_term.get(term_id, ())
+        if regulator not in term:
+            self.regulators_by_term[term_id] = [*term, regulator]
 
     def print_function(self) -> str:
         """
@@ -157,6 +171,8 @@ class Function:
         Sets the list of regulatory nodes for this function.
         """
         self.regulators = new_regulators
+        self.clause_regulators = {}
+        self.compiled = None
 
     def set_regulators_by_term(self,
                                new_regulators_by_term: Dict[int, List[str]]) \
@@ -207,12 +223,14 @@ class Function:
         Adds a clause to the function.
         """
         self.pfh_add_clause(clause)
+        self.compiled = None
 
     def add_pfh_function(self, function: PFHFunction) -> None:
         """
         Sets the PyFunctionhood function representation for this function.
         """
         self.pfh_function = function
+        self.compiled = None
 
     def create_pfh_function(self) -> None:
         """
@@ -262,6 +280,78 @@ class Function:
         return [self.regulators[idx] for idx, bit
                 in enumerate(clause.get_signature()) if bit == 1]
 
+    def clause_to_regulators(self, clause: Clause) -> tuple:
+        """
+        Returns the regulators of a clause as an immutable tuple, shared by
+        every function with the same regulators that contains the clause.
+        """
+        signature = clause.get_signature().tobytes()
+        regulators = self.clause_regulators.get(signature)
+        if regulators is None:
+            regulators = tuple(self.bitarray_to_regulators(clause))
+            self.clause_regulators[signature] = regulators
+        return regulators
+
+    def compile(self, network) -> Tuple[Tuple[str, ...],
+                                        Tuple[Tuple[int, int], ...]]:
+        """
+        Returns the regulators of the function, and for each clause a pair of
+        masks over their positions: the regulators that must be 1 (positive
+        edges) and those that must be 0 (negative edges) for the clause to be
+        satisfied. Clauses with a regulator that has no edge to the node can
+        never be satisfied and are left out.
+        """
+        positions = {regulator: position
+                     for position, regulator in enumerate(self.regulators)}
+        masks = []
+        clauses = self.get_clauses() if self.get_n_clauses() else ()
+        for clause in clauses:
+            required_on = required_off = 0
+            for regulator in self.clause_to_regulators(clause):
+                edge = network.find_edge(regulator, self.node_id)
+                if edge is None:
+                    print(f"WARN: Missing edge from {regulator} to {self.node_id}")
+                    break
+                bit = 1 << positions[regulator]
+                if edge.get_sign() > 0:
+                    required_on |= bit
+                else:
+                    required_off |= bit
+            else:
+                masks.append((required_on, required_off))
+        return tuple(self.regulators), tuple(masks)
+
+    def get_compiled(self, network) -> Tuple[Tuple[str, ...],
+                                             Tuple[Tuple[int, int], ...]]:
+        """
+        Returns the compiled clauses of the function (see compile), compiled
+        once per topology of the network and recompiled after its edges are
+        flipped, added or removed.
+        """
+        compiled = self.compiled
+        if compiled is None or compiled[0] is not network or \
+                compiled[1] != network.get_version():
+            compiled = self.compiled = (network, network.get_version(),
+                                        *self.compile(network))
+        return compiled[2], compiled[3]
+
+    def evaluate(self, network, state: Mapping[str, int]) -> bool:
+        """
+        Returns whether some clause of the function is satisfied by the
+        labels of a state (e.g. one time step of a labeling).
+        """
+        regulators, masks = self.get_compiled(network)
+        values = 0
+        for position, regulator in enumerate(regulators):
+            # Regulators without an edge are not labeled in every labeling
+            if state.get(regulator):
+                values |= 1 << position
+        for required_on, required_off in masks:
+            if values & required_on == required_on and \
+                    not values & required_off:
+                return True
+        return False
+
     # pyfunctionhood wrapper
 
     def pfh_init(self, n_vars: int, clauses: Set[Clause]) -> None:
@@ -270,6 +360,7 @@ class Function:
         clauses.
         """
         self.pfh_function = PFHFunction(n_vars, clauses)
+        self.compiled = None
 
     def pfh_from_string(self, nvars: int, str_clauses: str) -> PFHFunction:
         """
@@ -440,11 +531,15 @@ class Function:
         new_func.set_distance_from_original(
             self.get_distance_from_original() + 1)
         new_func.set_son_consistent(element.is_consistent())
+        # The regulators list and the clause tuples are shared, not copied
         new_func.set_regulators(self.get_regulators())
+        new_func.clause_regulators = self.clause_regulators
 
         # Get clauses based on relationship type
         clauses = element.get_clauses()
-        new_func.set_regulators_by_term(self.get_active_regulators(clauses))
+        new_func.set_regulators_by_term(
+            {term: self.clause_to_regulators(clause)
+             for term, clause in enumerate(clauses, start=1)})
         new_func.add_pfh_function(element)
         return new_func
 
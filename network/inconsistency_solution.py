@@ -6,7 +6,7 @@ sets, and other related properties.
 """
 
 import json
-from typing import Dict
+from typing import Dict, Iterable, Mapping, Tuple
 from network.repair_set import Repair_Set
 from network.inconsistent_node import Inconsistent_Node
 from configuration import configuration
@@ -40,6 +40,18 @@ class Inconsistency_Solution:
         self.n_e_operations = 0
         self.n_repair_operations = 0
         self.has_impossibility = False  # Solution is impossible to repair
+        # False when the labeling is the best one found before the solving
+        # time limit, without proof of optimality
+        self.optimality_proven = True
+        # Vectorized_Labeling of the labels and updates, built on demand by
+        # the numpy evaluation backend (False if they cannot be vectorized)
+        self.vectorized = None
+        # Bit_Parallel_Labeling of the labels and updates, built on demand by
+        # the bitset evaluation backend (False if they cannot be packed)
+        self.bit_parallel = None
+        # Transition_Table of each node and regulators, built on demand when
+        # checking candidate functions
+        self.transition_tables = {}
 
     def get_i_nodes(self) -> Dict[str, Inconsistent_Node]:
         """
@@ -108,12 +120,84 @@ class Inconsistency_Solution:
         """
         return self.has_impossibility
 
+    def get_optimality_proven(self) -> bool:
+        """
+        Returns whether the labeling of the solution is proven optimal.
+        """
+        return self.optimality_proven
+
+    def get_vectorized(self):
+        """
+        Returns the vectorized labeling of the solution, if already built.
+        """
+        return self.vectorized
+
+    def get_bit_parallel(self):
+        """
+        Returns the bit-parallel labeling of the solution, if already built.
+        """
+        return self.bit_parallel
+
+    def get_transition_tables(self) -> Dict:
+        """
+        Returns the transition tables built for the solution, by node and
+        regulators, until its labels or updates change.
+        """
+        return self.transition_tables
+
+    def set_vectorized(self, vectorized) -> None:
+        """
+        Keeps the vectorized labeling of the solution until its labels or
+        updates change.
+        """
+        self.vectorized = vectorized
+
+    def set_bit_parallel(self, bit_parallel) -> None:
+        """
+        Keeps the bit-parallel labeling of the solution until its labels or
+        updates change.
+        """
+        self.bit_parallel = bit_parallel
+
+    def set_optimality_proven(self, optimality_proven: bool) -> None:
+        """
+        Sets whether the labeling of the solution is proven optimal.
+        """
+        self.optimality_proven = optimality_proven
+
     def set_impossibility(self, impossibility: bool) -> None:
         """
         Sets whether the solution is impossible to repair.
         """
         self.has_impossibility = impossibility
 
+    def get_repair_signature(
+            self, regulators: Mapping[str, Iterable[str]]) -> Tuple:
+        """
+        Returns a hashable summary of what the repair of the solution reads
+        without adding edges: the inconsistent nodes with their repair type
+        and topological error and, for each of them, the labels of the node
+        and its regulators and whether the node is updated, at every time
+        point of every profile. Labelings with the same signature differ
+        only in labels of other nodes.
+        """
+        signature = []
+        for node_id, i_node in self.i_nodes.items():
+            node_ids = [node_id] + sorted(regulators.get(node_id, ()))
+            labels = []
+            for profile in sorted(self.v_label):
+                profile_map = self.v_label[profile]
+                for time in sorted(profile_map):
+                    time_map = profile_map[time]
+                    updated = node_id in \
+                        self.updates.get(time, {}).get(profile, ())
+                    labels.append((profile, time, updated,
+                                   tuple(time_map.get(_id, -1)
+                                         for _id in node_ids)))
+            signature.append((node_id, i_node.get_repair_type(),
+                              i_node.has_topological_error(), tuple(labels)))
+        return tuple(signature)
+
     def compare_repairs(self, solution: "Inconsistency_Solution") -> int:
         """
         Compares the current solution with another solution to determine which
@@ -190,6 +274,9 @@ class Inconsistency_Solution:
         if time not in profile_map:
             profile_map[time] = {}
         profile_map[time][node_id] = value
+        self.vectorized = None
+        self.bit_parallel = None
+        self.transition_tables.clear()
 
     def add_update(self, time, profile, node_id: str) -> None:
         """
@@ -201,6 +288,9 @@ class Inconsistency_Solution:
         if profile not in time_map:
             time_map[profile] = []
         time_map[profile].append(node_id)
+        self.vectorized = None
+        self.bit_parallel = None
+        self.transition_tables.clear()
 
     def add_inconsistent_profile(self, profile, node_id: str) -> None:
         """
@@ -213,6 +303,33 @@ class Inconsistency_Solution:
             self.i_nodes_profiles[node_id] = []
         self.i_nodes_profiles[node_id].append(profile)
 
+    def add_solution(self, solution: "Inconsistency_Solution") -> None:
+        """
+        Adds the labels, updates and inconsistencies of a labeling of
+        another, disjoint part of the network to this labeling. The
+        inconsistent nodes are copied before any repair, so a labeling can
+        be added to several others.
+        """
+        for profile, times in solution.get_v_label().items():
+            profile_map = self.v_label.setdefault(profile, {})
+            for time, labels in times.items():
+                profile_map.setdefault(time, {}).update(labels)
+        for time, profiles in solution.get_updates().items():
+            time_map = self.updates.setdefault(time, {})
+            for profile, node_ids in profiles.items():
+                time_map.setdefault(profile, []).extend(node_ids)
+        for profile, node_ids in solution.get_i_profiles().items():
+            self.i_profiles.setdefault(profile, []).extend(node_ids)
+        for node_id, profiles in solution.get_i_nodes_profiles().items():
+            self.i_nodes_profiles.setdefault(node_id, []).extend(profiles)
+        for node_id, i_node in solution.get_i_nodes().items():
+            new_i_node = Inconsistent_Node(node_id, i_node.get_generalization())
+            new_i_node.set_repair_type(i_node.get_repair_type())
+            new_i_node.set_topological_error(i_node.has_topological_error())
+            self.i_nodes[node_id] = new_i_node
+        self.optimality_proven = self.optimality_proven \
+            and solution.get_optimality_proven()
+
     def add_repair_set(self, node_id: str, repair_set: Repair_Set) -> None:
         """
         Adds a repair set for the node with the given identifier and updates
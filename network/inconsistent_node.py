@@ -15,6 +15,11 @@ class Inconsistent_Node:
     Provides methods to manage repair sets, track repair operations, and
     determine if the node has been repaired.
     """
+    __slots__ = ('id', 'generalization', 'repair_set', 'n_topology_changes',
+                 'n_repair_operations', 'n_add_remove_operations',
+                 'n_flip_edges_operations', 'repaired', 'topological_error',
+                 'repair_type')
+
     def __init__(self, node_id: str, generalization: bool):
         """
         Initializes an inconsistent node with an identifier and a
@@ -5,7 +5,7 @@ The Network class provides methods to manage nodes, edges, and network-related
 properties such as input files and observations.
 """
 
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 from network.node import Node
 from network.edge import Edge
 
@@ -21,18 +21,31 @@ class Network:
         Initializes an empty network with no nodes, edges, or input files.
         """
         self.nodes = {}  # {'node_id_1': node_1, 'node_id_2': node_2, ...}
+        self.node_names = []  # Node identifiers by dense index ['node_id_1', 'node_id_2', ...]
+        self.version = 0  # Number of topology changes so far, telling derived data (e.g. compiled functions) whether it is stale
+        self.consistency_memo = None  # Consistency_Memo of the consistency checks of candidate functions, created on demand
+        self.journal = []  # Undo records of the topology changes made inside open transactions
+        self.transactions = []  # Journal length at the start of each open transaction
         # self.edges = []
         # self.graph = {} # {'node_id_1': ['node_id_2', 'node_id_3'], 'node_id_2': ['node_id_1'], ...}
-        self.graph = {}  # {'node_id_1': [edge_1_2, edge_1_3], 'node_id_2': [edge_2_1], ...}
-        self.regulators = {}  # Reverse of graph {'node_id_1': ['node_id_2'], 'node_id_2': ['node_id_1'], 'node_id_3': ['node_id_1'], ...}
+        self.graph = {}  # Nodes with outgoing edges {'node_id_1': {'node_id_2': edge_1_2, 'node_id_3': edge_1_3}, 'node_id_2': {'node_id_1': edge_2_1}, ...}
+        self.regulators = {}  # Reverse of graph {'node_id_1': {'node_id_2'}, 'node_id_2': {'node_id_1'}, 'node_id_3': {'node_id_1'}, ...}
         self.input_file_network = ''
+        self.model_facts = []  # Model facts (clingo symbols or program text) when the model was parsed through clingo or given in memory
         self.observation_files = []  # ['examples/boolean_cell_cycle/obs/ts/async/a_o3_t20.lp', 'examples/boolean_cell_cycle/obs/ss/attractors.lp']
+        self.observation_facts = []  # In-memory observation facts (clingo symbols or program text)
         self.observation_files_with_updater = []  # [('examples/fissionYeastDavidich2008/obs/ts/ssync/s_o1_t5.lp', <sync_updater.SyncUpdater object at 0x10c7bea90>)]
         self.updaters_name = set()
         self.updaters = set()
         self.has_ss_obs = False
         self.has_ts_obs = False
 
+    def get_consistency_memo(self):
+        return self.consistency_memo
+
+    def set_consistency_memo(self, consistency_memo) -> None:
+        self.consistency_memo = consistency_memo
+
     def get_updaters(self) -> Set:
         return self.updaters
 
@@ -60,31 +73,98 @@ class Network:
         """
         return self.nodes
 
+    def get_node_names(self) -> List[str]:
+        """
+        Returns the node identifiers ordered by their dense integer index.
+        """
+        return self.node_names
+
+    def get_node_index(self, node_id: str) -> int:
+        """
+        Returns the dense integer index of a node.
+        """
+        return self.nodes[node_id].get_index()
+
+    def get_node_name(self, index: int) -> str:
+        """
+        Returns the identifier of the node with the given dense integer index.
+        """
+        return self.node_names[index]
+
+    def get_version(self) -> int:
+        """
+        Returns the number of changes made to the nodes and edges of the
+        network, including flips and rolled back changes.
+        """
+        return self.version
+
     def get_edge(self, start_node_id: str, end_node_id: str) -> Edge:
         """
         Retrieves an edge between two nodes by their identifiers.
+        Raises ValueError if the edge does not exist.
+        """
+        edge = self.find_edge(start_node_id, end_node_id)
+        if edge is None:
+            raise ValueError('Edge does not exist!')
+        return edge
+
+    def find_edge(self, start_node_id: str, end_node_id: str) \
+            -> Optional[Edge]:
         """
-        # for edge in self.edges:
-        #     if edge.get_start_node().get_id() == start_node_id \
-        #             and edge.get_end_node().get_id() == end_node_id:
-        #         return edge
-        for edge in self.graph[start_node_id]:
-            if edge.get_end_node().get_id() == end_node_id:
-                return edge
-        raise ValueError('Edge does not exist!')
+        Retrieves an edge between two nodes by their identifiers in constant
+        time, or None if the edge does not exist.
+        """
+        edges = self.graph.get(start_node_id)
+        if edges is None:
+            return None
+        return edges.get(end_node_id)
 
     def get_graph(self) -> Dict[str, List[Edge]]:
         """
-        Returns the graph representation of the network.
+        Returns the graph representation of the network, mapping each node
+        to the list of its outgoing edges.
+        """
+        return {node_id: list(self.graph.get(node_id, {}).values())
+                for node_id in self.nodes}
+
+    def get_out_edges(self, start_node_id: str) -> Dict[str, Edge]:
+        """
+        Returns the outgoing edges of a node indexed by their end node.
         """
-        return self.graph
+        return self.graph.get(start_node_id, {})
 
-    def get_regulators(self) -> Dict[str, List[str]]:
+    def get_regulators(self) -> Dict[str, Set[str]]:
         """
         Returns the regulators of each node in the network.
         """
         return self.regulators
 
+    def get_components(self) -> List[List[str]]:
+        """
+        Returns the weakly connected components of the network, each as the
+        list of its node identifiers in node index order. Components are
+        ordered by their first node.
+        """
+        component_of = {}
+        components = []
+        for node_id in self.node_names:
+            if node_id in component_of:
+                continue
+            component = []
+            component_of[node_id] = len(components)
+            stack = [node_id]
+            while stack:
+                current = stack.pop()
+                component.append(current)
+                for neighbour in self.graph.get(current, {}).keys() | \
+                        self.regulators.get(current, set()):
+                    if neighbour not in component_of:
+                        component_of[neighbour] = len(components)
+                        stack.append(neighbour)
+            component.sort(key=self.get_node_index)
+            components.append(component)
+        return components
+
     # def get_edges(self) -> List[Edge]:
     #     return self.edges
 
@@ -94,12 +174,25 @@ class Network:
         """
         return self.input_file_network
 
+    def get_model_facts(self) -> List:
+        """
+        Returns the model facts parsed through clingo or given in memory, if
+        any.
+        """
+        return self.model_facts
+
     def get_observation_files(self) -> List:
         """
         Returns the list of observation files associated with the network.
         """
         return self.observation_files
 
+    def get_observation_facts(self) -> List:
+        """
+        Returns the in-memory observation facts associated with the network.
+        """
+        return self.observation_facts
+
     def get_observation_files_with_updater(self) -> List:
         """
         Returns the list of observation files associated with the network.
@@ -124,42 +217,120 @@ class Network:
         """
         node = self.get_node(node_id)
         if node is None:
-            node = Node(node_id)
+            node = Node(node_id, len(self.node_names))
             self.nodes[node_id] = node
-            self.graph[node_id] = []
+            self.node_names.append(node_id)
+            self.version += 1
         return node
 
     def add_edge(self, start_node: Node, end_node: Node, sign: int) -> None:
         """
         Adds a new edge between two nodes with the specified sign.
         """
-        try:
-            return self.get_edge(start_node.get_id(), end_node.get_id())
-        except ValueError:
-            edge = Edge(start_node, end_node, sign)
-            # self.edges.append(edge)
-            self.graph[edge.get_start_node().get_id()].append(edge)
-            if edge.get_end_node().get_id() not in self.regulators:
-                self.regulators[edge.get_end_node().get_id()] = \
-                    [edge.get_start_node().get_id()]
-            else:
-                self.regulators[edge.get_end_node().get_id()].append(
-                    edge.get_start_node().get_id())
-            # return edge
+        edge = self.find_edge(start_node.get_id(), end_node.get_id())
+        if edge is not None:
+            return edge
+        self.insert_edge(Edge(start_node, end_node, sign))
+        return None
+
+    def insert_edge(self, edge: Edge) -> None:
+        """
+        Inserts an edge object between two nodes that are not yet connected.
+        """
+        start_node_id = edge.get_start_node().get_id()
+        end_node_id = edge.get_end_node().get_id()
+        edges = self.graph.get(start_node_id)
+        if edges is None:  # Outgoing edges are only indexed once a node has one
+            edges = self.graph[start_node_id] = {}
+        edges[end_node_id] = edge
+        if end_node_id not in self.regulators:
+            self.regulators[end_node_id] = {start_node_id}
+        else:
+            self.regulators[end_node_id].add(start_node_id)
+        self.version += 1
+        if self.transactions:
+            self.journal.append(('insert', edge, None))
 
     def remove_edge(self, start_node: Node, end_node: Node) -> None:
         """
         Removes an edge between two nodes from the network.
         """
-        try:
-            edge_to_remove = self.get_edge(start_node.get_id(),
-                                           end_node.get_id())  # Find the edge to remove
-            self.graph[start_node.get_id()].remove(edge_to_remove)  # Remove the edge from the graph
-            self.regulators[end_node.get_id()].remove(start_node.get_id())  # Remove the start_node from the list of regulators for the end_node
-            if not self.regulators[end_node.get_id()]:  # If there are no more regulators for the end_node, remove the key from the regulators dictionary
-                del self.regulators[end_node.get_id()]
-        except ValueError:
-            print(f"No edge exists between {start_node.get_id()} and {end_node.get_id()}")
+        start_node_id = start_node.get_id()
+        end_node_id = end_node.get_id()
+        edges = self.graph.get(start_node_id)
+        edge = edges.pop(end_node_id, None) if edges is not None else None
+        if edge is None:
+            print(f"No edge exists between {start_node_id} and {end_node_id}")
+            return
+        regulators = self.regulators[end_node_id]
+        regulators.discard(start_node_id)  # Remove the start_node from the regulators of the end_node
+        if not regulators:  # If there are no more regulators for the end_node, remove the key from the regulators dictionary
+            del self.regulators[end_node_id]
+        self.version += 1
+        if self.transactions:
+            self.journal.append(('remove', edge, None))
+
+    def flip_edge(self, edge: Edge) -> None:
+        """
+        Flips the sign of an edge of the network.
+        """
+        edge.flip_sign()
+        self.version += 1
+        if self.transactions:
+            self.journal.append(('flip', edge, None))
+
+    def set_function(self, node: Node, function) -> None:
+        """
+        Replaces the function of a node of the network.
+        """
+        if self.transactions:
+            self.journal.append(('function', node, node.get_function()))
+        node.add_function(function)
+
+    def begin_transaction(self) -> None:
+        """
+        Starts recording the topology changes (edge additions, removals and
+        flips, and function replacements) made through the network so they
+        can be undone with rollback_transaction. Transactions can be nested.
+        """
+        self.transactions.append(len(self.journal))
+
+    def commit_transaction(self) -> None:
+        """
+        Keeps the changes made since the matching begin_transaction. Inside
+        an enclosing transaction they can still be undone by its rollback.
+        """
+        self.transactions.pop()
+        if not self.transactions:
+            self.journal.clear()
+
+    def rollback_transaction(self) -> None:
+        """
+        Undoes, in reverse order, the changes made since the matching
+        begin_transaction, in time proportional to the number of changes.
+        """
+        start = self.transactions.pop()
+        journal = self.journal
+        while len(journal) > start:
+            operation, target, previous = journal.pop()
+            if operation == 'function':
+                target.add_function(previous)
+                continue
+            start_node_id = target.get_start_node().get_id()
+            end_node_id = target.get_end_node().get_id()
+            if operation == 'flip':
+                target.flip_sign()
+            elif operation == 'insert':
+                del self.graph[start_node_id][end_node_id]
+                regulators = self.regulators[end_node_id]
+                regulators.discard(start_node_id)
+                if not regulators:
+                    del self.regulators[end_node_id]
+            else:
+                self.graph[start_node_id][end_node_id] = target
+                self.regulators.setdefault(end_node_id, set()).add(
+                    start_node_id)
+            self.version += 1
 
     def set_has_ss_obs(self, has_ss_obs: bool) -> None:
         """
@@ -179,12 +350,28 @@ class Network:
         """
         self.input_file_network = input_file_netowrk
 
+    def set_model_facts(self, model_facts: List) -> None:
+        """
+        Sets the model facts parsed through clingo or given in memory.
+        """
+        self.model_facts = model_facts
+
     def add_observation_file(self, observation_file: str) -> None:
         """
         Adds an observation file to the network.
         """
         self.observation_files.append(observation_file)
 
+    def add_observation_facts(self, observation_facts) -> None:
+        """
+        Adds in-memory observation facts (clingo symbols or program text) to
+        the network.
+        """
+        if isinstance(observation_facts, str):
+            self.observation_facts.append(observation_facts)
+        else:
+            self.observation_facts.extend(observation_facts)
+
     def add_observation_file_with_updater(self, observation_file: str, updater) -> None:
         """
         Adds an observation file and respective updater to the network.
@@ -0,0 +1,109 @@
+"""
+This module defines the Network_Cache class, which stores parsed networks on
+disk keyed by the content hash of their model file.
+Batch runs that revise the same model against many observation files can then
+skip parsing the model after the first run.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from network.network import Network
+
+# Bump whenever the layout of the cached data changes
+CACHE_FORMAT_VERSION = 1
+
+
+class Network_Cache:
+    """
+    Serializes the nodes, edges (with sign and fixed flag) and node functions
+    of a parsed network to a compact JSON file named after the SHA-256 of the
+    model file content. A changed model file hashes to a different entry, so
+    stale entries are never used.
+    """
+
+    @staticmethod
+    def get_key(content: bytes) -> str:
+        """
+        Returns the cache key of the given model file content.
+        """
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def get_path(cache_dir: str, key: str) -> str:
+        """
+        Returns the path of the cache entry with the given key.
+        """
+        return os.path.join(cache_dir, f'{key}.json')
+
+    @staticmethod
+    def load(network: Network, cache_dir: str, key: str) -> bool:
+        """
+        Populates the network from the cache entry with the given key.
+        Returns False, leaving the network untouched, if there is no valid
+        entry.
+        """
+        try:
+            with open(Network_Cache.get_path(cache_dir, key), 'r',
+                      encoding='utf-8') as file:
+                data = json.load(file)
+            if data['version'] != CACHE_FORMAT_VERSION or data['key'] != key:
+                return False
+            nodes = [str(node_id) for node_id in data['nodes']]
+            edges = [(str(start_id), str(end_id), int(sign), bool(fixed))
+                     for start_id, end_id, sign, fixed in data['edges']]
+            functions = [(str(node_id), [str(reg) for reg in regulators],
+                          {int(term_id): [str(reg) for reg in term]
+                           for term_id, term in terms})
+                         for node_id, regulators, terms in data['functions']]
+        except (OSError, KeyError, TypeError, ValueError):
+            return False
+
+        for node_id in nodes:
+            network.add_node(node_id)
+        for start_id, end_id, sign, fixed in edges:
+            network.add_edge(network.add_node(start_id),
+                             network.add_node(end_id), sign)
+            if fixed:
+                network.get_edge(start_id, end_id).set_fixed()
+        for node_id, regulators, regulators_by_term in functions:
+            function = network.add_node(node_id).get_function()
+            function.set_regulators(regulators)
+            function.set_regulators_by_term(regulators_by_term)
+        return True
+
+    @staticmethod
+    def save(network: Network, cache_dir: str, key: str) -> None:
+        """
+        Stores the network in the cache under the given key. The entry is
+        written to a temporary file and atomically renamed, so concurrent
+        runs never read a partially written entry.
+        """
+        data = {
+            'version': CACHE_FORMAT_VERSION,
+            'key': key,
+            'nodes': list(network.get_nodes()),
+            'edges': [[edge.get_start_node().get_id(),
+                       edge.get_end_node().get_id(),
+                       edge.get_sign(), int(edge.get_fixed())]
+                      for node_id in network.get_nodes()
+                      for edge in network.get_out_edges(node_id).values()],
+            'functions': [[node_id, node.get_function().get_regulators(),
+                           list(node.get_function().get_regulators_by_term()
+                                .items())]
+                          for node_id, node in network.get_nodes().items()
+                          if node.has_function()
+                          and node.get_function().get_regulators()]
+        }
+        tmp_path = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(data, file, separators=(',', ':'))
+            os.replace(tmp_path, Network_Cache.get_path(cache_dir, key))
+        except OSError as exc:
+            print(f'WARN!\tCannot write network cache to {cache_dir}: {exc}')
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
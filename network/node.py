@@ -13,12 +13,17 @@ class Node:
     A node has an identifier and an associated function, which can be managed
     using the provided methods.
     """
-    def __init__(self, node_id: str) -> None:
+    __slots__ = ('id', 'index', 'function')
+
+    def __init__(self, node_id: str, index: int = -1) -> None:
         """
-        Initializes a node with a given identifier and a default function.
+        Initializes a node with a given identifier and dense integer index (-1
+        when the node does not belong to a network). The default function is
+        only created when first requested.
         """
         self.id = node_id
-        self.function = Function(node_id)
+        self.index = index
+        self.function = None
 
     def add_function(self, function: Function) -> None:
         """
@@ -28,12 +33,27 @@ class Node:
 
     def get_function(self) -> Function:
         """
-        Returns the function associated with the node.
+        Returns the function associated with the node, creating an empty
+        function on first use.
         """
+        if self.function is None:
+            self.function = Function(self.id)
         return self.function
 
+    def has_function(self) -> bool:
+        """
+        Returns whether a function was created or set for the node.
+        """
+        return self.function is not None
+
     def get_id(self) -> str:
         """
         Returns the identifier of the node.
         """
         return self.id
+
+    def get_index(self) -> int:
+        """
+        Returns the dense integer index of the node in its network.
+        """
+        return self.index
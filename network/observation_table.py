@@ -0,0 +1,196 @@
+"""
+This module defines the Observation_Table class, a columnar view of the
+observations of a network.
+Observation files are read line by line and every profile is stored as a
+dense time x node array of signed bytes, so Python-side checks can inspect
+large observation sets without handing them to clingo.
+"""
+
+from array import array
+from typing import Iterable, List
+from network.network import Network
+from asp_helper import ASPHelper
+
+# Value of a node whose label is not observed
+MISSING = -1
+
+
+class Observation_Table:
+    """
+    Stores the obs_vlabel facts of steady-state (obs_vlabel(P,V,S)) and
+    time-series (obs_vlabel(P,T,V,S)) observations. The values of profile P
+    are kept in a flat array where the value of node i at time t is at
+    position t * n_nodes + i, with MISSING for unobserved values, i being the
+    index of the node in the network.
+    """
+
+    def __init__(self, network: Network) -> None:
+        """
+        Initializes an empty table for the nodes of a parsed network.
+        """
+        self.nodes = network.get_nodes()
+        self.node_names = list(network.get_node_names())
+        self.n_nodes = len(self.node_names)
+        self.profiles = {}  # {'profile_1': array('b'), ...}
+        self.n_times = {}  # {'profile_1': 3, ...}
+        self.steady_state = set()  # Profiles given as steady-state observations
+        self.experiments = []  # Profiles declared with exp/1, in reading order
+        self.n_ignored = 0  # Observations of nodes that are not in the network
+        self.n_conflicts = 0  # Observations contradicting an earlier value
+        self.n_invalid = 0  # Observations that could not be read
+
+    def load(self, file_name: str) -> int:
+        """
+        Reads the observations of a file, one line at a time, and returns the
+        number of obs_vlabel facts read.
+        """
+        try:
+            with open(file_name, 'r', encoding='utf-8') as file:
+                return self.load_lines(file)
+        except IOError as exc:
+            raise ValueError('ERROR!\tCannot open file ' + file_name) from exc
+
+    def load_lines(self, lines: Iterable[str]) -> int:
+        """
+        Reads the observations of the given lines and returns the number of
+        obs_vlabel facts read. The profiles of exp facts are recorded and
+        other predicates are skipped.
+        """
+        n_facts = 0
+        for line in lines:
+            line = line.split('%', 1)[0]
+            if 'obs_vlabel' not in line and 'exp' not in line:
+                continue
+            line = ''.join(line.split())
+            for name, args in ASPHelper.tokenize_predicates(line):
+                if name == 'exp':
+                    self.add_experiment(args)
+                    continue
+                if name != 'obs_vlabel':
+                    continue
+                fields = args.split(',')
+                try:
+                    if len(fields) == 3:
+                        self.add_value(fields[0], 0, fields[1],
+                                       int(fields[2]), True)
+                    elif len(fields) == 4:
+                        self.add_value(fields[0], int(fields[1]), fields[2],
+                                       int(fields[3]))
+                    else:
+                        raise ValueError(args)
+                except ValueError:
+                    print(f'WARN!\tInvalid observation: {name}({args}). Ignoring...')
+                    self.n_invalid += 1
+                    continue
+                n_facts += 1
+        return n_facts
+
+    def add_experiment(self, profile: str) -> None:
+        """
+        Records a profile declared with exp/1. Pools and ranges are not
+        expanded and count as invalid observations.
+        """
+        if any(token in profile for token in (',', ';', '..')):
+            self.n_invalid += 1
+        elif profile not in self.experiments:
+            self.experiments.append(profile)
+
+    def add_value(self, profile: str, time: int, node_id: str, value: int,
+                  steady_state: bool = False) -> None:
+        """
+        Records the observed value of a node at a time point of a profile.
+        Raises ValueError if the value is not 0 or 1 or the time is negative.
+        """
+        if value not in (0, 1) or time < 0:
+            raise ValueError(f'Invalid observation of {node_id} at time {time}: {value}')
+        node = self.nodes.get(node_id)
+        if node is None or node.get_index() >= self.n_nodes:
+            self.n_ignored += 1
+            return
+        values = self.profiles.get(profile)
+        if values is None:
+            values = self.profiles[profile] = array('b')
+            self.n_times[profile] = 0
+            if steady_state:
+                self.steady_state.add(profile)
+        n_times = self.n_times[profile]
+        if time >= n_times:
+            values.extend(array('b', [MISSING]) *
+                          ((time + 1 - n_times) * self.n_nodes))
+            self.n_times[profile] = time + 1
+        position = time * self.n_nodes + node.get_index()
+        if values[position] != MISSING and values[position] != value:
+            self.n_conflicts += 1
+        values[position] = value
+
+    def get_profiles(self) -> List[str]:
+        """
+        Returns the names of the observed profiles in reading order.
+        """
+        return list(self.profiles)
+
+    def get_experiments(self) -> List[str]:
+        """
+        Returns the profiles declared with exp/1 in reading order.
+        """
+        return self.experiments
+
+    def get_node_names(self) -> List[str]:
+        """
+        Returns the node names of the table, ordered by their column.
+        """
+        return self.node_names
+
+    def is_steady_state(self, profile: str) -> bool:
+        """
+        Returns whether a profile was given as a steady-state observation.
+        """
+        return profile in self.steady_state
+
+    def get_n_times(self, profile: str) -> int:
+        """
+        Returns the number of time points of a profile.
+        """
+        return self.n_times[profile]
+
+    def get_values(self, profile: str) -> array:
+        """
+        Returns the flat time x node array of values of a profile.
+        """
+        return self.profiles[profile]
+
+    def get_value(self, profile: str, time: int, node_id: str) -> int:
+        """
+        Returns the value of a node at a time point of a profile, or MISSING.
+        """
+        if time >= self.n_times.get(profile, 0):
+            return MISSING
+        return self.profiles[profile][time * self.n_nodes + self.nodes[node_id].get_index()]
+
+    def get_state(self, profile: str, time: int) -> array:
+        """
+        Returns the values of every node at a time point of a profile.
+        """
+        start = time * self.n_nodes
+        return self.profiles[profile][start:start + self.n_nodes]
+
+    def get_column(self, profile: str, node_id: str) -> array:
+        """
+        Returns the values of a node over the time points of a profile.
+        """
+        return self.profiles[profile][self.nodes[node_id].get_index()::
+                                       self.n_nodes]
+
+    def get_n_observed(self, profile: str) -> int:
+        """
+        Returns the number of observed values of a profile.
+        """
+        values = self.profiles[profile]
+        return len(values) - values.count(MISSING)
+
+    def is_complete(self, profile: str) -> bool:
+        """
+        Returns whether every node is observed at every time point of a
+        profile.
+        """
+        return MISSING not in self.profiles[profile]
@@ -16,6 +16,10 @@ class Repair_Set:
     Provides methods to manage repaired functions, flipped edges, removed
     edges, and added edges.
     """
+    __slots__ = ('repaired_functions', 'flipped_edges', 'removed_edges',
+                 'added_edges', 'n_topology_changes', 'n_repair_operations',
+                 'n_add_remove_operations', 'n_flip_edges_operations')
+
     def __init__(self):
         """
         Initializes an empty repair set with no repaired functions, edges, or
@@ -0,0 +1,28 @@
+import json
+from network.network import Network
+from asp_helper import ASPHelper
+
+# Shared by the tests that compare a consistency check with the one of clingo
+# on the whole network
+
+def create_network(model, updater, observations):
+    network = Network()
+    ASPHelper.parse_network_facts(network, model)
+    network.add_updater(updater())
+    ASPHelper.add_observation_facts(network, observations)
+    return network
+
+def get_i_node_ids(solution):
+    return sorted(solution.get_i_nodes())
+
+def get_v_label(solution, node_ids=None):
+    # Labels of the given nodes only, if any
+    return {profile: {time: {node_id: label for node_id, label in time_map.items()
+                             if node_ids is None or node_id in node_ids}
+                      for time, time_map in profile_map.items()}
+            for profile, profile_map in solution.get_v_label().items()}
+
+def summarize(solutions, *fields):
+    # Sorted JSON of the fields of each solution, comparable across checks
+    return sorted(json.dumps([field(solution) for field in fields], sort_keys=True)
+                  for solution in solutions)
@@ -0,0 +1,150 @@
+import os
+import tempfile
+import unittest
+from network.network import Network
+from asp_helper import ASPHelper
+from configuration import configuration
+
+class TestParseNetwork(unittest.TestCase):
+    def setUp(self):
+        self.network = Network()
+
+    def test_tokenize_predicates(self):
+        # Test splitting a line with several predicates
+        predicates = ASPHelper.tokenize_predicates('edge(a,b,1).functionOr(b,1..2).')
+        self.assertEqual(predicates, [('edge', 'a,b,1'), ('functionOr', 'b,1..2')])
+
+    def test_parse_model(self):
+        # Test parsing nodes, edges, fixed edges and functions
+        lines = ['vertex(a). vertex(b).\n',
+                 'edge(a, b, 1). edge(b,a,0). fixed(a,b).\n',
+                 'functionOr(b,1). functionAnd(b,1,a).\n']
+        self.assertEqual(ASPHelper.parse_network_lines(self.network, lines), 1)
+        self.assertIn('a', self.network.get_nodes())
+        self.assertIn('b', self.network.get_nodes())
+        edge = self.network.get_edge('a', 'b')
+        self.assertEqual(edge.get_sign(), 1)
+        self.assertTrue(edge.get_fixed())
+        self.assertFalse(self.network.get_edge('b', 'a').get_fixed())
+        function = self.network.get_node('b').get_function()
+        self.assertEqual(function.get_regulators_by_term(), {1: ['a']})
+
+    def test_parse_ignored_predicates(self):
+        # Test that malformed predicates are ignored with a warning
+        lines = ['vertex(a).\n', 'edge(a,a).\n', 'functionAnd(b,1,a).\n']
+        self.assertEqual(ASPHelper.parse_network_lines(self.network, lines), -1)
+
+    def test_parse_invalid_input(self):
+        # Test that invalid names and signs abort the parsing
+        self.assertEqual(ASPHelper.parse_network_lines(self.network, ['edge(A,b,1).\n']), -2)
+        self.assertEqual(ASPHelper.parse_network_lines(self.network, ['edge(a,b,2).\n']), -2)
+        self.assertEqual(ASPHelper.parse_network_lines(self.network, ['functionOr(a,1..0).\n']), -2)
+
+    def test_parse_warnings(self):
+        # Test that warnings that do not change the result are reported
+        warnings = []
+        self.assertEqual(ASPHelper.parse_network_lines(self.network, ['edge(a,b,1). fixed(b,a).\n'], warnings), 1)
+        self.assertEqual(len(warnings), 1)
+
+    def test_parse_cached_only_without_warnings(self):
+        # Test that a model parsed with warnings is not cached, so every run repeats them
+        cache_dir = configuration['network_cache_dir']
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'model.lp')
+            configuration['network_cache_dir'] = os.path.join(tmp_dir, 'cache')
+            os.mkdir(configuration['network_cache_dir'])
+            try:
+                for model, n_entries in (('edge(a,b,1). fixed(b,a).', 0), ('edge(a,b,1). fixed(a,b).', 1)):
+                    with open(file_name, 'w', encoding='utf-8') as file:
+                        file.write(model)
+                    self.network.set_input_file_network(file_name)
+                    self.assertEqual(ASPHelper.parse_network(self.network), 1)
+                    self.assertEqual(len(os.listdir(configuration['network_cache_dir'])), n_entries)
+            finally:
+                configuration['network_cache_dir'] = cache_dir
+
+    def test_parse_model_clingo(self):
+        # Test that parsing through clingo builds the same network and keeps
+        # the model facts for the consistency check
+        model = 'vertex(a). vertex(b).\nedge(a,b,1). edge(b,a,0). fixed(a,b).\n' \
+                'functionOr(b,1..2). functionAnd(b,1,a). functionAnd(b,2,b).\n'
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'model.lp')
+            with open(file_name, 'w', encoding='utf-8') as file:
+                file.write(model)
+            self.network.set_input_file_network(file_name)
+            self.assertEqual(ASPHelper.parse_network_clingo(self.network), 1)
+        expected = Network()
+        ASPHelper.parse_network_lines(expected, model.splitlines())
+        self.assertEqual(list(self.network.get_nodes()), list(expected.get_nodes()))
+        self.assertTrue(self.network.get_edge('a', 'b').get_fixed())
+        self.assertEqual(self.network.get_edge('b', 'a').get_sign(), 0)
+        self.assertEqual(self.network.get_node('b').get_function().get_regulators_by_term(),
+                         expected.get_node('b').get_function().get_regulators_by_term())
+        facts = {str(symbol) for symbol in self.network.get_model_facts()}
+        self.assertIn('functionOr(b,2)', facts)
+        self.assertIn('edge(a,b,1)', facts)
+
+    def test_parse_network_facts(self):
+        # Test that program text and tuples build the same network
+        model = 'vertex(a). edge(a,b,1). edge(b,a,0). fixed(a,b). functionOr(b,1). functionAnd(b,1,a).'
+        self.assertEqual(ASPHelper.parse_network_facts(self.network, model), 1)
+        from_tuples = Network()
+        facts = [('vertex', 'a'), ('edge', 'a', 'b', 1), ('edge', 'b', 'a', 0),
+                 ('fixed', 'a', 'b'), ('functionOr', 'b', 1), ('functionAnd', 'b', 1, 'a')]
+        self.assertEqual(ASPHelper.parse_network_facts(from_tuples, facts), 1)
+        for network in (self.network, from_tuples):
+            self.assertTrue(network.get_edge('a', 'b').get_fixed())
+            self.assertEqual(network.get_edge('b', 'a').get_sign(), 0)
+            self.assertEqual(network.get_node('b').get_function().get_regulators_by_term(), {1: ['a']})
+        self.assertEqual({str(symbol) for symbol in self.network.get_model_facts()},
+                         {str(symbol) for symbol in from_tuples.get_model_facts()})
+        self.assertEqual(ASPHelper.parse_network_facts(Network(), 'edge(a,b'), -2)
+
+    def test_parse_clingo_source_order(self):
+        # Test that the clingo parsers add nodes, edges and regulators in the
+        # order of the model, as the line parser does
+        model = 'edge(c,a,1). vertex(d). functionOr(a,1). functionAnd(a,1,c).\n' \
+                'edge(b,a,0). functionAnd(a,1,b). edge(c,b,1). edge(c,d,0). edge(a,c,1).\n'
+
+        def get_order(network):
+            return (list(network.get_nodes()),
+                    {node_id: [edge.get_end_node().get_id() for edge in edges]
+                     for node_id, edges in network.get_graph().items()},
+                    network.get_node('a').get_function().get_regulators())
+
+        expected = Network()
+        ASPHelper.parse_network_lines(expected, model.splitlines())
+        from_file = Network()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'model.lp')
+            with open(file_name, 'w', encoding='utf-8') as file:
+                file.write(model)
+            from_file.set_input_file_network(file_name)
+            self.assertEqual(ASPHelper.parse_network_clingo(from_file), 1)
+        from_facts = Network()
+        self.assertEqual(ASPHelper.parse_network_facts(from_facts, model), 1)
+        self.assertEqual(get_order(from_file), get_order(expected))
+        self.assertEqual(get_order(from_facts), get_order(expected))
+        self.assertNotIn('__source_order', {symbol.name for symbol in from_file.get_model_facts()})
+
+    def test_check_consistency_in_memory(self):
+        # Test a consistency check whose model and observations never touch disk
+        from updaters.steady_state_updater import SteadyStateUpdater
+        model = 'edge(a,b,1). edge(b,a,1). functionOr(b,1). functionAnd(b,1,a). ' \
+                'functionOr(a,1). functionAnd(a,1,b).'
+        self.assertEqual(ASPHelper.parse_network_facts(self.network, model), 1)
+        self.network.add_updater(SteadyStateUpdater())
+        self.network.set_has_ss_obs(True)
+        ASPHelper.add_observation_facts(self.network, [('exp', 's1'), ('obs_vlabel', 's1', 'a', 1)])
+        ASPHelper.add_observation_facts(self.network, 'obs_vlabel(s1,b,1).')
+        _, optimization = ASPHelper.check_consistency(self.network)
+        self.assertEqual(optimization, 0)
+        ASPHelper.add_observation_facts(self.network, [('exp', 's2'), ('obs_vlabel', 's2', 'a', 1),
+                                                       ('obs_vlabel', 's2', 'b', 0)])
+        solutions, optimization = ASPHelper.check_consistency(self.network)
+        self.assertGreater(optimization, 0)
+        self.assertTrue(solutions)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from network.inconsistency_solution import Inconsistency_Solution
+from network.tests.fixtures import create_network, get_i_node_ids, get_v_label, summarize
+from configuration import configuration
+from updaters.updater import Updater
+from updaters.component_decomposition import ComponentDecomposition
+from updaters.steady_state_updater import SteadyStateUpdater
+from updaters.sync_updater import SyncUpdater
+from updaters.async_updater import AsyncUpdater
+
+MODEL = 'edge(a,b,1). edge(b,c,0). edge(c,a,1). functionOr(b,1). functionAnd(b,1,a). ' \
+        'functionOr(c,1). functionAnd(c,1,b). functionOr(a,1). functionAnd(a,1,c). ' \
+        'edge(x,y,1). edge(y,x,0). functionOr(y,1). functionAnd(y,1,x). ' \
+        'functionOr(x,1). functionAnd(x,1,y).'
+
+OBSERVATIONS = {
+    SteadyStateUpdater: 'exp(s1). obs_vlabel(s1,a,1). obs_vlabel(s1,b,0). obs_vlabel(s1,x,1).',
+    SyncUpdater: 'exp(p1). obs_vlabel(p1,0,a,1). obs_vlabel(p1,0,b,0). obs_vlabel(p1,1,c,0). '
+                 'obs_vlabel(p1,0,x,1). obs_vlabel(p1,1,y,1). obs_vlabel(p1,2,x,1).',
+}
+OBSERVATIONS[AsyncUpdater] = OBSERVATIONS[SyncUpdater]
+
+def summarize_solutions(solutions):
+    return summarize(solutions, get_i_node_ids, get_v_label, Inconsistency_Solution.get_updates)
+
+class TestComponentDecomposition(unittest.TestCase):
+    def tearDown(self):
+        configuration['component_jobs'] = 1
+
+    def test_split(self):
+        decomposition = ComponentDecomposition.split(create_network(MODEL, SyncUpdater, OBSERVATIONS[SyncUpdater]))
+        components = decomposition.get_components()
+        self.assertEqual([node_ids for node_ids, _, _ in components], [['a', 'b', 'c'], ['x', 'y']])
+        # Test that the experiments and time points are shared by the components
+        for _, _, observations in components:
+            self.assertIn('exp(p1)', [str(fact) for fact in observations])
+            self.assertIn('time(p1,2)', [str(fact) for fact in observations])
+
+        # Test that updaters coupling the nodes are not decomposed
+        self.assertIsNone(ComponentDecomposition.split(create_network(MODEL, AsyncUpdater, OBSERVATIONS[AsyncUpdater])))
+
+    def test_same_results_as_whole_network(self):
+        for updater in (SteadyStateUpdater, SyncUpdater, AsyncUpdater):
+            expected, expected_optimization = Updater.check_consistency(create_network(MODEL, updater, OBSERVATIONS[updater]))
+            for jobs in (1, 2):
+                configuration['component_jobs'] = jobs
+                solutions, optimization = ComponentDecomposition.check_consistency(create_network(MODEL, updater, OBSERVATIONS[updater]))
+                self.assertEqual(optimization, expected_optimization)
+                self.assertEqual(summarize_solutions(solutions), summarize_solutions(expected))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import contextlib
+import io
+import unittest
+import main
+from network.tests.fixtures import create_network, get_i_node_ids, get_v_label, summarize
+from configuration import configuration
+from updaters.updater import Updater
+from updaters.cone_of_influence import ConeOfInfluence
+from updaters.component_decomposition import ComponentDecomposition
+from updaters.steady_state_updater import SteadyStateUpdater
+from updaters.sync_updater import SyncUpdater
+from updaters.async_updater import AsyncUpdater
+
+# a and b regulate the observed node c, which regulates the unobserved d, e
+# and g; d and e form a negative cycle, and f is an unobserved input of e
+MODEL = 'edge(a,b,1). edge(b,a,0). edge(a,c,1). edge(b,c,1). functionOr(a,1). functionAnd(a,1,b). ' \
+        'functionOr(b,1). functionAnd(b,1,a). functionOr(c,1). functionAnd(c,1,a). functionAnd(c,1,b). ' \
+        'edge(c,d,1). edge(e,d,0). edge(d,e,1). edge(f,e,1). functionOr(d,1). functionAnd(d,1,c). ' \
+        'functionAnd(d,1,e). functionOr(e,1). functionAnd(e,1,d). functionAnd(e,1,f). vertex(f). ' \
+        'edge(c,g,0). functionOr(g,1). functionAnd(g,1,c).'
+
+OBSERVATIONS = {
+    SteadyStateUpdater: 'exp(s1). obs_vlabel(s1,c,1). obs_vlabel(s1,a,0).',
+    SyncUpdater: 'exp(p1). obs_vlabel(p1,0,c,1). obs_vlabel(p1,1,c,0). obs_vlabel(p1,2,c,1). '
+                 'obs_vlabel(p1,3,c,0).',
+}
+OBSERVATIONS[AsyncUpdater] = OBSERVATIONS[SyncUpdater]
+
+def summarize_solutions(solutions, node_ids=None):
+    return sorted(set(summarize(solutions, get_i_node_ids, lambda solution: get_v_label(solution, node_ids))))
+
+def revise(network):
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        main.model_revision(network)
+    return output.getvalue()
+
+class TestConeOfInfluence(unittest.TestCase):
+    def setUp(self):
+        configuration['check_consistency'] = True
+
+    def tearDown(self):
+        configuration['check_consistency'] = False
+        configuration['cone_of_influence'] = False
+
+    def test_reduce(self):
+        # Test that the negative cycle is kept for steady states
+        cone = ConeOfInfluence.reduce(create_network(MODEL, SteadyStateUpdater, OBSERVATIONS[SteadyStateUpdater]))
+        self.assertEqual(cone.get_nodes(), {'a', 'b', 'c', 'd', 'e', 'f'})
+        self.assertEqual(cone.get_pruned(), ['g'])
+        # Test that time series prune every node downstream of the observations
+        cone = ConeOfInfluence.reduce(create_network(MODEL, SyncUpdater, OBSERVATIONS[SyncUpdater]))
+        self.assertEqual(cone.get_nodes(), {'a', 'b', 'c'})
+        self.assertEqual(sorted(cone.get_pruned()), ['d', 'e', 'f', 'g'])
+        self.assertNotIn('d', {str(argument) for fact in cone.get_model_facts()
+                               for argument in fact.arguments})
+
+        # Test that updaters choosing updates across the network are not reduced
+        self.assertIsNone(ConeOfInfluence.reduce(create_network(MODEL, AsyncUpdater, OBSERVATIONS[AsyncUpdater])))
+
+    def test_same_results_as_whole_network(self):
+        for updater in (SteadyStateUpdater, SyncUpdater):
+            expected, expected_optimization = Updater.check_consistency(create_network(MODEL, updater, OBSERVATIONS[updater]))
+            network = create_network(MODEL, updater, OBSERVATIONS[updater])
+            cone = ConeOfInfluence.reduce(network)
+            solutions, optimization = ConeOfInfluence.check_consistency(network)
+            self.assertEqual(optimization, expected_optimization)
+            # Test that the labelings agree on the cone and are completed
+            # with labels of an optimal labeling of the whole network
+            self.assertEqual(summarize_solutions(solutions, cone.get_nodes()),
+                             summarize_solutions(expected, cone.get_nodes()))
+            self.assertTrue(set(summarize_solutions(solutions)) <= set(summarize_solutions(expected)))
+
+    def test_single_time_point(self):
+        # Test that a time series with one time point is not completed as a steady state
+        network = create_network(MODEL, SyncUpdater, OBSERVATIONS[SyncUpdater] + ' exp(p2). obs_vlabel(p2,0,c,1).')
+        solutions, _ = ConeOfInfluence.check_consistency(network)
+        for solution in solutions:
+            self.assertEqual({node_id: label for node_id, label in solution.get_v_label()['p2'][0].items()
+                              if node_id in 'defg'}, {'d': 0, 'e': 0, 'f': 0, 'g': 0})
+
+    def test_decomposed_cone(self):
+        configuration['cone_of_influence'] = True
+        network = create_network(MODEL + ' edge(x,y,1). functionOr(y,1). functionAnd(y,1,x).', SyncUpdater,
+                                 OBSERVATIONS[SyncUpdater] + ' obs_vlabel(p1,0,y,1).')
+        self.assertEqual(len(ComponentDecomposition.split(network, ConeOfInfluence.reduce(network)).get_components()), 2)
+        expected, expected_optimization = Updater.check_consistency(network)
+        solutions, optimization = ComponentDecomposition.check_consistency(network)
+        self.assertEqual(optimization, expected_optimization)
+        self.assertTrue(set(summarize_solutions(solutions)) <= set(summarize_solutions(expected)))
+
+    def test_add_edge_from_pruned_node(self):
+        # c has to become 1 while its fixed regulator a stays 0, so the only
+        # repair adds an edge from the unobserved input f, outside the cone
+        model = 'edge(a,c,1). fixed(a,c). functionOr(c,1). functionAnd(c,1,a). vertex(f).'
+        observations = 'exp(p1). obs_vlabel(p1,0,a,0). obs_vlabel(p1,1,a,0). obs_vlabel(p1,0,c,0). ' \
+                       'obs_vlabel(p1,1,c,1).'
+        self.assertEqual(ConeOfInfluence.reduce(create_network(model, SyncUpdater, observations)).get_pruned(), ['f'])
+
+        # Test that the labelings are not reduced when they are repaired
+        configuration['check_consistency'] = False
+        self.assertIsNone(ConeOfInfluence.reduce(create_network(model, SyncUpdater, observations)))
+        expected = revise(create_network(model, SyncUpdater, observations))
+        configuration['cone_of_influence'] = True
+        repairs = revise(create_network(model, SyncUpdater, observations))
+        self.assertEqual(repairs, expected)
+        self.assertIn('Add edge (f,c) with sign 1.', repairs)
+        self.assertNotIn('Repair #2', repairs)
+
+if __name__ == '__main__':
+    unittest.main()
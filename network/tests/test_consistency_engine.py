@@ -0,0 +1,77 @@
+import unittest
+from network.network import Network
+from asp_helper import ASPHelper
+from updaters.updater import Updater
+from updaters.consistency_engine import ConsistencyEngine
+from updaters.steady_state_updater import SteadyStateUpdater
+from updaters.sync_updater import SyncUpdater
+from network.tests.fixtures import create_network, get_i_node_ids, get_v_label, summarize
+
+MODEL = 'edge(a,b,1). edge(b,c,0). edge(c,a,1). edge(d,c,1). fixed(a,b). ' \
+        'functionOr(b,1). functionAnd(b,1,a). functionOr(c,1..2). functionAnd(c,1,b). ' \
+        'functionAnd(c,2,d). functionOr(a,1). functionAnd(a,1,c).'
+
+OBSERVATIONS = {
+    'consistent': 'exp(s1). obs_vlabel(s1,a,1). obs_vlabel(s1,b,1). obs_vlabel(s1,c,1). obs_vlabel(s1,d,1).',
+    'inconsistent': 'exp(s1). obs_vlabel(s1,a,1). obs_vlabel(s1,b,0). obs_vlabel(s1,c,1). obs_vlabel(s1,d,0).',
+    'partial': 'exp(s1). exp(s2). obs_vlabel(s1,a,0). obs_vlabel(s2,b,1). obs_vlabel(s2,a,0).',
+}
+
+TIME_SERIES = {
+    'consistent': 'exp(p1). obs_vlabel(p1,0,a,1). obs_vlabel(p1,0,b,1). obs_vlabel(p1,0,c,1). obs_vlabel(p1,0,d,1). '
+                  'obs_vlabel(p1,1,a,1). obs_vlabel(p1,1,b,1). obs_vlabel(p1,1,c,1). obs_vlabel(p1,1,d,1).',
+    'inconsistent': 'exp(q1). exp(q2). obs_vlabel(q1,0,a,0). obs_vlabel(q1,0,c,1). obs_vlabel(q1,1,b,1). '
+                    'obs_vlabel(q2,0,a,0). obs_vlabel(q2,0,c,0). obs_vlabel(q2,1,b,0).',
+}
+
+class TestConsistencyEngine(unittest.TestCase):
+    def setUp(self):
+        self.network = Network()
+        ASPHelper.parse_network_facts(self.network, MODEL)
+        self.network.add_updater(SteadyStateUpdater())
+        self.network.set_has_ss_obs(True)
+
+    def test_same_results_as_single_checks(self):
+        engine = ConsistencyEngine(self.network)
+        for name, facts in OBSERVATIONS.items():
+            engine.add_observations(name, facts=facts)
+        for name, facts in OBSERVATIONS.items():
+            expected, expected_optimization = Updater.check_consistency(create_network(MODEL, SteadyStateUpdater, facts))
+            solutions, optimization = engine.check_consistency(name)
+            self.assertEqual(optimization, expected_optimization)
+            self.assertEqual(summarize(solutions, get_i_node_ids, get_v_label),
+                             summarize(expected, get_i_node_ids, get_v_label))
+        # Test that the program was grounded only once
+        self.assertEqual(engine.get_n_groundings(), 1)
+
+    def test_add_observations_after_check(self):
+        engine = ConsistencyEngine(self.network)
+        engine.add_observations('consistent', facts=OBSERVATIONS['consistent'])
+        self.assertEqual(engine.check_consistency('consistent')[1], 0)
+        engine.add_observations('inconsistent', facts=OBSERVATIONS['inconsistent'])
+        self.assertGreater(engine.check_consistency('inconsistent')[1], 0)
+        self.assertEqual(engine.check_consistency('consistent')[1], 0)
+        self.assertEqual(engine.get_n_groundings(), 2)
+        with self.assertRaises(ValueError):
+            engine.check_consistency('unknown')
+
+    def test_time_series_sets(self):
+        # Test that time series sets, whose rules pair profiles, are each
+        # checked in a control of their own
+        network = Network()
+        ASPHelper.parse_network_facts(network, MODEL)
+        network.add_updater(SyncUpdater())
+        network.set_has_ts_obs(True)
+        engine = ConsistencyEngine(network)
+        for name, facts in TIME_SERIES.items():
+            engine.add_observations(name, facts=facts)
+        for name, facts in TIME_SERIES.items():
+            expected, expected_optimization = Updater.check_consistency(create_network(MODEL, SyncUpdater, facts))
+            solutions, optimization = engine.check_consistency(name)
+            self.assertEqual(optimization, expected_optimization)
+            self.assertEqual(summarize(solutions, get_i_node_ids, get_v_label),
+                             summarize(expected, get_i_node_ids, get_v_label))
+        self.assertEqual(engine.get_n_groundings(), 2)
+
+if __name__ == '__main__':
+    unittest.main()
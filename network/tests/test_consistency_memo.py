@@ -0,0 +1,91 @@
+import unittest
+import main
+from network.network import Network
+from network.function import Function
+from network.consistency_memo import Consistency_Memo
+from network.inconsistency_solution import Inconsistency_Solution
+from network.transition_table import Transition_Table
+from configuration import configuration, Inconsistencies
+from updaters.sync_updater import SyncUpdater
+
+def create_network():
+    network = Network()
+    a, b = network.add_node('a'), network.add_node('b')
+    network.add_edge(a, b, 1)
+    function = Function('b')
+    function.add_regulator_to_term(1, 'a')
+    b.add_function(function)
+    network.add_updater(SyncUpdater())
+    return network, function
+
+class TestConsistencyMemo(unittest.TestCase):
+    def tearDown(self):
+        configuration['evaluation_backend'] = 'table'
+
+    def test_counters(self):
+        memo = Consistency_Memo(2)
+        self.assertIsNone(memo.get('a'))
+        memo.put('a', 0)
+        self.assertEqual(memo.get('a'), 0)
+        self.assertEqual((memo.get_hits(), memo.get_misses()), (1, 1))
+        self.assertEqual(memo.get_statistics(), {'hits': 1, 'misses': 1, 'size': 1, 'max_size': 2})
+        memo.clear()
+        self.assertEqual((memo.get_hits(), memo.get_misses(), memo.get_size()), (0, 0, 0))
+
+    def test_least_recently_used(self):
+        memo = Consistency_Memo(2)
+        memo.put('a', 1)
+        memo.put('b', 2)
+        memo.get('a')
+        memo.put('c', 3)
+        # 'b' is the least recently used result
+        self.assertIsNone(memo.get('b'))
+        self.assertEqual(memo.get('a'), 1)
+        self.assertEqual(memo.get('c'), 3)
+        self.assertEqual(memo.get_size(), 2)
+
+    def test_disabled(self):
+        memo = Consistency_Memo(0)
+        memo.put('a', 1)
+        self.assertIsNone(memo.get('a'))
+        self.assertEqual(memo.get_size(), 0)
+
+    def test_signature(self):
+        network, function = create_network()
+
+        def get_signature(labels):
+            labeling = Inconsistency_Solution()
+            for time, (label_a, label_b) in enumerate(labels):
+                labeling.add_v_label('p1', 'a', label_a, time)
+                labeling.add_v_label('p1', 'b', label_b, time)
+            return Transition_Table.get(network, labeling, function).get_signature()
+
+        # Test that labelings that agree on the regulator states of a node share the signature
+        self.assertEqual(get_signature([(1, 0), (1, 1), (0, 1), (0, 0)]),
+                         get_signature([(0, 1), (0, 0), (1, 0), (1, 1), (1, 1)]))
+        self.assertNotEqual(get_signature([(1, 0), (1, 1)]),
+                            get_signature([(1, 0), (1, 0)]))
+
+    def test_memoized_checks(self):
+        # Test that the checks of every backend are memoized
+        for backend in ('python', 'table', 'bitset'):
+            configuration['evaluation_backend'] = backend
+            network, function = create_network()
+            labeling = Inconsistency_Solution()
+            for time, (label_a, label_b) in enumerate([(1, 0), (0, 1)]):
+                labeling.add_v_label('p1', 'a', label_a, time)
+                labeling.add_v_label('p1', 'b', label_b, time)
+            self.assertEqual(main.n_func_inconsistent_with_label(network, labeling, function),
+                             Inconsistencies.CONSISTENT.value)
+            self.assertTrue(main.is_func_consistent_with_label(network, labeling, function))
+            memo = network.get_consistency_memo()
+            self.assertEqual((memo.get_hits(), memo.get_misses()), (1, 1))
+
+            # Test that flipping the edge is a different key
+            network.flip_edge(network.get_edge('a', 'b'))
+            self.assertEqual(main.n_func_inconsistent_with_label(network, labeling, function),
+                             Inconsistencies.SINGLE_INC_GEN.value)
+            self.assertEqual((memo.get_hits(), memo.get_misses()), (1, 2))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from network.tests.fixtures import create_network, get_v_label, summarize
+from configuration import configuration
+from updaters.updater import Updater
+from updaters.direct_check import DirectCheck
+from updaters.steady_state_updater import SteadyStateUpdater
+from updaters.sync_updater import SyncUpdater
+from updaters.async_updater import AsyncUpdater
+
+# c is an input, a is regulated by b and c and b by a
+MODEL = 'vertex(c). edge(b,a,1). edge(c,a,0). edge(a,b,1). functionOr(a,1..2). functionAnd(a,1,b). ' \
+        'functionAnd(a,2,c). functionOr(b,1). functionAnd(b,1,a).'
+
+OBSERVATIONS = {
+    SteadyStateUpdater: 'exp(s1). obs_vlabel(s1,a,1). obs_vlabel(s1,b,0). obs_vlabel(s1,c,1). '
+                        'exp(s2). obs_vlabel(s2,a,0). obs_vlabel(s2,b,1). obs_vlabel(s2,c,0).',
+    SyncUpdater: 'exp(p1). obs_vlabel(p1,0,a,0). obs_vlabel(p1,0,b,1). obs_vlabel(p1,0,c,1). '
+                 'obs_vlabel(p1,1,a,1). obs_vlabel(p1,1,b,1). obs_vlabel(p1,1,c,1). '
+                 'obs_vlabel(p1,2,a,1). obs_vlabel(p1,2,b,0). obs_vlabel(p1,2,c,1). '
+                 'exp(p2). obs_vlabel(p2,0,a,0). obs_vlabel(p2,0,b,1). obs_vlabel(p2,0,c,1). '
+                 'obs_vlabel(p2,1,a,0). obs_vlabel(p2,1,b,0). obs_vlabel(p2,1,c,1).',
+}
+
+def get_repairs(solution):
+    return sorted((node_id, node.get_repair_type(), node.has_topological_error())
+                  for node_id, node in solution.get_i_nodes().items())
+
+def summarize_solutions(solutions):
+    return summarize(solutions, get_repairs, get_v_label, lambda solution: sorted(solution.get_i_profiles()))
+
+class TestDirectCheck(unittest.TestCase):
+    def tearDown(self):
+        configuration['check_consistency'] = False
+
+    def test_same_results_as_clingo(self):
+        for check_consistency in (False, True):
+            configuration['check_consistency'] = check_consistency
+            for updater in (SteadyStateUpdater, SyncUpdater):
+                expected, expected_optimization = Updater.check_consistency(create_network(MODEL, updater, OBSERVATIONS[updater]))
+                solutions, optimization = DirectCheck.check_consistency(create_network(MODEL, updater, OBSERVATIONS[updater]))
+                self.assertEqual(optimization, expected_optimization)
+                self.assertEqual(summarize_solutions(solutions), summarize_solutions(expected))
+        # Test that the time series has a topological error on a
+        self.assertTrue(solutions[0].get_i_nodes()['a'].has_topological_error())
+
+    def test_fallback(self):
+        # Test that other updaters are left to clingo
+        self.assertIsNone(DirectCheck.check_consistency(create_network(MODEL, AsyncUpdater, OBSERVATIONS[SyncUpdater])))
+        # Test that partial observations are left to clingo
+        observations = OBSERVATIONS[SteadyStateUpdater].replace(' obs_vlabel(s2,c,0).', '')
+        self.assertIsNone(DirectCheck.check_consistency(create_network(MODEL, SteadyStateUpdater, observations)))
+        # Test that inputs changing value are left to clingo
+        observations = OBSERVATIONS[SyncUpdater].replace('obs_vlabel(p2,1,c,1)', 'obs_vlabel(p2,1,c,0)')
+        self.assertIsNone(DirectCheck.check_consistency(create_network(MODEL, SyncUpdater, observations)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 from pyfunctionhood.function import Function as PFHFunction
 from pyfunctionhood.clause import Clause as Clause
 from network.function import Function
+from network.network import Network
 
 class TestFunction(unittest.TestCase):
     def setUp(self):
@@ -44,6 +45,56 @@ class TestFunction(unittest.TestCase):
         self.assertEqual(len(self.function.get_regulators_by_term()[1]), 1)
         self.assertEqual(len(self.function.get_regulators()), 2)
 
+    def test_replacements_share_regulators(self):
+        for i in range(3):
+            self.function.add_regulator_to_term(i + 1, f'reg_{i + 1}')
+        self.function.create_pfh_function()
+        children = self.function.get_replacements(generalize=False)
+        self.assertTrue(children)
+
+        # Test that candidates share the regulators and clause tuples
+        terms = {}
+        for child in children:
+            self.assertIs(child.get_regulators(), self.function.get_regulators())
+            self.assertEqual(child.get_distance_from_original(), 1)
+            for regulators in child.get_regulators_by_term().values():
+                self.assertIsInstance(regulators, tuple)
+                self.assertIs(terms.setdefault(regulators, regulators), regulators)
+
+        # Test that extending a candidate leaves the original and the other candidates untouched
+        child = children[0]
+        term = child.get_regulators_by_term()[1]
+        child.add_regulator_to_term(1, 'reg_4')
+        self.assertEqual(self.function.get_regulators(), ['reg_1', 'reg_2', 'reg_3'])
+        self.assertEqual(child.get_regulators(), ['reg_1', 'reg_2', 'reg_3', 'reg_4'])
+        self.assertEqual(child.get_regulators_by_term()[1], [*term, 'reg_4'])
+        self.assertNotIn('reg_4', children[-1].get_regulators_by_term()[1])
+
+    def test_evaluate(self):
+        # (reg_1 && !reg_2) || reg_3
+        network = Network()
+        node = network.add_node('node_1')
+        for regulator, sign in (('reg_1', 1), ('reg_2', 0), ('reg_3', 1)):
+            network.add_edge(network.add_node(regulator), node, sign)
+        self.function.add_regulator_to_term(1, 'reg_1')
+        self.function.add_regulator_to_term(1, 'reg_2')
+        self.function.add_regulator_to_term(2, 'reg_3')
+        self.assertTrue(self.function.evaluate(network, {'reg_1': 1, 'reg_2': 0, 'reg_3': 0}))
+        self.assertFalse(self.function.evaluate(network, {'reg_1': 1, 'reg_2': 1, 'reg_3': 0}))
+        self.assertTrue(self.function.evaluate(network, {'reg_1': 0, 'reg_2': 1, 'reg_3': 1}))
+
+        # Test that the compiled clauses follow edge flips and their rollback
+        network.begin_transaction()
+        network.flip_edge(network.get_edge('reg_2', 'node_1'))
+        self.assertTrue(self.function.evaluate(network, {'reg_1': 1, 'reg_2': 1, 'reg_3': 0}))
+        network.rollback_transaction()
+        self.assertFalse(self.function.evaluate(network, {'reg_1': 1, 'reg_2': 1, 'reg_3': 0}))
+
+    def test_slots(self):
+        # Test that functions do not carry a per-instance dictionary
+        with self.assertRaises(AttributeError):
+            self.function.unknown_attribute = 1
+
     # def test_is_equal(self): # TODO
 
     # def test_get_parents(self):
@@ -84,5 +84,24 @@ class TestInconsistencySolution(unittest.TestCase):
         self.assertEqual(self.solution.get_n_e_operations(), 3)
         self.assertEqual(self.solution.get_n_repair_operations(), 4)
 
+    def test_get_repair_signature(self):
+        regulators = {'a': {'b'}}
+        self.solution.add_generalization('a')
+        for node_id, value in (('a', 1), ('b', 0), ('c', 0)):
+            self.solution.add_v_label('p1', node_id, value, 0)
+        other_solution = Inconsistency_Solution()
+        other_solution.add_generalization('a')
+        for node_id, value in (('c', 1), ('b', 0), ('a', 1)):
+            other_solution.add_v_label('p1', node_id, value, 0)
+
+        # Test that labels of nodes outside the regulators are left out
+        self.assertEqual(self.solution.get_repair_signature(regulators),
+                         other_solution.get_repair_signature(regulators))
+
+        # Test that labels of regulators are part of the signature
+        other_solution.add_v_label('p1', 'b', 1, 0)
+        self.assertNotEqual(self.solution.get_repair_signature(regulators),
+                            other_solution.get_repair_signature(regulators))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
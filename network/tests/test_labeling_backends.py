@@ -0,0 +1,114 @@
+import random
+import unittest
+from network.network import Network
+from network.function import Function
+from network.inconsistency_solution import Inconsistency_Solution
+from network.vectorized_labeling import Vectorized_Labeling
+from network.bit_parallel_labeling import Bit_Parallel_Labeling
+from configuration import Inconsistencies
+from updaters.steady_state_updater import SteadyStateUpdater
+from updaters.sync_updater import SyncUpdater
+from updaters.async_updater import AsyncUpdater
+from updaters.complete_updater import CompleteUpdater
+
+N_NODES = 5
+
+# Labelings checked against every profile and time point at once
+BACKENDS = [Bit_Parallel_Labeling]
+if Vectorized_Labeling.is_available():
+    BACKENDS.append(Vectorized_Labeling)
+
+def create_network(rng, updater):
+    network = Network()
+    nodes = [network.add_node(f'n{i}') for i in range(N_NODES)]
+    for node in nodes:
+        regulators = rng.sample(nodes, rng.randint(0, 3))
+        function = Function(node.get_id())
+        for regulator in regulators:
+            network.add_edge(regulator, node, rng.randint(0, 1))
+            function.add_regulator_to_term(rng.randint(1, len(regulators)), regulator.get_id())
+        # Terms are numbered from 1 without gaps
+        function.set_regulators_by_term({term: regulators for term, regulators in
+                                         enumerate(function.get_regulators_by_term().values(), start=1)})
+        node.add_function(function)
+    if updater is not SteadyStateUpdater:
+        network.add_updater(updater())
+    network.add_updater(SteadyStateUpdater())
+    network.set_has_ss_obs(True)
+    return network
+
+def create_labeling(rng, network):
+    labeling = Inconsistency_Solution()
+    for profile in ('p1', 'p2', 's1', 's2'):
+        n_times = rng.randint(2, 6) if profile.startswith('p') else 1
+        for time in range(n_times):
+            for node_id in network.get_node_names():
+                labeling.add_v_label(profile, node_id, rng.randint(0, 1), time)
+            if time < n_times - 1:
+                for node_id in rng.sample(network.get_node_names(), rng.randint(1, 2)):
+                    labeling.add_update(time, profile, node_id)
+    return labeling
+
+class TestLabelingBackends(unittest.TestCase):
+    def test_same_results_as_updaters(self):
+        rng = random.Random(0)
+        for updater in (SteadyStateUpdater, SyncUpdater, AsyncUpdater, CompleteUpdater):
+            for _ in range(30):
+                network = create_network(rng, updater)
+                labeling = create_labeling(rng, network)
+                if updater is SteadyStateUpdater:
+                    for profile in ('p1', 'p2'):
+                        del labeling.get_v_label()[profile]
+                for node in network.get_nodes().values():
+                    function = node.get_function()
+                    candidates = [function]
+                    if function.get_n_clauses():
+                        candidates += function.get_replacements(True) + function.get_replacements(False)
+                    for candidate in candidates:
+                        expected = {profile: (SteadyStateUpdater if profile.startswith('s') else updater)
+                                    .n_func_inconsistent_with_label_with_profile(network, labeling, candidate, profile)
+                                    for profile in labeling.get_v_label()}
+                        inconsistencies = set(expected.values()) - {Inconsistencies.CONSISTENT.value}
+                        for backend in BACKENDS:
+                            labels = backend.get(network, labeling)
+                            self.assertEqual(labels.n_func_inconsistent_with_profiles(network, candidate), expected)
+                            self.assertEqual(labels.is_func_consistent(network, candidate),
+                                             not any(expected.values()))
+                            self.assertEqual(labels.n_func_inconsistent(network, candidate),
+                                             inconsistencies.copy().pop() if len(inconsistencies) == 1 else
+                                             Inconsistencies.DOUBLE_INC.value if inconsistencies else
+                                             Inconsistencies.CONSISTENT.value)
+
+    def test_kept_until_labels_change(self):
+        for backend in BACKENDS:
+            rng = random.Random(1)
+            network = create_network(rng, SyncUpdater)
+            labeling = create_labeling(rng, network)
+            labels = backend.get(network, labeling)
+            self.assertIs(backend.get(network, labeling), labels)
+            labeling.add_v_label('p1', 'n0', 1, 0)
+            self.assertIsNot(backend.get(network, labeling), labels)
+
+    def test_unknown_updater(self):
+        # Test that time series are not checked at once without a known time series updater
+        for backend in BACKENDS:
+            rng = random.Random(2)
+            network = create_network(rng, SteadyStateUpdater)
+            self.assertIsNone(backend.get(network, create_labeling(rng, network)))
+
+    def test_bit_layout(self):
+        rng = random.Random(3)
+        network = create_network(rng, SyncUpdater)
+        labeling = Inconsistency_Solution()
+        for profile, labels in (('p1', [1, 0, 1]), ('p2', [0, 1])):
+            for time, label in enumerate(labels):
+                for node_id in network.get_node_names():
+                    labeling.add_v_label(profile, node_id, label, time)
+        # Test that bit t * n_profiles + p is the label at time t of profile p
+        bit_parallel = Bit_Parallel_Labeling.get(network, labeling)
+        self.assertEqual(bit_parallel.labels['n0'], 0b011001)
+        self.assertEqual(bit_parallel.labeled, 0b011111)
+        self.assertEqual(bit_parallel.transitions, 0b000111)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from network.network import Network
 from network.edge import Edge
+from network.function import Function
 
 class TestNetwork(unittest.TestCase):
     def setUp(self):
@@ -41,12 +42,93 @@ class TestNetwork(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.network.get_edge('node_2', 'non_existing_node')
 
+    def test_find_edge(self):
+        node_1 = self.network.add_node('node_1')
+        node_2 = self.network.add_node('node_2')
+        self.network.add_edge(node_1, node_2, 0)
+
+        # Test finding an existing edge
+        edge = self.network.find_edge('node_1', 'node_2')
+        self.assertEqual(edge.get_sign(), 0)
+
+        # Test that missing edges and nodes return None instead of raising
+        self.assertIsNone(self.network.find_edge('node_2', 'node_1'))
+        self.assertIsNone(self.network.find_edge('non_existing_node', 'node_1'))
+
+    def test_remove_edge(self):
+        node_1 = self.network.add_node('node_1')
+        node_2 = self.network.add_node('node_2')
+        node_3 = self.network.add_node('node_3')
+        self.network.add_edge(node_1, node_3, 1)
+        self.network.add_edge(node_2, node_3, 1)
+
+        # Test removing an edge keeps the remaining regulators
+        self.network.remove_edge(node_1, node_3)
+        self.assertIsNone(self.network.find_edge('node_1', 'node_3'))
+        self.assertEqual(self.network.get_regulators()['node_3'], {'node_2'})
+
+        # Test removing the last regulator removes the entry
+        self.network.remove_edge(node_2, node_3)
+        self.assertNotIn('node_3', self.network.get_regulators())
+        self.assertEqual(self.network.get_out_edges('node_2'), {})
+
+        # Test re-adding a removed edge
+        self.network.add_edge(node_1, node_3, 0)
+        self.assertEqual(self.network.get_edge('node_1', 'node_3').get_sign(), 0)
+
+    def test_rollback_transaction(self):
+        node_1 = self.network.add_node('node_1')
+        node_2 = self.network.add_node('node_2')
+        node_3 = self.network.add_node('node_3')
+        self.network.add_edge(node_1, node_3, 1)
+        edge = self.network.get_edge('node_1', 'node_3')
+        original_function = node_3.get_function()
+
+        self.network.begin_transaction()
+        self.network.remove_edge(node_1, node_3)
+        self.network.add_edge(node_2, node_3, 1)
+        self.network.set_function(node_3, Function('node_3'))
+
+        # Test that nested changes are undone by the inner rollback only
+        self.network.begin_transaction()
+        self.network.flip_edge(self.network.get_edge('node_2', 'node_3'))
+        self.network.rollback_transaction()
+        self.assertEqual(self.network.get_edge('node_2', 'node_3').get_sign(), 1)
+
+        # Test that the outer rollback restores the original topology
+        self.network.rollback_transaction()
+        self.assertIs(self.network.find_edge('node_1', 'node_3'), edge)
+        self.assertIsNone(self.network.find_edge('node_2', 'node_3'))
+        self.assertEqual(self.network.get_regulators(), {'node_3': {'node_1'}})
+        self.assertIs(node_3.get_function(), original_function)
+
+    def test_commit_transaction(self):
+        node_1 = self.network.add_node('node_1')
+        node_2 = self.network.add_node('node_2')
+
+        self.network.begin_transaction()
+        self.network.add_edge(node_1, node_2, 0)
+        self.network.commit_transaction()
+
+        # Test that committed changes are kept and no longer journaled
+        self.assertEqual(self.network.get_edge('node_1', 'node_2').get_sign(), 0)
+        self.assertEqual(self.network.journal, [])
+
     def test_add_node(self):
         # Test adding a new node   
         node = self.network.add_node('node_1')
         self.assertEqual(node.get_id(), 'node_1')
         self.assertIn('node_1', self.network.get_nodes())
     
+    def test_node_index(self):
+        # Test that nodes are indexed in insertion order
+        self.network.add_node('node_1')
+        self.network.add_node('node_2')
+        self.network.add_node('node_1')
+        self.assertEqual(self.network.get_node_names(), ['node_1', 'node_2'])
+        self.assertEqual(self.network.get_node_index('node_2'), 1)
+        self.assertEqual(self.network.get_node_name(0), 'node_1')
+
     def test_add_edge(self):
         # Create mock nodes
         node_1 = self.network.add_node('node_1')
@@ -68,6 +150,26 @@ class TestNetwork(unittest.TestCase):
         self.assertEqual(self.network.get_graph(), {})
         self.assertEqual(self.network.get_regulators(), {})
 
+        # Test that nodes without outgoing edges map to an empty edge list
+        self.network.add_node('node_1')
+        self.assertEqual(self.network.get_graph(), {'node_1': []})
+        self.assertEqual(self.network.get_out_edges('node_1'), {})
+        self.assertFalse(self.network.get_node('node_1').has_function())
+
+    def test_get_components(self):
+        # Test that edges connect nodes regardless of their direction
+        for node_id in ('node_1', 'node_2', 'node_3', 'node_4', 'node_5'):
+            self.network.add_node(node_id)
+        self.network.add_edge(self.network.get_node('node_3'), self.network.get_node('node_1'), 1)
+        self.network.add_edge(self.network.get_node('node_4'), self.network.get_node('node_2'), 0)
+        self.network.add_edge(self.network.get_node('node_3'), self.network.get_node('node_5'), 1)
+        self.assertEqual(self.network.get_components(),
+                         [['node_1', 'node_3', 'node_5'], ['node_2', 'node_4']])
+
+        # Test that an edge between components merges them
+        self.network.add_edge(self.network.get_node('node_2'), self.network.get_node('node_5'), 1)
+        self.assertEqual(len(self.network.get_components()), 1)
+
     # def test_remove_edge(self):
     #     self.network.remove_edge(1, 2)
     #     self.assertIsNone(self.network.get_edge(1, 2))
@@ -0,0 +1,61 @@
+import os
+import json
+import tempfile
+import unittest
+from network.network import Network
+from network.network_cache import Network_Cache
+
+class TestNetworkCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = self.tmp_dir.name
+        self.network = Network()
+        node_1 = self.network.add_node('node_1')
+        node_2 = self.network.add_node('node_2')
+        self.network.add_node('node_3')
+        self.network.add_edge(node_1, node_2, 1)
+        self.network.add_edge(node_2, node_1, 0)
+        self.network.get_edge('node_1', 'node_2').set_fixed()
+        function = node_2.get_function()
+        function.add_regulator_to_term(2, 'node_1')
+        function.add_regulator_to_term(1, 'node_2')
+        self.key = Network_Cache.get_key(b'model')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_save_and_load(self):
+        # Test that a cached network is restored with the same structure
+        Network_Cache.save(self.network, self.cache_dir, self.key)
+        network = Network()
+        self.assertTrue(Network_Cache.load(network, self.cache_dir, self.key))
+        self.assertEqual(list(network.get_nodes()), ['node_1', 'node_2', 'node_3'])
+        edge = network.get_edge('node_1', 'node_2')
+        self.assertEqual(edge.get_sign(), 1)
+        self.assertTrue(edge.get_fixed())
+        self.assertEqual(network.get_edge('node_2', 'node_1').get_sign(), 0)
+        self.assertFalse(network.get_edge('node_2', 'node_1').get_fixed())
+        function = network.get_node('node_2').get_function()
+        self.assertEqual(function.get_regulators(), ['node_1', 'node_2'])
+        self.assertEqual(function.get_regulators_by_term(), {2: ['node_1'], 1: ['node_2']})
+
+    def test_load_missing_entry(self):
+        # Test that a different content hash is a cache miss
+        Network_Cache.save(self.network, self.cache_dir, self.key)
+        network = Network()
+        self.assertFalse(Network_Cache.load(network, self.cache_dir, Network_Cache.get_key(b'other')))
+        self.assertEqual(network.get_nodes(), {})
+
+    def test_load_invalid_entry(self):
+        # Test that corrupted and outdated entries are ignored
+        path = Network_Cache.get_path(self.cache_dir, self.key)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write('{"version": 1, "key":')
+        self.assertFalse(Network_Cache.load(Network(), self.cache_dir, self.key))
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({'version': 0, 'key': self.key, 'nodes': [], 'edges': [], 'functions': []}, file)
+        self.assertFalse(Network_Cache.load(Network(), self.cache_dir, self.key))
+        self.assertEqual(os.listdir(self.cache_dir), [os.path.basename(path)])
+
+if __name__ == '__main__':
+    unittest.main()
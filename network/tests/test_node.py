@@ -24,6 +24,13 @@ class TestNode(unittest.TestCase):
         self.node.add_function(self.function)
         self.assertEqual(self.node.get_function().get_node_id(), 'test_function')
 
+    def test_lazy_function(self):
+        # Test that the default function is only created on first use
+        self.assertFalse(self.node.has_function())
+        function = self.node.get_function()
+        self.assertTrue(self.node.has_function())
+        self.assertIs(self.node.get_function(), function)
+
     def test_get_id(self):
         self.assertEqual(self.node.get_id(), 'test_node')
 
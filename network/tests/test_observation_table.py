@@ -0,0 +1,61 @@
+import unittest
+from network.network import Network
+from network.observation_table import MISSING, Observation_Table
+
+class TestObservationTable(unittest.TestCase):
+    def setUp(self):
+        self.network = Network()
+        for node_id in ('a', 'b', 'c'):
+            self.network.add_node(node_id)
+        self.table = Observation_Table(self.network)
+
+    def test_load_time_series(self):
+        lines = ['exp(p1). exp(p2).\n',
+                 'obs_vlabel(p1,0,a,1). obs_vlabel(p1,0,b,0). % obs_vlabel(p1,0,c,1).\n',
+                 'obs_vlabel( p1, 2, c, 1 ).\n',
+                 'obs_vlabel(p2,0,a,0).\n']
+        self.assertEqual(self.table.load_lines(lines), 4)
+        self.assertEqual(self.table.get_profiles(), ['p1', 'p2'])
+        self.assertEqual(self.table.get_experiments(), ['p1', 'p2'])
+        self.assertEqual(self.table.get_n_times('p1'), 3)
+        self.assertEqual(self.table.get_value('p1', 0, 'a'), 1)
+        self.assertEqual(self.table.get_value('p1', 0, 'c'), MISSING)
+        self.assertEqual(self.table.get_value('p1', 5, 'c'), MISSING)
+        self.assertEqual(list(self.table.get_state('p1', 0)), [1, 0, MISSING])
+        self.assertEqual(list(self.table.get_column('p1', 'c')), [MISSING, MISSING, 1])
+        self.assertEqual(self.table.get_n_observed('p1'), 3)
+        self.assertFalse(self.table.is_complete('p1'))
+        self.assertFalse(self.table.is_steady_state('p1'))
+
+    def test_load_steady_state(self):
+        lines = ['obs_vlabel(s1,a,1). obs_vlabel(s1,b,0). obs_vlabel(s1,c,1).\n',
+                 'obs_vlabel(s1,d,1). obs_vlabel(s1,a,0).\n']
+        self.assertEqual(self.table.load_lines(lines), 5)
+        self.assertTrue(self.table.is_steady_state('s1'))
+        self.assertTrue(self.table.is_complete('s1'))
+        self.assertEqual(self.table.get_n_times('s1'), 1)
+        # Test that unknown nodes are ignored and contradictions counted
+        self.assertEqual(self.table.n_ignored, 1)
+        self.assertEqual(self.table.n_conflicts, 1)
+
+    def test_invalid_observations(self):
+        lines = ['exp(p1;p2). obs_vlabel(p1,0..2,a,1). obs_vlabel(p1,0,b,1).\n']
+        self.assertEqual(self.table.load_lines(lines), 1)
+        self.assertEqual(self.table.get_experiments(), [])
+        self.assertEqual(self.table.n_invalid, 2)
+
+    def test_invalid_values(self):
+        # Test that only 0 and 1 at non-negative times are stored
+        lines = ['obs_vlabel(p1,0,a,2). obs_vlabel(p1,0,b,200). obs_vlabel(p1,0,c,-1).\n',
+                 'obs_vlabel(p1,-1,a,1). obs_vlabel(p1,0,a,1).\n']
+        self.assertEqual(self.table.load_lines(lines), 1)
+        self.assertEqual(self.table.n_invalid, 4)
+        self.assertEqual(list(self.table.get_state('p1', 0)), [1, MISSING, MISSING])
+        with self.assertRaises(ValueError):
+            self.table.add_value('p1', 0, 'a', MISSING)
+        with self.assertRaises(ValueError):
+            self.table.add_value('p1', -1, 'a', 0)
+        self.assertEqual(self.table.get_n_times('p1'), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import random
+import unittest
+from network.network import Network
+from network.function import Function
+from network.inconsistency_solution import Inconsistency_Solution
+from network.transition_table import Transition_Table
+from configuration import Inconsistencies
+from updaters.steady_state_updater import SteadyStateUpdater
+from updaters.sync_updater import SyncUpdater
+from updaters.async_updater import AsyncUpdater
+from updaters.complete_updater import CompleteUpdater
+
+def create_network(rng, updater):
+    network = Network()
+    nodes = [network.add_node(f'n{i}') for i in range(4)]
+    for node in nodes:
+        function = Function(node.get_id())
+        for term, regulator in enumerate(rng.sample(nodes, rng.randint(2, 3)), start=1):
+            network.add_edge(regulator, node, rng.randint(0, 1))
+            function.add_regulator_to_term(term, regulator.get_id())
+        node.add_function(function)
+    network.add_updater(updater())
+    network.add_updater(SteadyStateUpdater())
+    network.set_has_ss_obs(True)
+    return network
+
+def create_labeling(rng, network):
+    labeling = Inconsistency_Solution()
+    for profile in ('p1', 'p2', 's1'):
+        n_times = rng.randint(2, 8) if profile.startswith('p') else 1
+        for time in range(n_times):
+            for node_id in network.get_node_names():
+                labeling.add_v_label(profile, node_id, rng.randint(0, 1), time)
+            if time < n_times - 1:
+                labeling.add_update(time, profile, rng.choice(network.get_node_names()))
+    return labeling
+
+def n_func_inconsistent(network, labeling, function, updater):
+    # Combination of the profiles as in main.n_func_inconsistent_with_label
+    result = Inconsistencies.CONSISTENT.value
+    for profile in labeling.get_v_label():
+        ret = (SteadyStateUpdater if profile.startswith('s') else updater) \
+            .n_func_inconsistent_with_label_with_profile(network, labeling, function, profile)
+        if result == Inconsistencies.CONSISTENT.value:
+            result = ret
+        elif ret not in (result, Inconsistencies.CONSISTENT.value):
+            result = Inconsistencies.DOUBLE_INC.value
+    return result
+
+class TestTransitionTable(unittest.TestCase):
+    def test_same_results_as_updaters(self):
+        rng = random.Random(0)
+        for updater in (SyncUpdater, AsyncUpdater, CompleteUpdater):
+            for _ in range(30):
+                network = create_network(rng, updater)
+                labeling = create_labeling(rng, network)
+                for node in network.get_nodes().values():
+                    function = node.get_function()
+                    function.create_pfh_function()
+                    for candidate in [function] + function.get_replacements(True) + \
+                            function.get_replacements(False):
+                        table = Transition_Table.get(network, labeling, candidate)
+                        self.assertEqual(table.n_func_inconsistent(network, candidate),
+                                         n_func_inconsistent(network, labeling, candidate, updater))
+
+    def test_patterns(self):
+        network = create_network(random.Random(1), SyncUpdater)
+        labeling = Inconsistency_Solution()
+        # The same transition repeated in a time series is stored once
+        for time in range(10):
+            for node_id in network.get_node_names():
+                labeling.add_v_label('p1', node_id, 1, time)
+        function = network.get_node('n0').get_function()
+        table = Transition_Table.get(network, labeling, function)
+        self.assertEqual(table.get_n_patterns(), 1)
+        self.assertIs(Transition_Table.get(network, labeling, function), table)
+
+        # Test that the table is rebuilt when the labels change
+        labeling.add_v_label('p1', 'n0', 0, 10)
+        self.assertIsNot(Transition_Table.get(network, labeling, function), table)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+import io
+import random
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from types import SimpleNamespace
+from network.network import Network
+from asp_helper import ASPHelper
+from configuration import configuration
+from updaters.updater import Updater
+from updaters.steady_state_updater import SteadyStateUpdater
+from updaters.sync_updater import SyncUpdater
+from updaters.async_updater import AsyncUpdater
+
+def random_network(n_nodes, n_observed):
+    # Random model with partial steady-state observations, whose optimal
+    # labelings take long to prove and enumerate
+    rng = random.Random(0)
+    facts = []
+    for i in range(n_nodes):
+        regulators = rng.sample(range(n_nodes), 3)
+        facts.append(f'functionOr(n{i},1..2).')
+        for term, regulator in enumerate(regulators):
+            facts.append(f'edge(n{regulator},n{i},{rng.randint(0, 1)}). functionAnd(n{i},{term % 2 + 1},n{regulator}).')
+    facts.append('exp(s1).')
+    for i in rng.sample(range(n_nodes), n_observed):
+        facts.append(f'obs_vlabel(s1,n{i},{rng.randint(0, 1)}).')
+    network = Network()
+    ASPHelper.parse_network_facts(network, ' '.join(facts))
+    network.add_updater(SteadyStateUpdater())
+    return network
+
+def random_time_series(updater, n_nodes, n_times):
+    # Random model with half of the nodes observed at each time point of two
+    # experiments
+    rng = random.Random(1)
+    facts = []
+    for i in range(n_nodes):
+        regulators = rng.sample(range(n_nodes), 2)
+        facts.append(f'functionOr(n{i},1..2).')
+        for term, regulator in enumerate(regulators):
+            facts.append(f'edge(n{regulator},n{i},{rng.randint(0, 1)}). functionAnd(n{i},{term + 1},n{regulator}).')
+    for exp in ('p1', 'p2'):
+        facts.append(f'exp({exp}).')
+        for time in range(n_times):
+            for i in rng.sample(range(n_nodes), n_nodes // 2):
+                facts.append(f'obs_vlabel({exp},{time},n{i},{rng.randint(0, 1)}).')
+    network = Network()
+    ASPHelper.parse_network_facts(network, ' '.join(facts))
+    network.add_updater(updater())
+    return network
+
+class TimedOutControl:
+    # Control whose solve hands on_model the models found before optimality
+    # is proven (all of them if proven is True) and then reports the time
+    # limit as reached
+    def __init__(self, ctl, proven=False):
+        self.ctl = ctl
+        self.proven = proven
+
+    def solve(self, on_model, async_):
+        def on_unproven_model(model):
+            if self.proven or not model.optimality_proven:
+                on_model(model)
+        self.ctl.solve(on_model=on_unproven_model)
+        return TimedOutHandle()
+
+class TimedOutHandle:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def wait(self, timeout):
+        return False
+
+    def cancel(self):
+        pass
+
+    def get(self):
+        return SimpleNamespace(satisfiable=True)
+
+def create_grounded_control(network):
+    ctl = Updater.create_control(network)
+    ASPHelper.add_facts(ctl, network.get_observation_facts())
+    Updater.ground(ctl)
+    return ctl
+
+class TestUpdater(unittest.TestCase):
+    def tearDown(self):
+        configuration['solver_parallel_mode'] = ''
+        configuration['solver_opt_strategy'] = ''
+        configuration['solver_time_limit'] = 0
+        configuration['topological_encoding'] = 'pairwise'
+
+    def test_solver_arguments(self):
+        # Test the default single-threaded optimal enumeration
+        self.assertEqual(Updater.get_solver_arguments(), ['--opt-mode=optN'])
+
+        # Test that configured threads and strategy are passed to clingo
+        configuration['solver_parallel_mode'] = '4,split'
+        configuration['solver_opt_strategy'] = 'usc'
+        self.assertEqual(Updater.get_solver_arguments(),
+                         ['--opt-mode=optN', '--parallel-mode=4,split', '--opt-strategy=usc'])
+
+    def test_is_valid_solver_argument(self):
+        self.assertTrue(Updater.is_valid_solver_argument('--configuration=trendy'))
+        self.assertFalse(Updater.is_valid_solver_argument('--configuration=unknown'))
+        self.assertFalse(Updater.is_valid_solver_argument('--parallel-mode=many'))
+
+    def test_time_limit_not_reached(self):
+        network = random_network(8, 8)
+        expected, expected_optimization = Updater.check_consistency(network)
+        configuration['solver_time_limit'] = 60
+        solutions, optimization = Updater.check_consistency(network)
+        self.assertEqual(optimization, expected_optimization)
+        self.assertEqual(len(solutions), len(expected))
+        self.assertTrue(all(solution.get_optimality_proven() for solution in solutions))
+
+    def test_time_limit_reached(self):
+        # Test that the best labelings found so far are returned unproven,
+        # with the warning on the standard error only
+        network = random_network(20, 10)
+        _, expected_optimization = Updater.check_consistency(network)
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            solutions, optimization = Updater.solve_consistency_anytime(
+                TimedOutControl(create_grounded_control(network)), 1)
+        self.assertTrue(solutions)
+        self.assertEqual(optimization, expected_optimization)
+        self.assertFalse(any(solution.get_optimality_proven() for solution in solutions))
+        self.assertEqual(stdout.getvalue(), '')
+        self.assertIn('before proving optimality', stderr.getvalue())
+
+        # Test that the optimal labelings enumerated so far are kept proven
+        with redirect_stderr(io.StringIO()):
+            solutions, optimization = Updater.solve_consistency_anytime(
+                TimedOutControl(create_grounded_control(network), True), 1)
+        self.assertEqual(optimization, expected_optimization)
+        self.assertTrue(all(solution.get_optimality_proven() for solution in solutions))
+
+    def test_stream_consistency(self):
+        network = random_network(8, 3)
+        expected, expected_optimization = Updater.check_consistency(network)
+        self.assertGreater(len(expected), 1)
+        streamed = []
+        optimization = Updater.stream_consistency(
+            network, lambda labeling, _: streamed.append(labeling) is None, 1)
+        self.assertEqual(optimization, expected_optimization)
+        self.assertEqual(sorted(str(labeling.get_v_label()) for labeling in streamed),
+                         sorted(str(labeling.get_v_label()) for labeling in expected))
+
+        # Test that solving stops when the consumer returns False
+        streamed = []
+        Updater.stream_consistency(network, lambda labeling, _: streamed.append(labeling), 1)
+        self.assertEqual(len(streamed), 1)
+
+    def test_stream_consistency_consume_error(self):
+        # Test that errors of the consumer are not reported as failed checks
+        def consume(labeling, optimization):
+            raise KeyError('repair')
+
+        with self.assertRaises(KeyError):
+            Updater.stream_consistency(random_network(8, 3), consume, 1)
+
+    def test_get_statistics(self):
+        network = random_network(8, 8)
+        ctl = Updater.create_control(network)
+        ASPHelper.add_facts(ctl, network.get_observation_facts())
+        ground_time = Updater.ground(ctl)
+        solutions, _ = Updater.solve_consistency(ctl)
+        statistics = Updater.get_statistics(ctl, network, ground_time)
+        self.assertEqual(statistics['updaters'], ['SteadyStateUpdater'])
+        self.assertEqual(statistics['ground']['time'], ground_time)
+        self.assertGreater(statistics['ground']['rules'], 0)
+        self.assertEqual(statistics['solve']['optimal_models'], len(solutions))
+        self.assertEqual(statistics['solve']['models'],
+                         statistics['solve']['optimal_models'] +
+                         statistics['solve']['optimization_steps'])
+
+    def test_grouped_topological_encoding(self):
+        # Test that both encodings give the same optimal labelings
+        for updater in (SyncUpdater, AsyncUpdater):
+            network = random_time_series(updater, 4, 6)
+            expected, expected_optimization = Updater.check_consistency(network)
+            configuration['topological_encoding'] = 'grouped'
+            solutions, optimization = Updater.check_consistency(network)
+            configuration['topological_encoding'] = 'pairwise'
+            self.assertEqual(optimization, expected_optimization)
+            self.assertEqual(sorted(str(solution.get_v_label()) + str(solution.get_i_nodes().keys()) for solution in solutions),
+                             sorted(str(solution.get_v_label()) + str(solution.get_i_nodes().keys()) for solution in expected))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+"""
+This module defines the Transition_Table class, which reduces the labels of
+an inconsistency solution to the distinct regulator states of a node.
+Only the labels of the regulators of a node and the label that follows them
+decide whether a candidate function of the node is consistent, and these
+pairs repeat heavily in long or many-profile time series, so candidates are
+checked once per distinct regulator state instead of once per time step.
+"""
+
+from typing import Dict, List, Mapping, Optional, Tuple
+from network.function import Function
+from network.inconsistency_solution import Inconsistency_Solution
+from configuration import Inconsistencies
+
+# Time series updaters whose consistency checks are reproduced, and whether
+# they only update the nodes listed in the updates of the labeling
+TIME_SERIES_UPDATERS = {'SyncUpdater': False, 'AsyncUpdater': True,
+                        'CompleteUpdater': True}
+
+# Labels that follow a regulator state, as bits
+FOLLOWED_BY_0 = 1
+FOLLOWED_BY_1 = 2
+
+
+class Transition_Table:
+    """
+    Regulator states of a node in a labeling, as bitmasks over the positions
+    of the regulators of a function (see Function.compile), each with the
+    labels of the node that follow it: its own label in a steady state and
+    its label at the next time point in a time series, when the node is
+    updated. A candidate function is then inconsistent, as with the updaters,
+    if it is 1 in a state followed by 0 (particularization) or 0 in a state
+    followed by 1 (generalization).
+    """
+
+    def __init__(self, regulators: Tuple[str, ...],
+                 patterns: Dict[int, int]) -> None:
+        """
+        Initializes a table with the regulators of its states and the
+        {regulator state: FOLLOWED_BY_0 | FOLLOWED_BY_1} patterns.
+        """
+        self.regulators = regulators
+        self.patterns = patterns
+        self.signature = None  # Hashable copy of the patterns, built on demand
+
+    @staticmethod
+    def get_time_series_updater(network) -> Optional[str]:
+        """
+        Returns the name of the time series updater of the network, or None
+        if it has none or one whose checks are not reproduced here.
+        """
+        updater_names = {updater.__class__.__name__
+                         for updater in network.get_updaters()}
+        updater_names.discard('SteadyStateUpdater')
+        if len(updater_names) != 1 or \
+                not updater_names <= TIME_SERIES_UPDATERS.keys():
+            return None
+        return updater_names.pop()
+
+    @staticmethod
+    def get_states(network, profile_map: Mapping) -> Tuple[bool, List]:
+        """
+        Returns whether a profile of a labeling is checked as a steady state,
+        as in the consistency checks of main, and the states it is checked
+        on: its only state, or its states at time points 0, 1, ... before
+        the first missing one.
+        """
+        if len(profile_map) == 1 and network.get_has_ss_obs():
+            return True, [next(iter(profile_map.values()))]
+        states = []
+        while len(states) in profile_map:
+            states.append(profile_map[len(states)])
+        return False, states
+
+    @staticmethod
+    def build(network, labeling: Inconsistency_Solution,
+              function: Function) -> Optional["Transition_Table"]:
+        """
+        Builds the table of the node of a function over the regulators of
+        the function. Returns None if some profile is a time series and the
+        network has no time series updater whose checks are reproduced here.
+        """
+        node_id = function.get_node_id()
+        regulators = tuple(function.get_regulators())
+        updater = Transition_Table.get_time_series_updater(network)
+        updates = labeling.get_updates()
+        patterns = {}
+        for profile, profile_map in labeling.get_v_label().items():
+            steady_state, states = \
+                Transition_Table.get_states(network, profile_map)
+            if steady_state:
+                transitions = [(states[0], states[0])]
+            elif updater is None:
+                return None
+            else:
+                transitions = [
+                    (states[time], states[time + 1])
+                    for time in range(len(states) - 1)
+                    if not TIME_SERIES_UPDATERS[updater] or
+                    node_id in updates.get(time, {}).get(profile, ())]
+            for state, following in transitions:
+                key = 0
+                for position, regulator in enumerate(regulators):
+                    if state.get(regulator):
+                        key |= 1 << position
+                patterns[key] = patterns.get(key, 0) | \
+                    (FOLLOWED_BY_1 if following[node_id] else FOLLOWED_BY_0)
+        return Transition_Table(regulators, patterns)
+
+    @staticmethod
+    def get(network, labeling: Inconsistency_Solution,
+            function: Function) -> Optional["Transition_Table"]:
+        """
+        Returns the table of the node of a function over its regulators,
+        built on the first call and kept in the labeling until its labels or
+        updates change, or None if it cannot be built.
+        """
+        key = (function.get_node_id(), tuple(function.get_regulators()))
+        tables = labeling.get_transition_tables()
+        if key not in tables:
+            tables[key] = Transition_Table.build(network, labeling, function)
+        return tables[key]
+
+    def get_n_patterns(self) -> int:
+        """
+        Returns the number of distinct regulator states.
+        """
+        return len(self.patterns)
+
+    def get_signature(self) -> Tuple[Tuple[str, ...], frozenset]:
+        """
+        Returns the regulators and patterns of the table as a hashable value,
+        equal for the tables of labelings that agree on the regulator states
+        of the node and the labels that follow them.
+        """
+        if self.signature is None:
+            self.signature = (self.regulators,
+                              frozenset(self.patterns.items()))
+        return self.signature
+
+    def n_func_inconsistent(self, network, function: Function) -> int:
+        """
+        Returns the inconsistency of a function with clauses with the
+        labeling (see Inconsistencies), as main.n_func_inconsistent_with_label
+        does. The function must have the regulators of the table.
+        """
+        _, masks = function.get_compiled(network)
+        particularize = generalize = False
+        for state, following in self.patterns.items():
+            if any(state & required_on == required_on and
+                   not state & required_off
+                   for required_on, required_off in masks):
+                particularize |= bool(following & FOLLOWED_BY_0)
+            else:
+                generalize |= bool(following & FOLLOWED_BY_1)
+            if particularize and generalize:
+                return Inconsistencies.DOUBLE_INC.value
+        if particularize:
+            return Inconsistencies.SINGLE_INC_PART.value
+        if generalize:
+            return Inconsistencies.SINGLE_INC_GEN.value
+        return Inconsistencies.CONSISTENT.value
+
+    def is_func_consistent(self, network, function: Function) -> bool:
+        """
+        Returns whether a function with clauses is consistent with every
+        profile of the labeling.
+        """
+        return self.n_func_inconsistent(network, function) == \
+            Inconsistencies.CONSISTENT.value
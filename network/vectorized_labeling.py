@@ -0,0 +1,206 @@
+"""
+This module defines the Vectorized_Labeling class, a dense NumPy view of the
+labels of an inconsistency solution.
+Candidate functions are then checked against every profile and time point of
+the labeling with a few array operations instead of walking the nested label
+dictionaries one time step at a time. NumPy is an optional dependency: the
+class is only usable when it is installed (see is_available).
+"""
+
+from typing import Dict, List, Optional
+from network.function import Function
+from network.inconsistency_solution import Inconsistency_Solution
+from network.transition_table import Transition_Table, TIME_SERIES_UPDATERS
+from configuration import Inconsistencies
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, see is_available
+    np = None
+
+
+class Vectorized_Labeling:
+    """
+    Labels of a labeling as a profile x time x node uint8 array, with the
+    nodes at their index in the network. A profile with a single time point
+    is a steady state when the network has steady-state observations, as in
+    the consistency checks of main; the transitions of the other profiles
+    are checked with the semantics of the time series updater of the network.
+    Only the time points 0, 1, ... before the first missing one are used, as
+    the updaters do.
+    """
+
+    def __init__(self, network, labeling: Inconsistency_Solution) -> None:
+        """
+        Builds the arrays of a labeling. Raises ValueError if some profile is
+        a time series and the network has no vectorized time series updater.
+        """
+        v_label = labeling.get_v_label()
+        self.profiles = list(v_label)
+        self.nodes = network.get_nodes()
+        updater = Transition_Table.get_time_series_updater(network)
+        n_profiles = len(self.profiles)
+        self.steady_state = np.zeros(n_profiles, dtype=bool)
+        states = []
+        for p, profile in enumerate(self.profiles):
+            self.steady_state[p], profile_states = \
+                Transition_Table.get_states(network, v_label[profile])
+            if not self.steady_state[p] and updater is None:
+                raise ValueError('Time series without a vectorized updater')
+            states.append(profile_states)
+
+        n_times = max((len(profile_states) for profile_states in states),
+                      default=1)
+        self.labels = np.zeros((n_profiles, max(n_times, 1),
+                                len(network.get_node_names())),
+                               dtype=np.uint8)
+        # Transitions from time t to t + 1 checked in each profile
+        self.transitions = np.zeros((n_profiles, max(n_times - 1, 0)),
+                                    dtype=bool)
+        for p, profile_states in enumerate(states):
+            for time, state in enumerate(profile_states):
+                row = self.labels[p, time]
+                for node_id, value in state.items():
+                    node = self.nodes.get(node_id)
+                    if node is not None:
+                        row[node.get_index()] = value
+            if not self.steady_state[p]:
+                self.transitions[p, :len(profile_states) - 1] = True
+
+        # Nodes updated at each transition, None if every node is
+        self.updated = None
+        if updater is not None and TIME_SERIES_UPDATERS[updater]:
+            self.updated = np.zeros(self.labels.shape[:1] +
+                                    self.transitions.shape[1:] +
+                                    self.labels.shape[2:], dtype=bool)
+            updates = labeling.get_updates()
+            for time in range(self.transitions.shape[1]):
+                for p, profile in enumerate(self.profiles):
+                    for node_id in updates.get(time, {}).get(profile, ()):
+                        node = self.nodes.get(node_id)
+                        if node is not None:
+                            self.updated[p, time, node.get_index()] = True
+
+    @staticmethod
+    def is_available() -> bool:
+        """
+        Returns whether NumPy is installed.
+        """
+        return np is not None
+
+    @staticmethod
+    def get(network, labeling: Inconsistency_Solution) \
+            -> Optional["Vectorized_Labeling"]:
+        """
+        Returns the vectorized labeling, built on the first call and kept in
+        the labeling until its labels or updates change, or None if its
+        profiles cannot be checked with arrays or NumPy is not installed.
+        """
+        if np is None:
+            return None
+        vectorized = labeling.get_vectorized()
+        if vectorized is None:
+            try:
+                vectorized = Vectorized_Labeling(network, labeling)
+            except ValueError:
+                vectorized = False
+            labeling.set_vectorized(vectorized)
+        return vectorized or None
+
+    def get_profiles(self) -> List[str]:
+        """
+        Returns the profiles of the labeling, in array order.
+        """
+        return self.profiles
+
+    def evaluate(self, network, function: Function):
+        """
+        Returns the profile x time boolean array of the values of a function
+        at every labeled state.
+        """
+        regulators, masks = function.get_compiled(network)
+        if not masks:
+            return np.zeros(self.labels.shape[:2], dtype=bool)
+        values = self.labels[:, :, [self.nodes[regulator].get_index()
+                                    for regulator in regulators]]
+        positions = range(len(regulators))
+        required_on = np.array([[on >> position & 1 for position in positions]
+                                for on, _ in masks], dtype=np.int32)
+        required_off = np.array([[off >> position & 1
+                                  for position in positions]
+                                 for _, off in masks], dtype=np.int32)
+        satisfied = (values @ required_on.T == required_on.sum(axis=1)) & \
+            (values @ required_off.T == 0)
+        return satisfied.any(axis=2)
+
+    def get_index(self, function: Function) -> int:
+        """
+        Returns the index of the node of a function.
+        """
+        return self.nodes[function.get_node_id()].get_index()
+
+    def n_func_inconsistent_by_profile(self, network, function: Function):
+        """
+        Returns the array of the inconsistency (see Inconsistencies) of a
+        function with each profile, as the n_func_inconsistent_with_label_with_profile
+        method of the updater of the profile does.
+        """
+        node = self.labels[:, :, self.get_index(function)]
+        n_clauses = function.get_n_clauses()
+        values = self.evaluate(network, function) if n_clauses else None
+        result = np.full(len(self.profiles), Inconsistencies.CONSISTENT.value)
+        if n_clauses:
+            steady_state = self.steady_state
+            result[steady_state & values[:, 0] & (node[:, 0] != 1)] = \
+                Inconsistencies.SINGLE_INC_PART.value
+            result[steady_state & ~values[:, 0] & (node[:, 0] != 0)] = \
+                Inconsistencies.SINGLE_INC_GEN.value
+        if not self.transitions.shape[1]:
+            return result
+
+        checked = self.transitions
+        if self.updated is not None:
+            checked = checked & self.updated[:, :, self.get_index(function)]
+        following = node[:, 1:]
+        if n_clauses:
+            particularize = (checked & values[:, :-1] & (following != 1)).any(axis=1)
+            generalize = (checked & ~values[:, :-1] & (following != 0)).any(axis=1)
+            result[particularize] = Inconsistencies.SINGLE_INC_PART.value
+            result[generalize] = Inconsistencies.SINGLE_INC_GEN.value
+            result[particularize & generalize] = Inconsistencies.DOUBLE_INC.value
+        else:
+            # Inputs keep the label they have at their first update
+            first = node[np.arange(len(self.profiles)), checked.argmax(axis=1)]
+            result[(checked & (following != first[:, None])).any(axis=1)] = \
+                Inconsistencies.DOUBLE_INC.value
+        return result
+
+    def n_func_inconsistent(self, network, function: Function) -> int:
+        """
+        Returns the inconsistency of a function with the whole labeling: the
+        inconsistency shared by every inconsistent profile, or a double
+        inconsistency if they differ.
+        """
+        inconsistencies = set(self.n_func_inconsistent_by_profile(
+            network, function).tolist())
+        inconsistencies.discard(Inconsistencies.CONSISTENT.value)
+        if not inconsistencies:
+            return Inconsistencies.CONSISTENT.value
+        if len(inconsistencies) == 1:
+            return inconsistencies.pop()
+        return Inconsistencies.DOUBLE_INC.value
+
+    def is_func_consistent(self, network, function: Function) -> bool:
+        """
+        Returns whether a function is consistent with every profile.
+        """
+        return not self.n_func_inconsistent_by_profile(network,
+                                                       function).any()
+
+    def n_func_inconsistent_with_profiles(self, network, function: Function) \
+            -> Dict[str, int]:
+        """
+        Returns the inconsistency of a function with each profile by name.
+        """
+        return dict(zip(self.profiles, self.n_func_inconsistent_by_profile(
+            network, function).tolist()))
@@ -0,0 +1,123 @@
+"""
+Benchmark of the bitset evaluation backend.
+
+Generates trajectories of a random network as a labeling of many profiles
+and, for every updater, checks the functions of every node and their parents
+and children in the Hasse diagram (the candidates of a repair) against it,
+one profile and time step at a time with the updater and with the profiles
+packed into the bits of ints with a Bit_Parallel_Labeling, reporting both
+times and checking that the inconsistencies agree. Packing the labels is
+included in the bitset time.
+
+Usage:
+    python3 scripts/bench_bit_parallel_labeling.py [n_profiles [n_times [n_nodes]]]
+"""
+
+import os
+import sys
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from network.network import Network  # noqa: E402
+from network.function import Function  # noqa: E402
+from network.inconsistency_solution import Inconsistency_Solution  # noqa: E402
+from network.bit_parallel_labeling import Bit_Parallel_Labeling  # noqa: E402
+from updaters.sync_updater import SyncUpdater  # noqa: E402
+from updaters.async_updater import AsyncUpdater  # noqa: E402
+from updaters.complete_updater import CompleteUpdater  # noqa: E402
+
+DEFAULT_N_PROFILES = 64
+DEFAULT_N_TIMES = 50
+DEFAULT_N_NODES = 20
+MAX_REGULATORS = 4
+
+
+def get_network(n_nodes: int, updater, seed: int = 0) -> Network:
+    """
+    Returns a network in which every node has up to MAX_REGULATORS random
+    regulators, each in its own term.
+    """
+    rng = random.Random(seed)
+    network = Network()
+    nodes = [network.add_node(f'n{i}') for i in range(n_nodes)]
+    for node in nodes:
+        function = Function(node.get_id())
+        regulators = rng.sample(nodes, rng.randint(1, MAX_REGULATORS))
+        for term, regulator in enumerate(regulators, start=1):
+            network.add_edge(regulator, node, rng.randint(0, 1))
+            function.add_regulator_to_term(term, regulator.get_id())
+        node.add_function(function)
+    network.add_updater(updater())
+    return network
+
+
+def get_labeling(network: Network, n_profiles: int, n_times: int,
+                 synchronous: bool, seed: int = 0) -> Inconsistency_Solution:
+    """
+    Returns a labeling of trajectories of the network from random initial
+    states, updating every node (synchronous) or one random node at every
+    time step, so that the functions of the network are consistent with it
+    and the checks of the candidates are not cut short.
+    """
+    rng = random.Random(seed)
+    labeling = Inconsistency_Solution()
+    nodes = list(network.get_nodes().values())
+    for profile in range(n_profiles):
+        state = {node.get_id(): rng.randint(0, 1) for node in nodes}
+        for t in range(n_times):
+            for node_id, value in state.items():
+                labeling.add_v_label(f'p{profile}', node_id, value, t)
+            updated = nodes if synchronous else [rng.choice(nodes)]
+            for node in updated:
+                labeling.add_update(t, f'p{profile}', node.get_id())
+            previous = state
+            state = dict(previous)
+            for node in updated:
+                state[node.get_id()] = int(
+                    node.get_function().evaluate(network, previous))
+    return labeling
+
+
+def main(argv) -> None:
+    """
+    Checks the candidate functions with every updater, per profile and
+    bit-parallel.
+    """
+    n_profiles = int(argv[1]) if len(argv) > 1 else DEFAULT_N_PROFILES
+    n_times = int(argv[2]) if len(argv) > 2 else DEFAULT_N_TIMES
+    n_nodes = int(argv[3]) if len(argv) > 3 else DEFAULT_N_NODES
+    print(f'{n_profiles} profiles, {n_times} time points, {n_nodes} nodes')
+    print(f'{"updater":>16} {"candidates":>10} {"python (s)":>10} '
+          f'{"bitset (s)":>10} {"speedup":>8}')
+    for updater in (SyncUpdater, AsyncUpdater, CompleteUpdater):
+        network = get_network(n_nodes, updater)
+        labeling = get_labeling(network, n_profiles, n_times,
+                                updater is SyncUpdater)
+        candidates = []
+        for node in network.get_nodes().values():
+            function = node.get_function()
+            function.create_pfh_function()
+            candidates += [function] + function.get_replacements(True) + \
+                function.get_replacements(False)
+
+        start = time.perf_counter()
+        expected = [{profile: updater.n_func_inconsistent_with_label_with_profile(
+            network, labeling, candidate, profile)
+            for profile in labeling.get_v_label()} for candidate in candidates]
+        python_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        bit_parallel = Bit_Parallel_Labeling.get(network, labeling)
+        results = [bit_parallel.n_func_inconsistent_with_profiles(network, candidate)
+                   for candidate in candidates]
+        bitset_time = time.perf_counter() - start
+
+        assert results == expected
+        print(f'{updater.__name__:>16} {len(candidates):>10} {python_time:>10.3f} '
+              f'{bitset_time:>10.3f} {python_time / bitset_time:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,119 @@
+"""
+Benchmark of the cone of influence reduction.
+
+Generates a synthetic feed-forward model, in which every node is regulated
+by nodes of lower index, and random observations of its first nodes only,
+then checks the consistency of the whole model and of the cone of influence
+of the observations with the steady-state and synchronous updaters,
+reporting the ground program size, the grounding and solving times and the
+optimization value. Only the first optimal labeling is computed, as the
+pruned nodes multiply the optimal labelings of the whole model.
+
+Usage:
+    python3 scripts/bench_cone_of_influence.py [n_nodes [n_observed [n_times]]]
+"""
+
+import os
+import sys
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from network.network import Network  # noqa: E402
+from asp_helper import ASPHelper  # noqa: E402
+from configuration import configuration  # noqa: E402
+from updaters.updater import Updater  # noqa: E402
+from updaters.cone_of_influence import ConeOfInfluence  # noqa: E402
+from updaters.steady_state_updater import SteadyStateUpdater  # noqa: E402
+from updaters.sync_updater import SyncUpdater  # noqa: E402
+
+DEFAULT_N_NODES = 200
+DEFAULT_N_OBSERVED = 10
+DEFAULT_N_TIMES = 10
+MAX_REGULATORS = 3
+
+
+def get_model(n_nodes: int, seed: int = 0) -> str:
+    """
+    Returns the facts of a model in which every node but the first is
+    regulated by up to MAX_REGULATORS nodes of lower index.
+    """
+    rng = random.Random(seed)
+    facts = ['vertex(n0).']
+    for i in range(1, n_nodes):
+        regulators = rng.sample(range(i), min(i, rng.randint(1, MAX_REGULATORS)))
+        facts.append(f'functionOr(n{i},1..{len(regulators)}).')
+        for term, regulator in enumerate(regulators):
+            facts.append(f'edge(n{regulator},n{i},{rng.randint(0, 1)}). '
+                         f'functionAnd(n{i},{term + 1},n{regulator}).')
+    return ' '.join(facts)
+
+
+def get_observations(n_observed: int, n_times: int, seed: int = 0) -> dict:
+    """
+    Returns random steady-state and time series observations of the first
+    n_observed nodes.
+    """
+    rng = random.Random(seed)
+    steady_state = ['exp(s1).'] + [f'obs_vlabel(s1,n{i},{rng.randint(0, 1)}).'
+                                   for i in range(n_observed)]
+    time_series = ['exp(p1).'] + [f'obs_vlabel(p1,{t},n{i},{rng.randint(0, 1)}).'
+                                  for t in range(n_times)
+                                  for i in range(n_observed)]
+    return {SteadyStateUpdater: ' '.join(steady_state),
+            SyncUpdater: ' '.join(time_series)}
+
+
+def check(model: str, observations: str, updater, reduce: bool) -> tuple:
+    """
+    Returns the statistics, solving time and optimization value of a
+    consistency check of the whole model or of its cone of influence.
+    """
+    network = Network()
+    ASPHelper.parse_network_facts(network, model)
+    network.add_updater(updater())
+    ASPHelper.add_observation_facts(network, observations)
+    if reduce:
+        cone = ConeOfInfluence.reduce(network)
+        ctl = Updater.create_control(network, cone.get_model_facts())
+        ASPHelper.add_facts(ctl, cone.get_observation_facts())
+    else:
+        ctl = Updater.create_control(network)
+        ASPHelper.add_facts(ctl, network.get_observation_facts())
+    ground_time = Updater.ground(ctl)
+    start = time.perf_counter()
+    _, optimization = Updater.solve_consistency(ctl)
+    solve_time = time.perf_counter() - start
+    return Updater.get_statistics(ctl, network, ground_time), solve_time, \
+        optimization
+
+
+def main(argv) -> None:
+    """
+    Checks the whole model and its cone of influence with every updater.
+    """
+    n_nodes = int(argv[1]) if len(argv) > 1 else DEFAULT_N_NODES
+    n_observed = int(argv[2]) if len(argv) > 2 else DEFAULT_N_OBSERVED
+    n_times = int(argv[3]) if len(argv) > 3 else DEFAULT_N_TIMES
+    print(f'{n_nodes} nodes, {n_observed} observed, {n_times} time points')
+    print(f'{"updater":>18} {"check":>6} {"rules":>9} {"atoms":>9} '
+          f'{"ground (s)":>10} {"solve (s)":>9} {"optimization":>12}')
+    model = get_model(n_nodes)
+    configuration['max_labelings'] = 1
+    for updater, observations in get_observations(n_observed, n_times).items():
+        optimizations = []
+        for reduce in (False, True):
+            statistics, solve_time, optimization = \
+                check(model, observations, updater, reduce)
+            ground = statistics['ground']
+            print(f'{updater.__name__:>18} {"cone" if reduce else "whole":>6} '
+                  f'{ground["rules"]:>9} {ground["atoms"]:>9} '
+                  f'{ground["time"]:>10.3f} {solve_time:>9.3f} {optimization:>12}')
+            optimizations.append(optimization)
+        assert len(set(optimizations)) == 1, optimizations
+    configuration['max_labelings'] = 0
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,142 @@
+"""
+Benchmark for ConsistencyEngine against independent consistency checks.
+
+Generates a synthetic model (as scripts/bench_parse.py does) and n_sets
+random steady-state (ss) or synchronous time-series (ts) observation sets,
+then reports the time taken to check the model against every set with one
+parse and Updater.check_consistency call per set (as separate runs do) and
+with a single ConsistencyEngine.
+
+Usage:
+    python3 scripts/bench_consistency_engine.py [n_nodes [n_sets [ss|ts]]]
+"""
+
+import os
+import sys
+import random
+import tempfile
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from network.network import Network  # noqa: E402
+from asp_helper import ASPHelper  # noqa: E402
+from updaters.updater import Updater  # noqa: E402
+from updaters.consistency_engine import ConsistencyEngine  # noqa: E402
+from updaters.steady_state_updater import SteadyStateUpdater  # noqa: E402
+from updaters.sync_updater import SyncUpdater  # noqa: E402
+from scripts.bench_parse import write_synthetic_model  # noqa: E402
+
+DEFAULT_N_NODES = 1000
+DEFAULT_N_SETS = 20
+N_PROFILES = 3  # Profiles of each time-series observation set
+N_TIMES = 4  # Time points of each time-series profile
+N_ROUNDS = 4
+
+
+def write_observations(file_path: str, n_nodes: int, seed: int) -> None:
+    """
+    Writes a random steady-state observation of every node.
+    """
+    rng = random.Random(seed)
+    with open(file_path, 'w', encoding='utf-8') as file:
+        file.write('exp(s1).\n')
+        for i in range(n_nodes):
+            file.write(f'obs_vlabel(s1,n{i},{rng.randint(0, 1)}).\n')
+
+
+def write_time_series(file_path: str, n_nodes: int, seed: int) -> None:
+    """
+    Writes N_PROFILES random time series of every node, named after the
+    seed as different experiments would be.
+    """
+    rng = random.Random(seed)
+    with open(file_path, 'w', encoding='utf-8') as file:
+        for p in range(1, N_PROFILES + 1):
+            file.write(f'exp(s{seed}p{p}).\n')
+            for t in range(N_TIMES):
+                for i in range(n_nodes):
+                    file.write(f'obs_vlabel(s{seed}p{p},{t},n{i},{rng.randint(0, 1)}).\n')
+
+
+def load_network(model_file: str, time_series: bool) -> Network:
+    """
+    Returns the parsed model with a steady-state or synchronous updater.
+    """
+    network = Network()
+    network.set_input_file_network(model_file)
+    ASPHelper.parse_network(network)
+    if time_series:
+        network.add_updater(SyncUpdater())
+        network.set_has_ts_obs(True)
+    else:
+        network.add_updater(SteadyStateUpdater())
+        network.set_has_ss_obs(True)
+    return network
+
+
+def check_independently(model_file: str, obs_files: List[str],
+                        time_series: bool) -> List[int]:
+    """
+    Returns the optimization of each set, parsing the model for each one.
+    """
+    optimizations = []
+    for obs_file in obs_files:
+        network = load_network(model_file, time_series)
+        network.add_observation_file(obs_file)
+        optimizations.append(Updater.check_consistency(network)[1])
+    return optimizations
+
+
+def check_with_engine(model_file: str, obs_files: List[str],
+                      time_series: bool) -> List[int]:
+    """
+    Returns the optimization of each set, checked by one engine.
+    """
+    engine = ConsistencyEngine(load_network(model_file, time_series))
+    for obs_file in obs_files:
+        engine.add_observations(obs_file, files=[obs_file])
+    return [engine.check_consistency(obs_file)[1] for obs_file in obs_files]
+
+
+def main(argv) -> None:
+    """
+    Runs both strategies over the same observation sets.
+    """
+    n_nodes = int(argv[1]) if len(argv) > 1 else DEFAULT_N_NODES
+    n_sets = int(argv[2]) if len(argv) > 2 else DEFAULT_N_SETS
+    time_series = len(argv) > 3 and argv[3] == 'ts'
+    write = write_time_series if time_series else write_observations
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_file = os.path.join(tmp_dir, 'model.lp')
+        write_synthetic_model(model_file, n_nodes)
+        obs_files = []
+        for i in range(n_sets):
+            obs_files.append(os.path.join(tmp_dir, f'obs_{i}.lp'))
+            write(obs_files[-1], n_nodes, i)
+
+        # Keep the best time of each strategy, alternating which one runs
+        # first, as a run is slowed down by the memory left by the previous one
+        times = {check_independently: float('inf'),
+                 check_with_engine: float('inf')}
+        optimizations = {}
+        for i in range(N_ROUNDS):
+            for check in sorted(times, key=lambda check: check.__name__,
+                                reverse=i % 2 == 1):
+                start = time.perf_counter()
+                optimizations[check] = check(model_file, obs_files,
+                                             time_series)
+                times[check] = min(times[check], time.perf_counter() - start)
+        single = optimizations[check_independently]
+        multi = optimizations[check_with_engine]
+        single_time = times[check_independently]
+        engine_time = times[check_with_engine]
+
+    assert single == multi, (single, multi)
+    print(f'{n_nodes} nodes, {n_sets} {"ts" if time_series else "ss"} observation sets, optimizations {multi}')
+    print(f'independent checks: {single_time:.2f} s, engine: {engine_time:.2f} s (best of {N_ROUNDS})')
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,89 @@
+"""
+Microbenchmark for edge lookups on high-degree hubs.
+
+Builds a network where a single hub regulates n_targets nodes and compares
+Network.find_edge against a linear scan of the hub's outgoing edges (the
+previous list-based adjacency), for lookups and for removal followed by
+re-insertion of every hub edge.
+
+Usage:
+    python3 scripts/bench_edge_index.py [n_targets ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from network.network import Network  # noqa: E402
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+
+
+def build_hub_network(n_targets: int) -> Network:
+    """
+    Returns a network with a hub node regulating n_targets nodes.
+    """
+    network = Network()
+    hub = network.add_node('hub')
+    for i in range(n_targets):
+        network.add_edge(hub, network.add_node(f't{i}'), i % 2)
+    return network
+
+
+def linear_scan(edges, end_node_id: str):
+    """
+    Previous lookup strategy: scan the outgoing edge list of a node.
+    """
+    for edge in edges:
+        if edge.get_end_node().get_id() == end_node_id:
+            return edge
+    raise ValueError('Edge does not exist!')
+
+
+def bench(n_targets: int):
+    """
+    Returns the average time per lookup (in microseconds) of the linear scan
+    and of the indexed lookup, and the time of removing and re-adding every
+    hub edge with the indexed adjacency.
+    """
+    network = build_hub_network(n_targets)
+    targets = [f't{i}' for i in range(n_targets)]
+    hub_edges = network.get_graph()['hub']
+    n_lookups = max(n_targets, 10000)
+    queries = [targets[i % n_targets] for i in range(n_lookups)]
+
+    start = time.perf_counter()
+    for target in queries:
+        linear_scan(hub_edges, target)
+    scan = (time.perf_counter() - start) / n_lookups * 1e6
+
+    start = time.perf_counter()
+    for target in queries:
+        network.find_edge('hub', target)
+    indexed = (time.perf_counter() - start) / n_lookups * 1e6
+
+    hub = network.get_node('hub')
+    start = time.perf_counter()
+    for target in targets:
+        end_node = network.get_node(target)
+        network.remove_edge(hub, end_node)
+        network.add_edge(hub, end_node, 1)
+    remove_add = time.perf_counter() - start
+    return scan, indexed, remove_add
+
+
+def main(argv) -> None:
+    """
+    Runs the benchmark for each requested hub degree.
+    """
+    sizes = [int(arg) for arg in argv[1:]] or DEFAULT_SIZES
+    print(f'{"degree":>8} {"scan (us)":>10} {"index (us)":>11} {"speedup":>8} {"remove+add all (s)":>19}')
+    for n_targets in sizes:
+        scan, indexed, remove_add = bench(n_targets)
+        print(f'{n_targets:>8} {scan:>10.3f} {indexed:>11.3f} {scan / indexed:>7.1f}x {remove_add:>19.4f}')
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,84 @@
+"""
+Memory benchmark for the candidate functions explored by the repair search.
+
+Builds the function of a node with n_regulators regulators and expands the
+Hasse diagram around it for a number of levels, as the non-comparable
+function search does, reporting the memory held by the Function objects
+created (excluding the PyFunctionhood elements they wrap).
+
+Usage:
+    python3 scripts/bench_function_memory.py [n_regulators ...]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from network.function import Function  # noqa: E402
+
+DEFAULT_SIZES = [6, 7, 8]
+LEVELS = 2
+
+
+def build_function(n_regulators: int) -> Function:
+    """
+    Returns a function of n_regulators regulators with one clause per
+    regulator.
+    """
+    function = Function('target')
+    for i in range(n_regulators):
+        function.add_regulator_to_term(i + 1, f'regulator_{i}')
+    function.create_pfh_function()
+    return function
+
+
+def expand(functions, generalize: bool):
+    """
+    Returns the replacements of every given function.
+    """
+    return [candidate for function in functions
+            for candidate in function.get_replacements(generalize)]
+
+
+def bench(n_regulators: int):
+    """
+    Returns the number of candidates created, the bytes allocated per
+    candidate by the Function wrappers and the expansion time.
+    """
+    function = build_function(n_regulators)
+    frontier = [function]
+    candidates = []
+    elapsed = 0.0
+    for _ in range(LEVELS):
+        # The PyFunctionhood elements are created before tracing starts
+        elements = [(f, f.get_hasse_relationships('children'))
+                    for f in frontier]
+        tracemalloc.start()
+        start = time.perf_counter()
+        frontier = [f.create_function_from_element(element)
+                    for f, children in elements for element in children]
+        elapsed += time.perf_counter() - start
+        traced, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        candidates.append((len(frontier), traced))
+    n_candidates = sum(n for n, _ in candidates)
+    total = sum(traced for _, traced in candidates)
+    return n_candidates, total / max(n_candidates, 1), elapsed
+
+
+def main(argv) -> None:
+    """
+    Runs the benchmark for each requested number of regulators.
+    """
+    sizes = [int(arg) for arg in argv[1:]] or DEFAULT_SIZES
+    print(f'{"regulators":>10} {"candidates":>10} {"bytes/candidate":>16} {"time (s)":>9}')
+    for n_regulators in sizes:
+        n_candidates, per_candidate, elapsed = bench(n_regulators)
+        print(f'{n_regulators:>10} {n_candidates:>10} {per_candidate:>16.0f} {elapsed:>9.3f}')
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,78 @@
+"""
+Benchmark for Observation_Table on large synthetic time-series observations.
+
+Writes random obs_vlabel(P,T,V,S) facts for a network of n_nodes nodes until
+the observation file reaches the requested size, then reports the time taken
+to load it into an Observation_Table and the size of the resulting table.
+
+Usage:
+    python3 scripts/bench_observation_table.py [size_mb [n_nodes [n_times]]]
+"""
+
+import os
+import sys
+import random
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from network.network import Network  # noqa: E402
+from network.observation_table import Observation_Table  # noqa: E402
+
+DEFAULT_SIZE_MB = 100
+DEFAULT_N_NODES = 100
+DEFAULT_N_TIMES = 100
+
+
+def write_synthetic_observations(file_path: str, size_mb: int, n_nodes: int,
+                                 n_times: int, seed: int = 0) -> int:
+    """
+    Writes profiles of n_times time points over n_nodes nodes to file_path
+    until it holds size_mb megabytes, returning the number of facts written.
+    """
+    rng = random.Random(seed)
+    n_facts = 0
+    size = 0
+    profile = 0
+    with open(file_path, 'w', encoding='utf-8') as file:
+        while size < size_mb * 1024 * 1024:
+            profile += 1
+            size += file.write(f'exp(p{profile}).\n')
+            for t in range(n_times):
+                line = ' '.join(f'obs_vlabel(p{profile},{t},n{i},{rng.randint(0, 1)}).'
+                                for i in range(n_nodes)) + '\n'
+                size += file.write(line)
+                n_facts += n_nodes
+    return n_facts
+
+
+def main(argv) -> None:
+    """
+    Generates the observation file and benchmarks loading it.
+    """
+    size_mb = int(argv[1]) if len(argv) > 1 else DEFAULT_SIZE_MB
+    n_nodes = int(argv[2]) if len(argv) > 2 else DEFAULT_N_NODES
+    n_times = int(argv[3]) if len(argv) > 3 else DEFAULT_N_TIMES
+    network = Network()
+    for i in range(n_nodes):
+        network.add_node(f'n{i}')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'observations.lp')
+        n_facts = write_synthetic_observations(file_path, size_mb, n_nodes,
+                                               n_times)
+        file_size = os.path.getsize(file_path) / (1024 * 1024)
+        table = Observation_Table(network)
+        start = time.perf_counter()
+        table.load(file_path)
+        elapsed = time.perf_counter() - start
+    table_size = sum(table.get_values(profile).buffer_info()[1]
+                     for profile in table.get_profiles())
+    print(f'file: {file_size:.1f} MB, {n_facts} facts, '
+          f'{len(table.get_profiles())} profiles')
+    print(f'load: {elapsed:.2f} s ({n_facts / elapsed:.0f} facts/s), '
+          f'table: {table_size / (1024 * 1024):.1f} MB')
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,82 @@
+"""
+Benchmark for ASPHelper.parse_network on synthetic models.
+
+Generates random models with the given number of nodes (each regulated by a
+few other nodes, split over one or more terms) and reports the time taken to
+parse them into a Network.
+
+Usage:
+    python3 scripts/bench_parse.py [n_nodes ...]
+"""
+
+import os
+import sys
+import random
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from network.network import Network  # noqa: E402
+from asp_helper import ASPHelper  # noqa: E402
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+MAX_REGULATORS = 4
+REPETITIONS = 3
+
+
+def write_synthetic_model(file_path: str, n_nodes: int, seed: int = 0) -> int:
+    """
+    Writes a synthetic model with n_nodes vertices to file_path and returns
+    the number of facts written.
+    """
+    rng = random.Random(seed)
+    nodes = [f'n{i}' for i in range(n_nodes)]
+    n_facts = 0
+    with open(file_path, 'w', encoding='utf-8') as file:
+        for node in nodes:
+            file.write(f'vertex({node}).\n')
+            n_facts += 1
+        for node in nodes:
+            regulators = rng.sample(nodes, rng.randint(1, MAX_REGULATORS))
+            n_terms = rng.randint(1, len(regulators))
+            for regulator in regulators:
+                file.write(f'edge({regulator},{node},{rng.randint(0, 1)}).\n')
+            file.write(f'functionOr({node},1..{n_terms}).\n')
+            for i, regulator in enumerate(regulators):
+                file.write(f'functionAnd({node},{i % n_terms + 1},{regulator}). ')
+            file.write('\n')
+            n_facts += 2 * len(regulators) + 1
+    return n_facts
+
+
+def bench_parse(file_path: str) -> float:
+    """
+    Returns the best wall-clock time (in seconds) of parsing file_path.
+    """
+    best = float('inf')
+    for _ in range(REPETITIONS):
+        network = Network()
+        network.set_input_file_network(file_path)
+        start = time.perf_counter()
+        ASPHelper.parse_network(network)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv) -> None:
+    """
+    Runs the parse benchmark for each requested model size.
+    """
+    sizes = [int(arg) for arg in argv[1:]] or DEFAULT_SIZES
+    print(f'{"nodes":>10} {"facts":>10} {"time (s)":>10} {"facts/s":>12}')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_nodes in sizes:
+            file_path = os.path.join(tmp_dir, f'model_{n_nodes}.lp')
+            n_facts = write_synthetic_model(file_path, n_nodes)
+            elapsed = bench_parse(file_path)
+            print(f'{n_nodes:>10} {n_facts:>10} {elapsed:>10.3f} {n_facts / elapsed:>12.0f}')
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,79 @@
+"""
+Benchmark of clingo solver settings for the consistency check.
+
+Checks the consistency of a model against its observations once per solver
+setting (threads, configuration preset and optimization strategy) and
+reports the time and optimization value of each. Without arguments a
+synthetic model and steady-state observation are generated (as in
+scripts/bench_consistency_engine.py).
+
+Usage:
+    python3 scripts/bench_solver_settings.py [-m model -obs obs updater ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from network.network import Network  # noqa: E402
+from asp_helper import ASPHelper  # noqa: E402
+from configuration import configuration  # noqa: E402
+from updaters.updater import Updater  # noqa: E402
+from main import process_arguments  # noqa: E402
+from scripts.bench_parse import write_synthetic_model  # noqa: E402
+from scripts.bench_consistency_engine import write_observations  # noqa: E402
+
+N_NODES = 300
+
+# (solver_parallel_mode, solver_configuration, solver_opt_strategy)
+SETTINGS = [
+    ('', '', ''),
+    ('', '', 'usc'),
+    ('', 'trendy', ''),
+    ('4', '', ''),
+    ('4', '', 'usc'),
+    ('4,split', '', ''),
+    (str(os.cpu_count()), '', 'usc'),
+]
+
+
+def bench(argv):
+    """
+    Prints the time and optimization value of each solver setting.
+    """
+    print(f'{"threads":>8} {"preset":>8} {"strategy":>8} {"time (s)":>9} {"optimization":>12}')
+    for parallel_mode, preset, opt_strategy in SETTINGS:
+        network = Network()
+        process_arguments(network, argv)
+        ASPHelper.parse_network(network)
+        configuration['solver_parallel_mode'] = parallel_mode
+        configuration['solver_configuration'] = preset
+        configuration['solver_opt_strategy'] = opt_strategy
+        start = time.perf_counter()
+        _, optimization = Updater.check_consistency(network)
+        elapsed = time.perf_counter() - start
+        print(f'{parallel_mode or "1":>8} {preset or "-":>8} {opt_strategy or "-":>8} '
+              f'{elapsed:>9.3f} {optimization:>12}')
+
+
+def main(argv) -> None:
+    """
+    Runs the benchmark on the given model and observations, or on a
+    synthetic instance.
+    """
+    if len(argv) > 1:
+        bench(['main.py'] + argv[1:])
+        return
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_file = os.path.join(tmp_dir, 'model.lp')
+        obs_file = os.path.join(tmp_dir, 'obs.lp')
+        write_synthetic_model(model_file, N_NODES)
+        write_observations(obs_file, N_NODES, 0)
+        bench(['main.py', '-m', model_file, '-obs', obs_file, 'steadystateupdater'])
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,103 @@
+"""
+Benchmark of the pairwise and grouped topological error encodings.
+
+Generates a synthetic model (as scripts/bench_parse.py does) and random,
+fully observed time series of several experiments, then checks the
+consistency of the model with the synchronous and asynchronous updaters
+under each encoding, reporting the ground program size, the grounding and
+solving times and the optimization value.
+
+Usage:
+    python3 scripts/bench_topological_encoding.py [n_nodes [n_exps [n_times]]]
+"""
+
+import os
+import sys
+import random
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from network.network import Network  # noqa: E402
+from asp_helper import ASPHelper  # noqa: E402
+from configuration import configuration  # noqa: E402
+from updaters.updater import Updater  # noqa: E402
+from updaters.sync_updater import SyncUpdater  # noqa: E402
+from updaters.async_updater import AsyncUpdater  # noqa: E402
+from scripts.bench_parse import write_synthetic_model  # noqa: E402
+
+DEFAULT_N_NODES = 5
+DEFAULT_N_EXPS = 2
+DEFAULT_N_TIMES = 100
+ENCODINGS = ['pairwise', 'grouped']
+
+
+def write_time_series(file_path: str, n_nodes: int, n_exps: int,
+                      n_times: int, seed: int = 0) -> None:
+    """
+    Writes random observations of every node at every time point of n_exps
+    experiments.
+    """
+    rng = random.Random(seed)
+    with open(file_path, 'w', encoding='utf-8') as file:
+        for exp in range(n_exps):
+            file.write(f'exp(p{exp}).\n')
+            for time_point in range(n_times):
+                for i in range(n_nodes):
+                    file.write(f'obs_vlabel(p{exp},{time_point},n{i},{rng.randint(0, 1)}).\n')
+
+
+def check(model_file: str, obs_file: str, updater) -> tuple:
+    """
+    Returns the statistics, optimization value and number of optimal
+    labelings of a consistency check.
+    """
+    network = Network()
+    network.set_input_file_network(model_file)
+    ASPHelper.parse_network(network)
+    network.add_observation_file(obs_file)
+    network.add_updater(updater())
+    network.set_has_ts_obs(True)
+    ctl = Updater.create_control(network)
+    ctl.load(obs_file)
+    ground_time = Updater.ground(ctl)
+    start = time.perf_counter()
+    labelings, optimization = Updater.solve_consistency(ctl)
+    solve_time = time.perf_counter() - start
+    statistics = Updater.get_statistics(ctl, network, ground_time)
+    return statistics, solve_time, optimization, len(labelings)
+
+
+def main(argv) -> None:
+    """
+    Checks the same model and time series with every encoding.
+    """
+    n_nodes = int(argv[1]) if len(argv) > 1 else DEFAULT_N_NODES
+    n_exps = int(argv[2]) if len(argv) > 2 else DEFAULT_N_EXPS
+    n_times = int(argv[3]) if len(argv) > 3 else DEFAULT_N_TIMES
+    print(f'{n_nodes} nodes, {n_exps} experiments x {n_times} time points')
+    print(f'{"updater":>12} {"encoding":>9} {"rules":>9} {"atoms":>9} '
+          f'{"ground (s)":>10} {"solve (s)":>9} {"optimization":>12} {"labelings":>9}')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_file = os.path.join(tmp_dir, 'model.lp')
+        obs_file = os.path.join(tmp_dir, 'obs.lp')
+        write_synthetic_model(model_file, n_nodes)
+        write_time_series(obs_file, n_nodes, n_exps, n_times)
+        for updater in (SyncUpdater, AsyncUpdater):
+            results = []
+            for encoding in ENCODINGS:
+                configuration['topological_encoding'] = encoding
+                statistics, solve_time, optimization, n_labelings = \
+                    check(model_file, obs_file, updater)
+                ground = statistics['ground']
+                print(f'{updater.__name__:>12} {encoding:>9} {ground["rules"]:>9} '
+                      f'{ground["atoms"]:>9} {ground["time"]:>10.3f} {solve_time:>9.3f} '
+                      f'{optimization:>12} {n_labelings:>9}')
+                results.append((optimization, n_labelings))
+            assert len(set(results)) == 1, results
+    configuration['topological_encoding'] = 'pairwise'
+
+
+if __name__ == '__main__':
+    main(sys.argv)
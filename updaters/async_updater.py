@@ -6,7 +6,6 @@ additional consistency rules.
 
 import clingo
 from updaters.time_series_updater import TimeSeriesUpdater
-from updaters.updater import Updater
 from network.network import Network
 from network.function import Function
 from network.inconsistency_solution import Inconsistency_Solution
@@ -32,8 +31,9 @@ class AsyncUpdater(TimeSeriesUpdater):
         ctl.add('base', [], 'vlabel(P,T+1,V,0) :- update(P,T,V), {noneNegative(P,T,V,Id):functionOr(V,Id)}0, vertex(V), exp(P), functionOr(V,_), not r_gen(V), not topologicalerror(V), time(P,T+1).')
         ctl.add('base', [], 'vlabel(P,T+1,V,S) :- not update(P,T,V), vlabel(P,T,V,S), time(P,T+1).')
         ctl.add('base', [], ':- update(P,T,V), vlabel(P,T,V,S), vlabel(P,T+1,V,S).')
-        ctl.add('base', [], 'topologicalerror(V) :- time(P1,T1), time(P2,T2), T1 != T2, time(P1,T1+1), time(P2,T2+1), update(P1, T1, V), update(P2, T2, V), {vlabel(P1,T1,V1,S1) : vlabel(P2,T2,V1,S2), functionAnd(V,Id, V1), S1!=S2}0, vlabel(P1,T1+1,V,S3), vlabel(P2,T2+1,V,S4), S3 != S4, not input(V).')
-        ctl.add('base', [], 'topologicalerror(V) :- time(P1,T), time(P2,T), time(P1,T+1), time(P2,T+1), update(P1, T, V), update(P2, T, V), P1 != P2, {vlabel(P1,T,V1,S1) : vlabel(P2,T,V1,S2), S1!=S2,  functionAnd(V,Id, V1)}0, vlabel(P1,T+1,V,S3), vlabel(P2,T+1,V,S4), S3 != S4, not input(V).')
+        pairwise = TimeSeriesUpdater.add_topological_error_rules(ctl, 'update(P,T,V), time(P,T+1)')
+        ctl.add('base', [], 'topologicalerror(V) :- ' + pairwise + 'time(P1,T1), time(P2,T2), T1 != T2, time(P1,T1+1), time(P2,T2+1), update(P1, T1, V), update(P2, T2, V), {vlabel(P1,T1,V1,S1) : vlabel(P2,T2,V1,S2), functionAnd(V,Id, V1), S1!=S2}0, vlabel(P1,T1+1,V,S3), vlabel(P2,T2+1,V,S4), S3 != S4, not input(V).')
+        ctl.add('base', [], 'topologicalerror(V) :- ' + pairwise + 'time(P1,T), time(P2,T), time(P1,T+1), time(P2,T+1), update(P1, T, V), update(P2, T, V), P1 != P2, {vlabel(P1,T,V1,S1) : vlabel(P2,T,V1,S2), S1!=S2,  functionAnd(V,Id, V1)}0, vlabel(P1,T+1,V,S3), vlabel(P2,T+1,V,S4), S3 != S4, not input(V).')
         ctl.add('base', [], 'repair(V) :- topologicalerror(V).')
         ctl.add('base', [], '#minimize {1@2,top,V : topologicalerror(V)}.')
         ctl.add('base', [], '#show update/3.')
@@ -41,8 +41,8 @@ class AsyncUpdater(TimeSeriesUpdater):
         if configuration['check_consistency']:
             ctl.add('base', [], 'inc(P,V) :- vlabel(P,T+1,V,0), update(P,T,V), 1{noneNegative(P,T,V,Id):functionOr(V,Id)}, vertex(V), exp(P), r_part(V), not topologicalerror(V), time(P,T+1).')
             ctl.add('base', [], 'inc(P,V) :- vlabel(P,T+1,V,1), update(P,T,V), {noneNegative(P,T,V,Id):functionOr(V,Id)}0, vertex(V), exp(P), functionOr(V,_), r_gen(V), not topologicalerror(V), time(P,T+1).')
-            ctl.add('base', [], 'incT(P1,P2,V) :- time(P1,T1), time(P2,T2), T1 != T2, time(P1,T1+1), time(P2,T2+1), update(P1, T1, V), update(P2, T2, V), {vlabel(P1,T1,V1,S1) : vlabel(P2,T2,V1,S2), functionAnd(V,Id, V1), S1!=S2}0, vlabel(P1,T1+1,V,S3), vlabel(P2,T2+1,V,S4), S3 != S4, not input(V), P1 <= P2.')
-            ctl.add('base', [], 'incT(P1,P2,V) :- time(P1,T), time(P2,T), time(P1,T+1), time(P2,T+1), update(P1, T, V), update(P2, T, V), P1 < P2, {vlabel(P1,T,V1,S1) : vlabel(P2,T,V1,S2), S1!=S2, functionAnd(V,Id, V1)}0, vlabel(P1,T+1,V,S3), vlabel(P2,T+1,V,S4), S3 != S4, not input(V).')
+            ctl.add('base', [], 'incT(P1,P2,V) :- ' + pairwise + 'time(P1,T1), time(P2,T2), T1 != T2, time(P1,T1+1), time(P2,T2+1), update(P1, T1, V), update(P2, T2, V), {vlabel(P1,T1,V1,S1) : vlabel(P2,T2,V1,S2), functionAnd(V,Id, V1), S1!=S2}0, vlabel(P1,T1+1,V,S3), vlabel(P2,T2+1,V,S4), S3 != S4, not input(V), P1 <= P2.')
+            ctl.add('base', [], 'incT(P1,P2,V) :- ' + pairwise + 'time(P1,T), time(P2,T), time(P1,T+1), time(P2,T+1), update(P1, T, V), update(P2, T, V), P1 < P2, {vlabel(P1,T,V1,S1) : vlabel(P2,T,V1,S2), S1!=S2, functionAnd(V,Id, V1)}0, vlabel(P1,T+1,V,S3), vlabel(P2,T+1,V,S4), S3 != S4, not input(V).')
             ctl.add('base', [], '#show incT/3.')
 
     @staticmethod
@@ -80,13 +80,11 @@ class AsyncUpdater(TimeSeriesUpdater):
             n_clauses = function.get_n_clauses()
 
             if n_clauses:
-                for clause in function.get_clauses():
-                    if Updater.is_clause_satisfiable(clause, network, time_map, function):
-                        found_sat = True
-                        # In a dynamic update, require a transition to a 1-label at the next time step.
-                        if profile_map[time + 1][function.get_node_id()] != 1:
-                            return False
-                        break
+                if function.evaluate(network, time_map):
+                    found_sat = True
+                    # In a dynamic update, require a transition to a 1-label at the next time step.
+                    if profile_map[time + 1][function.get_node_id()] != 1:
+                        return False
 
             if not found_sat:
                 if n_clauses == 0:
@@ -149,17 +147,15 @@ class AsyncUpdater(TimeSeriesUpdater):
             n_clauses = function.get_n_clauses()
 
             if n_clauses:
-                for clause in function.get_clauses():
-                    if Updater.is_clause_satisfiable(clause, network, time_map, function):
-                        found_sat = True
-                        # In a dynamic update, require a transition to a 1-label at the next time step.
-                        if profile_map[time + 1][function.get_node_id()] != 1:
-                            if result in (Inconsistencies.CONSISTENT.value,
-                                          Inconsistencies.SINGLE_INC_PART.value):
-                                result = Inconsistencies.SINGLE_INC_PART.value
-                            else:
-                                return Inconsistencies.DOUBLE_INC.value
-                        break
+                if function.evaluate(network, time_map):
+                    found_sat = True
+                    # In a dynamic update, require a transition to a 1-label at the next time step.
+                    if profile_map[time + 1][function.get_node_id()] != 1:
+                        if result in (Inconsistencies.CONSISTENT.value,
+                                      Inconsistencies.SINGLE_INC_PART.value):
+                            result = Inconsistencies.SINGLE_INC_PART.value
+                        else:
+                            return Inconsistencies.DOUBLE_INC.value
             if not found_sat:
                 if n_clauses == 0:
                     if last_val < 0:
@@ -6,7 +6,6 @@ consistency.
 
 import clingo
 from updaters.time_series_updater import TimeSeriesUpdater
-from updaters.updater import Updater
 from network.network import Network
 from network.function import Function
 from network.inconsistency_solution import Inconsistency_Solution
@@ -74,13 +73,11 @@ class CompleteUpdater(TimeSeriesUpdater):
             n_clauses = function.get_n_clauses()
 
             if n_clauses:
-                for clause in function.get_clauses():
-                    if Updater.is_clause_satisfiable(clause, network, time_map, function):
-                        found_sat = True
-                        # In a dynamic update, require a transition to a 1-label at the next time step.
-                        if profile_map[time + 1][function.get_node_id()] != 1:
-                            return False
-                        break
+                if function.evaluate(network, time_map):
+                    found_sat = True
+                    # In a dynamic update, require a transition to a 1-label at the next time step.
+                    if profile_map[time + 1][function.get_node_id()] != 1:
+                        return False
 
             if not found_sat:
                 if n_clauses == 0:
@@ -142,17 +139,15 @@ class CompleteUpdater(TimeSeriesUpdater):
             n_clauses = function.get_n_clauses()
 
             if n_clauses:
-                for clause in function.get_clauses():
-                    if Updater.is_clause_satisfiable(clause, network, time_map, function):
-                        found_sat = True
-                        # In a dynamic update, require a transition to a 1-label at the next time step.
-                        if profile_map[time + 1][function.get_node_id()] != 1:
-                            if result in (Inconsistencies.CONSISTENT.value,
-                                          Inconsistencies.SINGLE_INC_PART.value):
-                                result = Inconsistencies.SINGLE_INC_PART.value
-                            else:
-                                return Inconsistencies.DOUBLE_INC.value
-                        break
+                if function.evaluate(network, time_map):
+                    found_sat = True
+                    # In a dynamic update, require a transition to a 1-label at the next time step.
+                    if profile_map[time + 1][function.get_node_id()] != 1:
+                        if result in (Inconsistencies.CONSISTENT.value,
+                                      Inconsistencies.SINGLE_INC_PART.value):
+                            result = Inconsistencies.SINGLE_INC_PART.value
+                        else:
+                            return Inconsistencies.DOUBLE_INC.value
             if not found_sat:
                 if n_clauses == 0:
                     if last_val < 0:
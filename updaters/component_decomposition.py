@@ -0,0 +1,227 @@
+"""
+This module contains the ComponentDecomposition class, which checks the
+consistency of each weakly connected component of a network on its own and
+combines the optimal labelings of the components into labelings of the whole
+network.
+"""
+
+import sys
+import itertools
+import multiprocessing
+from typing import List, Optional, Tuple
+import clingo
+from network.network import Network
+from network.inconsistency_solution import Inconsistency_Solution
+from updaters.updater import Updater
+from updaters.cone_of_influence import ConeOfInfluence
+from configuration import configuration
+
+
+class ComponentDecomposition:
+    """
+    Splits the model and observation facts of a network by weakly connected
+    component. Facts that mention no node (e.g. exp/1) are shared by every
+    component, and so are the time points observed in any component, since
+    every node is labeled at every time point of a profile. Each component
+    is then grounded and solved on its own, optionally in a process pool.
+    As the minimized repairs add up over the components, the optimal
+    labelings of the network are the combinations of one optimal labeling of
+    each component, with the sum of their optimization values.
+    """
+
+    # Components checked by the workers of a process pool
+    worker_components = []
+
+    def __init__(self, network: Network, components: List[Tuple[List, List, List]]) -> None:
+        """
+        Initializes a decomposition of a network into the node identifiers,
+        model facts and observation facts of each of its components.
+        """
+        self.network = network
+        self.components = components
+
+    def get_components(self) -> List[Tuple[List, List, List]]:
+        """
+        Returns the (node identifiers, model facts, observation facts) of
+        every component.
+        """
+        return self.components
+
+    @staticmethod
+    def split(network: Network, cone: Optional[ConeOfInfluence] = None) \
+            -> Optional["ComponentDecomposition"]:
+        """
+        Splits the facts of a network, or of its cone of influence when
+        given, by weakly connected component. Returns
+        None if the network has a single component, if some updater relates
+        nodes across components or if the model or observations are not a
+        set of facts.
+        """
+        if not all(updater.is_decomposable()
+                   for updater in network.get_updaters()):
+            return None
+        node_components = network.get_components()
+        if cone is not None:
+            node_components = [[node_id for node_id in component
+                                if node_id in cone.get_nodes()]
+                               for component in node_components]
+            node_components = [component for component in node_components
+                               if component]
+        if len(node_components) < 2:
+            return None
+        if cone is not None:
+            facts = cone.get_model_facts(), cone.get_observation_facts()
+        else:
+            facts = Updater.get_network_facts(network)
+        if facts is None:
+            return None
+        model_facts, observation_facts = facts
+
+        component_of = {node_id: idx
+                        for idx, component in enumerate(node_components)
+                        for node_id in component}
+        components = [(component, [], []) for component in node_components]
+        shared_model = []
+        for fact in model_facts:
+            indices = {component_of[str(argument)]
+                       for argument in fact.arguments
+                       if str(argument) in component_of}
+            if len(indices) > 1:
+                return None
+            if indices:
+                components[indices.pop()][1].append(fact)
+            else:
+                shared_model.append(fact)
+
+        shared_observations = []
+        times = set()
+        for fact in observation_facts:
+            idx = None
+            if fact.name == 'obs_vlabel' and len(fact.arguments) >= 3:
+                idx = component_of.get(str(fact.arguments[-2]))
+                if len(fact.arguments) == 4:
+                    times.add(clingo.Function('time', fact.arguments[:2]))
+            if idx is None:
+                shared_observations.append(fact)
+            else:
+                components[idx][2].append(fact)
+        shared_observations.extend(sorted(times))
+        for _, model, observations in components:
+            model.extend(shared_model)
+            observations.extend(shared_observations)
+        return ComponentDecomposition(network, components)
+
+    @staticmethod
+    def check_consistency(network: Network) -> Tuple[List[Inconsistency_Solution], int]:
+        """
+        Checks the consistency of the network one component at a time, as
+        Updater.check_consistency does for the whole network, falling back
+        to it when the network cannot be decomposed. With the cone of
+        influence reduction, only the components of the cone are checked.
+        """
+        cone = None
+        try:
+            if configuration['cone_of_influence']:
+                cone = ConeOfInfluence.reduce(network)
+            decomposition = ComponentDecomposition.split(network, cone)
+        except RuntimeError as e:
+            print(f'Failed to check consistency: {e}')
+            sys.exit(-1)
+        if decomposition is None:
+            return cone.check() if cone is not None \
+                else Updater.check_consistency(network)
+        if cone is not None:
+            cone.print_reduction()
+        result, optimization = decomposition.combine(
+            decomposition.check_components())
+        if cone is not None:
+            for labeling in result:
+                cone.complete(labeling)
+        return result, optimization
+
+    def check_components(self) -> List[Tuple[List[Inconsistency_Solution], int]]:
+        """
+        Checks every component, in a pool of component_jobs processes when
+        configured, and returns their optimal labelings and optimization
+        values in component order.
+        """
+        n_jobs = min(configuration['component_jobs'], len(self.components))
+        if n_jobs <= 1:
+            return [ComponentDecomposition.check_component(
+                self.network, *component) for component in self.components]
+        # Workers are forked with the network and the components, which
+        # are not picklable, so that only the component index is sent
+        context = multiprocessing.get_context('fork')
+        with context.Pool(n_jobs, ComponentDecomposition.init_worker,
+                          (self.network, self.components)) as pool:
+            return pool.map(ComponentDecomposition.check_worker_component,
+                            range(len(self.components)))
+
+    @staticmethod
+    def init_worker(network: Network, components: List[Tuple[List, List, List]]) -> None:
+        """
+        Stores the network and its components in a pool worker.
+        """
+        ComponentDecomposition.worker_components = [
+            (network, *component) for component in components]
+
+    @staticmethod
+    def check_worker_component(idx: int) -> Tuple[List[Inconsistency_Solution], int]:
+        """
+        Checks the component with the given index in a pool worker.
+        """
+        return ComponentDecomposition.check_component(
+            *ComponentDecomposition.worker_components[idx])
+
+    @staticmethod
+    def check_component(network: Network, node_ids: List[str],
+                        model: List[clingo.Symbol],
+                        observations: List[clingo.Symbol]) -> Tuple[List[Inconsistency_Solution], int]:
+        """
+        Checks the consistency of a component given by its nodes, model
+        facts and observation facts.
+        """
+        from asp_helper import ASPHelper
+        result = []
+        optimization = -2
+        try:
+            ctl = Updater.create_control(network, model)
+            ASPHelper.add_facts(ctl, observations)
+            ground_time = Updater.ground(ctl)
+            result, optimization = Updater.solve_consistency(ctl)
+            if configuration['solver_statistics']:
+                statistics = Updater.get_statistics(ctl, network, ground_time)
+                statistics['component'] = node_ids[0]
+                statistics['component_nodes'] = len(node_ids)
+                Updater.print_statistics(statistics)
+        except Exception as e:
+            print(f'Failed to check consistency: {e}')
+            sys.exit(-1)
+        return result, optimization
+
+    @staticmethod
+    def combine(results: List[Tuple[List[Inconsistency_Solution], int]]) -> Tuple[List[Inconsistency_Solution], int]:
+        """
+        Combines the optimal labelings of every component into labelings of
+        the whole network, one for each choice of a labeling per component,
+        with the sum of the optimization values. The network is
+        unsatisfiable (-1) if a component is, and no labeling is found (-2)
+        if a component has none.
+        """
+        optimizations = [optimization for _, optimization in results]
+        if -1 in optimizations:
+            return [], -1
+        if -2 in optimizations or not all(labelings for labelings, _ in results):
+            return [], -2
+        combinations = itertools.product(*(labelings for labelings, _ in results))
+        if configuration['max_labelings'] > 0 and \
+                not configuration['dedupe_labelings']:
+            combinations = itertools.islice(combinations,
+                                            configuration['max_labelings'])
+        result = []
+        for labelings in combinations:
+            labeling = Inconsistency_Solution()
+            for part in labelings:
+                labeling.add_solution(part)
+            result.append(labeling)
+        return result, sum(optimizations)
@@ -0,0 +1,260 @@
+"""
+This module contains the ConeOfInfluence class, which restricts the
+consistency check of a network to the nodes that can influence its
+observations.
+"""
+
+import sys
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import clingo
+from network.network import Network
+from network.inconsistency_solution import Inconsistency_Solution
+from updaters.updater import Updater
+from configuration import configuration
+
+
+class ConeOfInfluence:
+    """
+    Cone of influence reduction of the consistency check. A node that is
+    neither observed nor a regulator, directly or not, of an observed node
+    cannot change the labels of the observed nodes, and its own labels can
+    always be set by its function without any repair. Only the sub-model of
+    the remaining nodes is grounded and solved, and the labels of the pruned
+    nodes are filled in afterwards, starting from 0 for inputs and at the
+    first time point. Steady states need a fixed point of the pruned nodes,
+    so pruned nodes on cycles are kept in the cone when some profile is a
+    steady state.
+    """
+
+    def __init__(self, network: Network, nodes: Set[str], order: List[str],
+                 time_series: Set[str], model_facts: List[clingo.Symbol],
+                 observation_facts: List[clingo.Symbol]) -> None:
+        """
+        Initializes the reduction of a network to the given nodes, with the
+        pruned nodes in regulation order, the time series profiles and the
+        model and observation facts of the sub-model.
+        """
+        self.network = network
+        self.nodes = nodes
+        self.order = order
+        self.time_series = time_series
+        self.model_facts = model_facts
+        self.observation_facts = observation_facts
+
+    def get_nodes(self) -> Set[str]:
+        """
+        Returns the identifiers of the nodes in the cone.
+        """
+        return self.nodes
+
+    def get_pruned(self) -> List[str]:
+        """
+        Returns the identifiers of the pruned nodes, each after its pruned
+        regulators unless they are on a cycle.
+        """
+        return self.order
+
+    def get_model_facts(self) -> List[clingo.Symbol]:
+        """
+        Returns the model facts of the nodes in the cone.
+        """
+        return self.model_facts
+
+    def get_observation_facts(self) -> List[clingo.Symbol]:
+        """
+        Returns the observation facts of the network.
+        """
+        return self.observation_facts
+
+    @staticmethod
+    def get_ancestors(network: Network, node_ids: Iterable[str]) -> Set[str]:
+        """
+        Returns the given nodes of the network and all their direct and
+        indirect regulators.
+        """
+        regulators = network.get_regulators()
+        ancestors = {node_id for node_id in node_ids
+                     if node_id in network.get_nodes()}
+        stack = list(ancestors)
+        while stack:
+            for regulator in regulators.get(stack.pop(), ()):
+                if regulator not in ancestors:
+                    ancestors.add(regulator)
+                    stack.append(regulator)
+        return ancestors
+
+    @staticmethod
+    def peel(network: Network, node_ids: Set[str],
+             neighbours: Dict[str, Set[str]]) -> Tuple[List[str], Set[str]]:
+        """
+        Repeatedly removes the nodes with no neighbour left among the given
+        nodes. Returns the removed nodes in removal order and the remaining
+        nodes, which are on or between cycles.
+        """
+        degree = {node_id: len(neighbours.get(node_id, set()) & node_ids)
+                  for node_id in node_ids}
+        reverse = {}
+        for node_id in node_ids:
+            for neighbour in neighbours.get(node_id, set()) & node_ids:
+                reverse.setdefault(neighbour, []).append(node_id)
+        order = [node_id for node_id in network.get_node_names()
+                 if degree.get(node_id) == 0]
+        for node_id in order:
+            for other in reverse.get(node_id, ()):
+                degree[other] -= 1
+                if degree[other] == 0:
+                    order.append(other)
+        return order, node_ids - set(order)
+
+    @staticmethod
+    def get_cone(network: Network, observed: Iterable[str],
+                 keep_cycles: bool) -> Tuple[Set[str], List[str]]:
+        """
+        Returns the cone of influence of the observed nodes and the pruned
+        nodes, in regulation order up to cycles. With keep_cycles, the pruned nodes on
+        cycles are added to the cone together with their regulators.
+        """
+        cone = ConeOfInfluence.get_ancestors(network, observed)
+        pruned = set(network.get_nodes()) - cone
+        if keep_cycles:
+            _, cyclic = ConeOfInfluence.peel(network, pruned,
+                                             network.get_regulators())
+            targets = {node_id: set(network.get_out_edges(node_id))
+                       for node_id in cyclic}
+            _, cyclic = ConeOfInfluence.peel(network, cyclic, targets)
+            cone |= ConeOfInfluence.get_ancestors(network, cyclic)
+            pruned -= cone
+        # Time series fill in labels in time order, so pruned nodes on
+        # cycles simply follow the others
+        order, cyclic = ConeOfInfluence.peel(network, pruned,
+                                             network.get_regulators())
+        order.extend(sorted(cyclic, key=network.get_node_index))
+        return cone, order
+
+    @staticmethod
+    def reduce(network: Network) -> Optional["ConeOfInfluence"]:
+        """
+        Computes the cone of influence of the observations of a network.
+        Returns None if no node or every node can be pruned, if some updater relates the
+        labels of nodes that do not regulate each other, if the model or
+        observations are not a set of facts or if the labelings are repaired.
+        """
+        # The labels of the pruned nodes are fixed by complete, which merges
+        # the labelings that differ only on them, but a repair may add an
+        # edge from any node and needs every optimal labeling
+        if not configuration['check_consistency']:
+            return None
+        if not all(updater.is_decomposable()
+                   for updater in network.get_updaters()):
+            return None
+        facts = Updater.get_network_facts(network)
+        if facts is None:
+            return None
+        model_facts, observation_facts = facts
+
+        observed = set()
+        profiles = set()
+        time_series = set()
+        for fact in model_facts + observation_facts:
+            if fact.name == 'exp' and len(fact.arguments) == 1:
+                profiles.add(fact.arguments[0])
+            elif fact.name == 'obs_vlabel' and len(fact.arguments) >= 3:
+                observed.add(str(fact.arguments[-2]))
+                if len(fact.arguments) == 4:
+                    time_series.add(fact.arguments[0])
+        cone, order = ConeOfInfluence.get_cone(
+            network, observed, bool(profiles - time_series))
+        if not order or not cone:
+            return None
+
+        nodes = network.get_nodes()
+        model = [fact for fact in model_facts
+                 if all(str(argument) in cone for argument in fact.arguments
+                        if str(argument) in nodes)]
+        return ConeOfInfluence(network, cone, order,
+                               {str(profile) for profile in time_series},
+                               model, observation_facts)
+
+    @staticmethod
+    def check_consistency(network: Network) -> Tuple[List[Inconsistency_Solution], int]:
+        """
+        Checks the consistency of the cone of influence of the network, as
+        Updater.check_consistency does for the whole network, falling back
+        to it when no node can be pruned.
+        """
+        try:
+            cone = ConeOfInfluence.reduce(network)
+        except RuntimeError as e:
+            print(f'Failed to check consistency: {e}')
+            sys.exit(-1)
+        if cone is None:
+            return Updater.check_consistency(network)
+        return cone.check()
+
+    def check(self) -> Tuple[List[Inconsistency_Solution], int]:
+        """
+        Grounds and solves the sub-model of the cone and returns its optimal
+        labelings, completed with the labels of the pruned nodes, and their
+        optimization value.
+        """
+        from asp_helper import ASPHelper
+        result = []
+        optimization = -2
+        try:
+            self.print_reduction()
+            ctl = Updater.create_control(self.network, self.model_facts)
+            ASPHelper.add_facts(ctl, self.observation_facts)
+            ground_time = Updater.ground(ctl)
+            result, optimization = Updater.solve_consistency(ctl)
+            if configuration['solver_statistics']:
+                statistics = Updater.get_statistics(ctl, self.network,
+                                                    ground_time)
+                statistics['cone'] = len(self.nodes)
+                statistics['pruned'] = len(self.order)
+                Updater.print_statistics(statistics)
+        except Exception as e:
+            print(f'Failed to check consistency: {e}')
+            sys.exit(-1)
+        for labeling in result:
+            self.complete(labeling)
+        return result, optimization
+
+    def print_reduction(self) -> None:
+        """
+        Prints the size of the cone of influence on stderr.
+        """
+        print(f'Cone of influence: {len(self.nodes)} of '
+              f'{len(self.nodes) + len(self.order)} nodes grounded, '
+              f'{len(self.order)} pruned', file=sys.stderr)
+
+    def get_label(self, node_id: str, time_map: Dict[str, int]) -> int:
+        """
+        Returns the value of the function of a pruned node for the labels of
+        its regulators (0 for inputs).
+        """
+        function = self.network.get_node(node_id).get_function()
+        if not function.get_n_clauses():
+            return 0
+        return int(function.evaluate(self.network, time_map))
+
+    def complete(self, labeling: Inconsistency_Solution) -> None:
+        """
+        Adds the labels of the pruned nodes to a labeling of the cone. In a
+        steady state each node takes the value of its function; in a time
+        series every node is 0 at the first time point and then takes the
+        value of its function at the previous time point.
+        """
+        for profile, profile_map in labeling.get_v_label().items():
+            if profile not in self.time_series:
+                for time_map in profile_map.values():
+                    for node_id in self.order:
+                        time_map[node_id] = self.get_label(node_id, time_map)
+                continue
+            previous = None
+            for time in sorted(profile_map):
+                time_map = profile_map[time]
+                labels = {node_id: self.get_label(node_id, previous)
+                          if previous is not None else 0
+                          for node_id in self.order}
+                time_map.update(labels)
+                previous = time_map
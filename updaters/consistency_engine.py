@@ -0,0 +1,144 @@
+"""
+This module contains the ConsistencyEngine class, which checks a model against
+several observation sets while grounding the model and the update rules only
+once for all sets when they are steady states.
+"""
+
+import sys
+from typing import Iterable, List, Optional, Tuple
+import clingo
+from network.network import Network
+from updaters.updater import Updater
+from configuration import configuration
+
+
+class ConsistencyEngine:
+    """
+    Multi-shot consistency checker. With steady-state updaters only, the
+    facts of every observation set are added to a single clingo control
+    guarded by an external atom obs_set("name"), so the base rules, update
+    rules, model and all observation sets are grounded together once. Each
+    check then only switches the externals so that a single observation set
+    is active and solves again, which gives the same optimal labelings as
+    checking the set on its own with Updater.check_consistency.
+    With time series updaters, each check grounds its set in a control of
+    its own instead, as Updater.check_consistency does: their
+    topologicalerror/1 and incT/3 rules join pairs of profiles, so a shared
+    control would pair the profiles of every set, and most of their
+    grounding depends on the observations anyway.
+    """
+
+    def __init__(self, network: Network) -> None:
+        """
+        Initializes an engine for a parsed network and its updaters.
+        """
+        self.network = network
+        self.observations = {}  # {'name': [obs_vlabel(p1,0,a,1), ...]} of the sets of the shared control
+        self.sources = {}  # {'name': (files, facts)} as given to add_observations
+        self.shared = all(updater.__class__.__name__ == 'SteadyStateUpdater'
+                          for updater in network.get_updaters())
+        self.ctl = None  # Grounded shared control, rebuilt after new sets are added
+        self.n_groundings = 0
+        self.ground_time = 0.0  # Seconds spent in the last grounding
+
+    def add_observations(self, name: str, files: Iterable[str] = (),
+                         facts=()) -> None:
+        """
+        Adds an observation set made of observation files and/or in-memory
+        facts (program text, clingo symbols or (name, argument, ...)
+        tuples). Adding a set after a check requires grounding the shared
+        control again on the next check.
+        Raises ValueError if a set of the shared control is not a set of
+        facts.
+        """
+        from asp_helper import ASPHelper
+
+        files = list(files)
+        facts = ASPHelper.normalize_facts(facts)
+        if self.shared:
+            symbols = Updater.ground_facts(files, facts)
+            if symbols is None:
+                raise ValueError(f'Observation set {name} is not a set of facts')
+            self.observations[name] = symbols
+            self.ctl = None
+        self.sources[name] = files, facts
+
+    def get_observation_names(self) -> List[str]:
+        """
+        Returns the names of the observation sets in insertion order.
+        """
+        return list(self.sources)
+
+    def get_n_groundings(self) -> int:
+        """
+        Returns how many times a program was grounded.
+        """
+        return self.n_groundings
+
+    @staticmethod
+    def get_guard(name: str) -> clingo.Symbol:
+        """
+        Returns the external atom guarding an observation set.
+        """
+        return clingo.Function('obs_set', [clingo.String(name)])
+
+    def ground(self, name: Optional[str] = None) -> clingo.Control:
+        """
+        Grounds the base rules, update rules and model with every
+        observation set guarded and inactive in the shared control, or with
+        the files and facts of the set of the given name in a new control,
+        and returns the control.
+        """
+        ctl = Updater.create_control(self.network)
+        if name is None:
+            with ctl.backend() as backend:
+                for other, symbols in self.observations.items():
+                    guard = backend.add_atom(ConsistencyEngine.get_guard(other))
+                    backend.add_external(guard, clingo.TruthValue.False_)
+                    for symbol in symbols:
+                        backend.add_rule([backend.add_atom(symbol)], [guard])
+            self.ctl = ctl
+        else:
+            from asp_helper import ASPHelper
+
+            files, facts = self.sources[name]
+            for file_name in files:
+                ctl.load(file_name)
+            ASPHelper.add_facts(ctl, facts)
+        self.ground_time = Updater.ground(ctl)
+        self.n_groundings += 1
+        return ctl
+
+    def check_consistency(self, name: str) -> Tuple[List, int]:
+        """
+        Checks the model against the observation set with the given name and
+        returns its optimal labelings and optimization value, as
+        Updater.check_consistency does.
+        """
+        if name not in self.sources:
+            raise ValueError(f'Unknown observation set: {name}')
+        result = []
+        optimization = -2
+        try:
+            ground_time = 0.0
+            if not self.shared:
+                ctl = self.ground(name)
+                ground_time = self.ground_time
+            else:
+                if self.ctl is None:
+                    self.ground()
+                    ground_time = self.ground_time
+                ctl = self.ctl
+                for other in self.observations:
+                    ctl.assign_external(ConsistencyEngine.get_guard(other),
+                                        other == name)
+            result, optimization = Updater.solve_consistency(ctl)
+            if configuration['solver_statistics']:
+                statistics = Updater.get_statistics(ctl, self.network,
+                                                    ground_time)
+                statistics['observations'] = [name]
+                Updater.print_statistics(statistics)
+        except Exception as e:
+            print(f'Failed to check consistency: {e}')
+            sys.exit(-1)
+        return result, optimization
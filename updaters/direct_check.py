@@ -0,0 +1,187 @@
+"""
+This module contains the DirectCheck class, which decides the consistency of
+fully observed steady-state and synchronous observations by evaluating the
+functions of the nodes, without grounding a consistency check.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from network.network import Network
+from network.function import Function
+from network.observation_table import Observation_Table
+from network.inconsistency_solution import Inconsistency_Solution
+from updaters.updater import Updater
+from configuration import configuration, Inconsistencies
+
+
+class DirectCheck:
+    """
+    Consistency check of observations where every node is observed at every
+    time point. The only labeling is then the observations themselves, so
+    the optimal repairs follow from evaluating each function over the
+    observed states, as the steady-state and synchronous updaters do when
+    repairing: a node is generalized (particularized) if its function is 0
+    (1) where the next or steady label is 1 (0), unless, in time series, two
+    transitions with the same regulator labels lead to different labels of
+    the node, which is a topological error. Observations that leave this
+    ambiguous (other updaters, missing or invalid observations, or inputs
+    changing value in a time series) are left to the clingo check.
+    """
+
+    @staticmethod
+    def load_observations(network: Network) -> Optional[Observation_Table]:
+        """
+        Reads the observations of the network into a table. Returns None if
+        some observation cannot be read from text or contradicts another,
+        if the observed and declared profiles differ or if some profile is
+        not complete.
+        """
+        table = Observation_Table(network)
+        for observation_file in network.get_observation_files():
+            table.load(observation_file)
+        for facts in network.get_observation_facts():
+            if not isinstance(facts, str):
+                return None
+            table.load_lines(facts.splitlines())
+        profiles = table.get_profiles()
+        if table.n_invalid or table.n_conflicts or \
+                sorted(profiles) != sorted(table.get_experiments()) or \
+                not all(table.is_complete(profile) for profile in profiles):
+            return None
+        return table
+
+    @staticmethod
+    def get_labeling(table: Observation_Table) -> Inconsistency_Solution:
+        """
+        Returns a labeling holding the observations of every profile.
+        """
+        labeling = Inconsistency_Solution()
+        v_label = labeling.get_v_label()
+        node_names = table.get_node_names()
+        for profile in table.get_profiles():
+            v_label[profile] = {
+                time: dict(zip(node_names, table.get_state(profile, time)))
+                for time in range(table.get_n_times(profile))}
+        return labeling
+
+    @staticmethod
+    def get_topological_profiles(network: Network,
+                                 labeling: Inconsistency_Solution,
+                                 function: Function,
+                                 profiles: List[str]) -> List[str]:
+        """
+        Returns the time series profiles with a transition whose regulator
+        labels lead to a different label of the node in another transition.
+        """
+        node_id = function.get_node_id()
+        regulators = function.get_regulators()
+        outcomes = {}  # {(regulator labels): {next label: [profiles]}}
+        for profile in profiles:
+            profile_map = labeling.get_v_label()[profile]
+            for time in range(len(profile_map) - 1):
+                state = tuple(profile_map[time][regulator]
+                              for regulator in regulators)
+                outcomes.setdefault(state, {}).setdefault(
+                    profile_map[time + 1][node_id], []).append(profile)
+        inconsistent = set()
+        for outcome in outcomes.values():
+            if len(outcome) > 1:
+                for outcome_profiles in outcome.values():
+                    inconsistent.update(outcome_profiles)
+        return [profile for profile in profiles if profile in inconsistent]
+
+    @staticmethod
+    def check_node(network: Network, labeling: Inconsistency_Solution,
+                   node_id: str, updaters: Dict[str, Updater],
+                   steady_states: List[str],
+                   time_series: List[str]) -> Optional[Dict[str, int]]:
+        """
+        Adds the repairs of a node to the labeling and returns its
+        inconsistency by profile, or None if they are ambiguous. The
+        updaters are given by class name.
+        """
+        node = network.get_node(node_id)
+        function = node.get_function() if node.has_function() else None
+        if function is None or not function.get_n_clauses():
+            # Inputs keep their label in time series
+            for profile in time_series:
+                if len(set(time_map[node_id] for time_map in
+                           labeling.get_v_label()[profile].values())) > 1:
+                    return None
+            return {}
+        if any(network.find_edge(regulator, node_id) is None
+               for regulator in function.get_regulators()):
+            return None
+
+        inconsistencies = {}
+        for profile in steady_states:
+            updater = updaters['SteadyStateUpdater']
+            inconsistencies[profile] = \
+                updater.n_func_inconsistent_with_label_with_profile(
+                    network, labeling, function, profile)
+        topological = DirectCheck.get_topological_profiles(
+            network, labeling, function, time_series)
+        if topological:
+            labeling.add_topological_error(node_id)
+            for profile in topological:
+                inconsistencies[profile] = Inconsistencies.DOUBLE_INC.value
+        else:
+            updater = updaters.get('SyncUpdater')
+            for profile in time_series:
+                inconsistencies[profile] = \
+                    updater.n_func_inconsistent_with_label_with_profile(
+                        network, labeling, function, profile)
+        for profile, inconsistency in inconsistencies.items():
+            if profile in topological:
+                continue
+            if inconsistency in (Inconsistencies.SINGLE_INC_GEN.value,
+                                 Inconsistencies.DOUBLE_INC.value):
+                labeling.add_generalization(node_id)
+            if inconsistency in (Inconsistencies.SINGLE_INC_PART.value,
+                                 Inconsistencies.DOUBLE_INC.value):
+                labeling.add_particularization(node_id)
+        return inconsistencies
+
+    @staticmethod
+    def check_consistency(network: Network) \
+            -> Optional[Tuple[List[Inconsistency_Solution], int]]:
+        """
+        Returns the optimal labeling and optimization value of the network,
+        as Updater.check_consistency does, or None if the observations are
+        not fully specified steady states and synchronous time series.
+        """
+        # Updaters are compared by name, as they may be loaded from their
+        # files at run time
+        updaters = {updater.__class__.__name__: updater
+                    for updater in network.get_updaters()}
+        if not updaters or \
+                not set(updaters) <= {'SteadyStateUpdater', 'SyncUpdater'}:
+            return None
+        table = DirectCheck.load_observations(network)
+        if table is None:
+            return None
+        steady_states = [profile for profile in table.get_profiles()
+                         if table.is_steady_state(profile)]
+        time_series = [profile for profile in table.get_profiles()
+                       if not table.is_steady_state(profile)]
+        if steady_states and 'SteadyStateUpdater' not in updaters or \
+                time_series and 'SyncUpdater' not in updaters:
+            return None
+
+        labeling = DirectCheck.get_labeling(table)
+        for node_id in network.get_node_names():
+            inconsistencies = DirectCheck.check_node(
+                network, labeling, node_id, updaters, steady_states,
+                time_series)
+            if inconsistencies is None:
+                return None
+            if configuration['check_consistency']:
+                for profile, inconsistency in inconsistencies.items():
+                    if inconsistency != Inconsistencies.CONSISTENT.value:
+                        labeling.add_inconsistent_profile(profile, node_id)
+        if configuration['solver_statistics']:
+            Updater.print_statistics({
+                'updaters': [updater.__class__.__name__
+                             for updater in network.get_updaters()],
+                'observations': network.get_observation_files(),
+                'direct_check': True})
+        return [labeling], len(labeling.get_i_nodes())
@@ -17,6 +17,14 @@ class SteadyStateUpdater(Updater):
     consistent updates in a steady-state system.
     """
 
+    @staticmethod
+    def is_decomposable() -> bool:
+        """
+        Every node is updated from its own regulators, so independent parts
+        of the network can be checked separately.
+        """
+        return True
+
     @staticmethod
     def apply_update_rules(ctl: clingo.Control, updater) -> None:
         """
@@ -69,12 +77,11 @@ class SteadyStateUpdater(Updater):
         n_clauses = function.get_n_clauses()
 
         if n_clauses:
-            # Evaluate each clause until one is satisfiable.
-            for clause in function.get_clauses():
-                if Updater.is_clause_satisfiable(clause, network, time_map, function):
-                    # In steady state, a satisfied clause means the function’s output should be 1.
-                    found_sat = True
-                    return time_map[function.get_node_id()] == 1
+            # The function is satisfied if any of its clauses is.
+            if function.evaluate(network, time_map):
+                # In steady state, a satisfied clause means the function’s output should be 1.
+                found_sat = True
+                return time_map[function.get_node_id()] == 1
         if not found_sat:
             return n_clauses == 0 or time_map[function.get_node_id()] == 0
         return True
@@ -164,12 +171,11 @@ class SteadyStateUpdater(Updater):
         n_clauses = function.get_n_clauses()
 
         if n_clauses:
-            for clause in function.get_clauses():
-                if Updater.is_clause_satisfiable(clause, network, time_map, function):
-                    found_sat = True
-                    if time_map[function.get_node_id()] == 1:
-                        return Inconsistencies.CONSISTENT.value
-                    return Inconsistencies.SINGLE_INC_PART.value
+            if function.evaluate(network, time_map):
+                found_sat = True
+                if time_map[function.get_node_id()] == 1:
+                    return Inconsistencies.CONSISTENT.value
+                return Inconsistencies.SINGLE_INC_PART.value
         if not found_sat:
             if n_clauses == 0:
                 return Inconsistencies.CONSISTENT.value
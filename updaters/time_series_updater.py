@@ -56,6 +56,38 @@ class TimeSeriesUpdater(Updater):
             ctl.add('base', [], '#show inc/2.')
         updater.add_specific_rules(ctl)
 
+    @staticmethod
+    def add_topological_error_rules(ctl: clingo.Control,
+                                    transition: str) -> str:
+        """
+        Adds the grouped topologicalerror/1 (and incT/3) rules when
+        configured, and returns the guard that the pairwise rules of the
+        updater must add to their bodies (empty if they define every node).
+        A node V is topologically inconsistent when two of its transitions,
+        given by the body transition over P, T and V, have the same
+        regulator labels at T but different labels of V at T+1. The grouped
+        rules encode the regulator labels of each transition as an integer,
+        one regulator at a time, and compare labels of V within each code,
+        growing linearly with the number of time points (times 2^K for a
+        node with K regulators). Nodes with more regulator states than
+        transitions keep the pairwise rules, which are smaller for them.
+        """
+        if configuration['topological_encoding'] != 'grouped':
+            return ''
+        ctl.add('base', [], 'topreg(V,V1) :- functionAnd(V,_,V1).')
+        ctl.add('base', [], 'topreg(V,V1,I) :- topreg(V,V1), I = #count{V2 : topreg(V,V2), V2 < V1}.')
+        ctl.add('base', [], 'topnreg(V,K) :- vertex(V), functionOr(V,_), K = #count{V1 : topreg(V,V1)}.')
+        ctl.add('base', [], 'topntransitions(N) :- N = #count{P,T : time(P,T), time(P,T+1)}.')
+        ctl.add('base', [], 'topgrouped(V) :- topnreg(V,K), topntransitions(N), K < 30, 2**K <= N.')
+        ctl.add('base', [], 'toppairwise(V) :- vertex(V), not topgrouped(V).')
+        ctl.add('base', [], f'topstate(P,T,V,0,0) :- topgrouped(V), {transition}.')
+        ctl.add('base', [], 'topstate(P,T,V,I+1,C+S*2**I) :- topstate(P,T,V,I,C), topreg(V,V1,I), vlabel(P,T,V1,S).')
+        ctl.add('base', [], 'topseen(P,V,C,S) :- topstate(P,T,V,K,C), topnreg(V,K), vlabel(P,T+1,V,S).')
+        ctl.add('base', [], 'topologicalerror(V) :- topseen(_,V,C,0), topseen(_,V,C,1).')
+        if configuration['check_consistency']:
+            ctl.add('base', [], 'incT(P1,P2,V) :- topseen(P1,V,C,S1), topseen(P2,V,C,S2), S1 != S2, P1 <= P2.')
+        return 'toppairwise(V), '
+
     @staticmethod
     def should_update(
             time: int,
@@ -6,14 +6,25 @@ the configuration.
 """
 
 import sys
+import json
+import time
+import queue
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 import clingo
 from network.network import Network
 from network.function import Function
 from network.inconsistency_solution import Inconsistency_Solution
 from configuration import configuration
 
+# clingo options of the consistency check set through the configuration
+SOLVER_OPTIONS = {
+    'solver_parallel_mode': '--parallel-mode',
+    'solver_configuration': '--configuration',
+    'solver_opt_strategy': '--opt-strategy'
+}
+
 
 class Updater(ABC):
     """
@@ -60,6 +71,17 @@ class Updater(ABC):
         inconsistency) based on the profile.
         """
 
+    @staticmethod
+    def is_decomposable() -> bool:
+        """
+        Returns whether the update rules only relate the labels of a node to
+        those of its regulators, so that the weakly connected components of
+        a network can be checked independently and nodes that do not
+        regulate any observed node can be left out. Updaters that choose
+        which nodes update across the whole network return False.
+        """
+        return False
+
     @staticmethod
     def check_consistency(network: Network) -> Tuple[List, int]:
         """
@@ -71,43 +93,334 @@ class Updater(ABC):
         result = []
         optimization = -2
         try:
-            def logger(warning_code, message):
-                if configuration['debug']:
-                    print(warning_code, file=sys.stderr)
-                    print(message, file=sys.stderr)
-            ctl = clingo.Control(['--opt-mode=optN'], logger, 20)
-            ctl.add('base', [], 'sign(0;1).')
-            ctl.add('base', [], 'complement(T,S) :- sign(S),sign(T),T!=S.')
-            ctl.add('base', [], 'vertex(V) :- edge(V,_,_).')
-            ctl.add('base', [], 'vertex(V) :- edge(_,V,_).')
-            ctl.add('base', [], '{r_gen(V)} :- vertex(V), not fixed(V).')
-            ctl.add('base', [], '{r_part(V)} :- vertex(V), not fixed(V).')
-            ctl.add('base', [], 'repair(V) :- r_gen(V).')
-            ctl.add('base', [], 'repair(V) :- r_part(V).')
-            ctl.add('base', [], '#show repair/1.')
-            ctl.add('base', [], '#show r_gen/1.')
-            ctl.add('base', [], '#show r_part/1.')
-            for updater in network.get_updaters():
-                updater.apply_update_rules(ctl, updater)
-            ctl.load(network.get_input_file_network())
+            from asp_helper import ASPHelper
+            ctl = Updater.create_control(network)
+            for obs_file in network.get_observation_files():
+                ctl.load(obs_file)
+            ASPHelper.add_facts(ctl, network.get_observation_facts())
+            ground_time = Updater.ground(ctl)
+            result, optimization = Updater.solve_consistency(ctl)
+            if configuration['solver_statistics']:
+                Updater.print_statistics(
+                    Updater.get_statistics(ctl, network, ground_time))
+        except Exception as e:
+            print(f'Failed to check consistency: {e}')
+            sys.exit(-1)
+        return result, optimization
+
+    @staticmethod
+    def stream_consistency(
+            network: Network,
+            consume: Callable[[Inconsistency_Solution, int], bool],
+            queue_size: int) -> int:
+        """
+        Checks the consistency of the network like check_consistency, but
+        hands each optimal labeling to consume(labeling, optimization) as
+        soon as it is proven optimal, while clingo keeps enumerating in the
+        background. At most queue_size parsed labelings wait to be consumed;
+        the solver pauses when the queue is full. Solving stops as soon as
+        consume returns False. Returns the optimization value (-1 if
+        unsatisfiable). Errors raised by consume are propagated.
+        """
+        from asp_helper import ASPHelper
+        labelings = queue.Queue(max(1, queue_size))
+        stop = threading.Event()
+        finished = object()
+
+        def on_model(model: clingo.Model) -> bool:
+            if stop.is_set():
+                return False
+            if model.optimality_proven:
+                labelings.put(ASPHelper.parse_cc_model(model))
+            return True
+
+        def on_finish(result: clingo.SolveResult) -> None:
+            labelings.put((finished, result.satisfiable))
+
+        optimization = -2
+        try:
+            ctl = Updater.create_control(network)
             for obs_file in network.get_observation_files():
                 ctl.load(obs_file)
-            ctl.ground([('base', [])])
-            with ctl.solve(yield_=True) as handle:
-                if handle.get().satisfiable:
-                    for model in handle:
-                        if model and model.optimality_proven:
-                            from asp_helper import ASPHelper
-                            res, opt = ASPHelper.parse_cc_model(model)
-                            result.append(res)
-                            optimization = opt
-                else:
-                    optimization = -1
+            ASPHelper.add_facts(ctl, network.get_observation_facts())
+            ground_time = Updater.ground(ctl)
+            handle = ctl.solve(on_model=on_model, on_finish=on_finish,
+                               async_=True)
         except Exception as e:
             print(f'Failed to check consistency: {e}')
             sys.exit(-1)
+        with handle:
+            item = labelings.get()
+            try:
+                while item[0] is not finished:
+                    optimization = item[1]
+                    if not stop.is_set() and not consume(*item):
+                        stop.set()
+                    item = labelings.get()
+            finally:
+                # Unblock the solver until it reports the end of solving
+                stop.set()
+                while item[0] is not finished:
+                    item = labelings.get()
+            if not item[1] and optimization == -2:
+                optimization = -1
+        if configuration['solver_statistics']:
+            Updater.print_statistics(
+                Updater.get_statistics(ctl, network, ground_time))
+        return optimization
+
+    @staticmethod
+    def create_control(network: Network,
+                       model_facts: List = None) -> clingo.Control:
+        """
+        Creates a clingo control holding the base rules, the update rules of
+        every updater of the network and the model (or the given model
+        facts), ready for the observations to be added and grounded.
+        """
+        ctl = clingo.Control(Updater.get_solver_arguments(),
+                             Updater.log_clingo_message, 20)
+        ctl.add('base', [], 'sign(0;1).')
+        ctl.add('base', [], 'complement(T,S) :- sign(S),sign(T),T!=S.')
+        ctl.add('base', [], 'vertex(V) :- edge(V,_,_).')
+        ctl.add('base', [], 'vertex(V) :- edge(_,V,_).')
+        ctl.add('base', [], '{r_gen(V)} :- vertex(V), not fixed(V).')
+        ctl.add('base', [], '{r_part(V)} :- vertex(V), not fixed(V).')
+        ctl.add('base', [], 'repair(V) :- r_gen(V).')
+        ctl.add('base', [], 'repair(V) :- r_part(V).')
+        ctl.add('base', [], '#show repair/1.')
+        ctl.add('base', [], '#show r_gen/1.')
+        ctl.add('base', [], '#show r_part/1.')
+        for updater in network.get_updaters():
+            updater.apply_update_rules(ctl, updater)
+        if model_facts is None:
+            model_facts = network.get_model_facts()
+        if model_facts:
+            from asp_helper import ASPHelper
+            ASPHelper.add_facts(ctl, model_facts)
+        else:
+            ctl.load(network.get_input_file_network())
+        return ctl
+
+    @staticmethod
+    def ground_facts(files: Iterable[str] = (),
+                     facts=()) -> Optional[List[clingo.Symbol]]:
+        """
+        Returns the facts of the given files and in-memory facts as clingo
+        symbols, or None if they are not a set of facts.
+        """
+        from asp_helper import ASPHelper
+
+        ctl = clingo.Control(['--warn=none'], Updater.log_clingo_message, 20)
+        for file_name in files:
+            ctl.load(file_name)
+        ASPHelper.add_facts(ctl, facts)
+        ctl.ground([('base', [])])
+        symbols = []
+        for atom in ctl.symbolic_atoms:
+            if not atom.is_fact:
+                return None
+            symbols.append(atom.symbol)
+        return symbols
+
+    @staticmethod
+    def get_network_facts(network: Network) \
+            -> Optional[Tuple[List[clingo.Symbol], List[clingo.Symbol]]]:
+        """
+        Returns the model facts and the observation facts of a network as
+        clingo symbols, or None if either is not a set of facts.
+        """
+        model_facts = network.get_model_facts()
+        if not model_facts or \
+                not all(isinstance(fact, clingo.Symbol) for fact in model_facts):
+            model_facts = Updater.ground_facts(
+                [network.get_input_file_network()]
+                if not model_facts else (), model_facts)
+        observation_facts = Updater.ground_facts(
+            network.get_observation_files(), network.get_observation_facts())
+        if model_facts is None or observation_facts is None:
+            return None
+        return model_facts, observation_facts
+
+    @staticmethod
+    def ground(ctl: clingo.Control) -> float:
+        """
+        Grounds the base program of a control and returns the grounding time
+        in seconds.
+        """
+        start = time.perf_counter()
+        ctl.ground([('base', [])])
+        return time.perf_counter() - start
+
+    @staticmethod
+    def get_statistics(ctl: clingo.Control, network: Network,
+                       ground_time: float) -> Dict:
+        """
+        Returns the grounder and solver statistics of the last consistency
+        check solved by a control, tagged with the updaters and observations
+        of the network.
+        """
+        statistics = ctl.statistics
+        lp = statistics['problem']['lp']
+        generator = statistics['problem']['generator']
+        solvers = statistics['solving']['solvers']
+        summary = statistics['summary']
+        models = summary['models']
+        return {
+            'updaters': [updater.__class__.__name__
+                         for updater in network.get_updaters()],
+            'observations': network.get_observation_files(),
+            'ground': {
+                'time': ground_time,
+                'atoms': int(lp['atoms']),
+                'bodies': int(lp['bodies']),
+                'rules': int(lp['rules']),
+                'variables': int(generator['vars']),
+                'constraints': int(generator['constraints'])
+            },
+            'solve': {
+                'time': summary['times']['solve'],
+                'cpu_time': summary['times']['cpu'],
+                'models': int(models['enumerated']),
+                'optimal_models': int(models['optimal']),
+                'optimization_steps': int(models['enumerated'] -
+                                          models['optimal']),
+                'choices': int(solvers['choices']),
+                'conflicts': int(solvers['conflicts']),
+                'restarts': int(solvers['restarts']),
+                'costs': [int(cost) for cost in summary['costs']]
+            }
+        }
+
+    @staticmethod
+    def print_statistics(statistics: Dict) -> None:
+        """
+        Prints the statistics of a consistency check as one line of JSON on
+        the standard error, keeping the standard output parsable.
+        """
+        print(json.dumps(statistics), file=sys.stderr)
+
+    @staticmethod
+    def get_solver_argument(key: str, value: str) -> str:
+        """
+        Returns the clingo command-line argument of a solver configuration
+        entry.
+        """
+        return f'{SOLVER_OPTIONS[key]}={value}'
+
+    @staticmethod
+    def log_clingo_message(warning_code: clingo.MessageCode,
+                           message: str) -> None:
+        """
+        Logger of the clingo controls: prints clingo messages on the standard
+        error in debug mode only.
+        """
+        if configuration['debug']:
+            print(warning_code, file=sys.stderr)
+            print(message, file=sys.stderr)
+
+    @staticmethod
+    def get_solver_arguments() -> List[str]:
+        """
+        Returns the clingo command-line arguments of the consistency check:
+        optimal model enumeration plus the configured threads, preset and
+        optimization strategy.
+        """
+        arguments = ['--opt-mode=optN']
+        for key in SOLVER_OPTIONS:
+            if configuration[key]:
+                arguments.append(Updater.get_solver_argument(
+                    key, configuration[key]))
+        return arguments
+
+    @staticmethod
+    def is_valid_solver_argument(argument: str) -> bool:
+        """
+        Returns whether clingo accepts a command-line argument.
+        """
+        try:
+            clingo.Control([argument], lambda code, message: None)
+        except RuntimeError:
+            return False
+        return True
+
+    @staticmethod
+    def solve_consistency(ctl: clingo.Control) -> Tuple[List, int]:
+        """
+        Solves a grounded consistency check and returns its optimal
+        labelings and optimization value (-1 if unsatisfiable). Unless
+        repeated labelings are skipped, enumeration stops after
+        max_labelings optimal labelings.
+        """
+        if configuration['solver_time_limit'] > 0:
+            return Updater.solve_consistency_anytime(
+                ctl, configuration['solver_time_limit'])
+        from asp_helper import ASPHelper
+        result = []
+        optimization = -2
+        max_labelings = 0 if configuration['dedupe_labelings'] \
+            else configuration['max_labelings']
+        with ctl.solve(yield_=True) as handle:
+            if handle.get().satisfiable:
+                for model in handle:
+                    if model and model.optimality_proven:
+                        res, opt = ASPHelper.parse_cc_model(model)
+                        result.append(res)
+                        optimization = opt
+                        if len(result) == max_labelings:
+                            break
+            else:
+                optimization = -1
         return result, optimization
 
+    @staticmethod
+    def solve_consistency_anytime(ctl: clingo.Control,
+                                  time_limit: float) -> Tuple[List, int]:
+        """
+        Solves a grounded consistency check in the background for at most
+        time_limit seconds. If the limit is reached before optimality is
+        proven, the search is cancelled and the labelings of the best cost
+        found so far are returned, marked as not proven optimal, with their
+        optimization value (-2 if no labeling was found), and a warning is
+        printed on the standard error so that the output stays parseable.
+        """
+        from asp_helper import ASPHelper
+        proven = []
+        best = []
+        best_cost = []
+
+        def on_model(model: clingo.Model) -> None:
+            res, opt = ASPHelper.parse_cc_model(model)
+            if model.optimality_proven:
+                proven.append((res, opt))
+                return
+            if not best_cost or model.cost < best_cost[0]:
+                best.clear()
+                best_cost[:] = [model.cost]
+            if model.cost == best_cost[0]:
+                best.append((res, opt))
+
+        with ctl.solve(on_model=on_model, async_=True) as handle:
+            finished = handle.wait(time_limit)
+            if not finished:
+                handle.cancel()
+            satisfiable = handle.get().satisfiable
+        if finished and not satisfiable:
+            return [], -1
+        if proven:
+            if not finished:
+                print(f'WARN!\tTime limit of {time_limit}s reached while enumerating optimal labelings. Using the {len(proven)} found.',
+                      file=sys.stderr)
+            return [res for res, _ in proven], proven[-1][1]
+        if not best:
+            print(f'WARN!\tTime limit of {time_limit}s reached before any labeling was found.',
+                  file=sys.stderr)
+            return [], -2
+        print(f'WARN!\tTime limit of {time_limit}s reached before proving optimality. Using the best labelings found (cost {best_cost[0]}).',
+              file=sys.stderr)
+        for res, _ in best:
+            res.set_optimality_proven(False)
+        return [res for res, _ in best], best[-1][1]
+
     @staticmethod
     def is_clause_satisfiable(
             clause,
@@ -119,7 +432,7 @@ class Updater(ABC):
         """
         regulators = function.bitarray_to_regulators(clause)
         for var in regulators:
-            edge = network.get_edge(var, function.get_node_id())
+            edge = network.find_edge(var, function.get_node_id())
             if edge is not None:
                 # The clause is unsatisfied if the edge sign contradicts the value in time_map.
                 if (edge.get_sign() > 0) == (time_map[var] == 0):